@@ -14,13 +14,21 @@ Examples:
         >>>
         >>> to_decimal('$123.45')
         Decimal('123.45')
+
+Attributes:
+    DT_FORMATS (tuple[str]): Month first `strptime` formats a
+        `DatetimeParser` may learn. Each of these only parses a string if
+        `dateutil` would parse it into the same datetime.
 """
 import itertools as it
+import threading
 import pygogo as gogo
 
 from os import path as p
+from datetime import datetime as dt
 from decimal import Decimal, ROUND_HALF_UP, ROUND_HALF_DOWN
 from io import StringIO
+from codecs import getincrementalencoder
 from json import dumps
 from collections import OrderedDict
 from operator import itemgetter
@@ -41,8 +49,21 @@ try:
 except ImportError:
     pd = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = gogo.Gogo(__name__, monolog=True).logger
 
+DT_FORMATS = tuple(
+    "".join(parts)
+    for parts in it.product(
+        ["%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y"],
+        ["", " %H:%M", " %H:%M:%S", " %H:%M:%S.%f", "T%H:%M:%S", "T%H:%M:%S.%f"],
+    )
+)
+
 
 def ctype2ext(content_type=None):
     """Converts an http content type to a file extension.
@@ -194,11 +215,13 @@ def to_int(content, thousand_sep=",", decimal_sep=".", warn=False, **kwargs):
     Returns:
         int
     """
+    parser = ft.get_numeric_parser(thousand_sep, decimal_sep)
+
     if warn and not ft.is_int(content):
         raise ValueError(f"Invalid int value: `{content}`.")
 
     try:
-        value = int(float(ft.strip(content, thousand_sep, decimal_sep)))
+        value = int(float(parser.strip(content)))
     except ValueError:
         if warn:
             raise ValueError(f"Invalid int value: `{content}`.")
@@ -242,12 +265,16 @@ def to_float(content, thousand_sep=",", decimal_sep=".", warn=False, **kwargs):
     Returns:
         float
     """
-    if ft.is_numeric(content):
-        value = float(ft.strip(content, thousand_sep, decimal_sep))
-    elif warn:
+    # content is validated using the default separators
+    value = ft.get_numeric_parser().parse(content)
+
+    if value is None and warn:
         raise ValueError(f"Invalid float value: `{content}`.")
-    else:
+    elif value is None:
         value = 0.0
+    elif (thousand_sep, decimal_sep) != (",", "."):
+        parser = ft.get_numeric_parser(thousand_sep, decimal_sep)
+        value = float(parser.strip(content))
 
     return value
 
@@ -299,8 +326,10 @@ def to_decimal(content, thousand_sep=",", decimal_sep=".", **kwargs):
     Returns:
         decimal
     """
+    parser = ft.get_numeric_parser(thousand_sep, decimal_sep)
+
     if ft.is_numeric(content):
-        decimalized = Decimal(ft.strip(content, thousand_sep, decimal_sep))
+        decimalized = Decimal(parser.strip(content))
     elif kwargs.get("warn"):
         raise ValueError(f"Invalid numeric value: `{content}`.")
     else:
@@ -371,7 +400,197 @@ def _gen_fixed_datetimes(*args, **kwargs):
             yield value
 
 
-def to_datetime(content, dt_format=None, warn=False, **kwargs):
+def _parse_datetime(content, **kwargs):
+    """Parses strings into datetimes using `dateutil`, and fixes impossible
+    dates, e.g., 2/31/15
+
+    Args:
+        content (str): The string to parse.
+
+    Returns:
+        datetime: The parsed datetime, or `NULL_DATETIME` if content isn't a
+            date.
+
+    Examples:
+        >>> _parse_datetime('2/32/82 12:15')
+        datetime.datetime(1982, 2, 28, 12, 15)
+    """
+    bad_nums = map(str, range(29, 33))
+    good_nums = map(str, range(31, 27, -1))
+
+    try:
+        bad_num = next(x for x in bad_nums if x in content)
+    except StopIteration:
+        options = [content]
+    else:
+        possibilities = (content.replace(bad_num, x) for x in good_nums)
+        options = it.chain([content], possibilities)
+
+    try:
+        value = next(_gen_fixed_datetimes(*options, **kwargs))
+    except StopIteration:
+        value = NULL_DATETIME
+
+    return value
+
+
+class DatetimeParser:
+    """Parses strings into datetimes. Learns the `strptime` format of the
+    first values that `dateutil` parses, and uses it to parse later values.
+    Values the format doesn't match fall back to `dateutil`. Parsed values
+    are memoized. Since it has state, an instance isn't thread-safe, see
+    `meza.convert.get_datetime_parser`.
+
+    Examples:
+        >>> parser = DatetimeParser(sample_size=2)
+        >>> parser.parse('2000-01-02')
+        datetime.datetime(2000, 1, 2, 0, 0)
+        >>> parser.parse('2000-01-03 10:00')
+        datetime.datetime(2000, 1, 3, 10, 0)
+        >>> parser.dt_format
+        '%Y-%m-%d'
+        >>> parser.parse('2000-01-04')
+        datetime.datetime(2000, 1, 4, 0, 0)
+        >>> parser.parse('2/32/82 12:15')
+        datetime.datetime(1982, 2, 28, 12, 15)
+    """
+
+    def __init__(self, sample_size=10, maxsize=4096, **kwargs):
+        """DatetimeParser constructor
+
+        Args:
+            sample_size (int): Number of values to learn the format from
+                (default: 10).
+
+            maxsize (int): Maximum number of memoized values (default: 4096).
+            kwargs (dict): Keyword arguments passed to `dateutil.parser.parse`
+
+        Kwargs:
+            dayfirst (bool): Interpret ambiguous dates as day first
+        """
+        self.sample_size = sample_size
+        self.maxsize = maxsize
+        self.kwargs = kwargs
+        self.dt_format = None
+        self.cache = {}
+        self.samples = 0
+
+        if kwargs.get("dayfirst"):
+            replacements = [("%m", "%M_"), ("%d", "%m"), ("%M_", "%d")]
+            formats = (ft.mreplace(f, replacements) for f in DT_FORMATS)
+        else:
+            formats = DT_FORMATS
+
+        # `dateutil` options other than `dayfirst` may change how a string is
+        # parsed, so only learn formats if there aren't any
+        learn = set(kwargs).issubset({"dayfirst"})
+        self.hits = dict.fromkeys(formats, 0) if learn else {}
+
+    def _learn(self, content, value):
+        """Tallies the formats that parse content into value, and discards
+        those that parse it into anything else."""
+        for dt_format in list(self.hits):
+            try:
+                parsed = dt.strptime(content, dt_format)
+            except ValueError:
+                continue
+
+            if parsed == value:
+                self.hits[dt_format] += 1
+            else:
+                del self.hits[dt_format]
+
+        self.samples += 1
+
+        if self.samples >= self.sample_size and self.hits:
+            dt_format, hits = max(self.hits.items(), key=itemgetter(1))
+            self.dt_format = dt_format if hits else None
+            self.hits = {}
+
+    def _parse(self, content):
+        """Parses content without memoization."""
+        if self.dt_format:
+            try:
+                return dt.strptime(content, self.dt_format)
+            except ValueError:
+                pass
+
+        value = _parse_datetime(content, **self.kwargs)
+
+        if self.hits and value != NULL_DATETIME:
+            self._learn(content, value)
+
+        return value
+
+    def parse(self, content):
+        """Parses a string into a datetime.
+
+        Args:
+            content (str): The string to parse.
+
+        Returns:
+            datetime: The parsed datetime, or `NULL_DATETIME` if content
+                isn't a date.
+
+        Raises:
+            TypeError: if passed a date/time object
+        """
+        if not isinstance(content, str):
+            return _parse_datetime(content, **self.kwargs)
+
+        try:
+            value = self.cache[content]
+        except KeyError:
+            value = self._parse(content)
+
+            if len(self.cache) >= self.maxsize:
+                self.cache.clear()
+
+            self.cache[content] = value
+
+        return value
+
+
+_local = threading.local()
+
+
+def get_datetime_parser(**kwargs):
+    """Gets a datetime parser, cached (per thread) for hashable kwargs
+
+    Args:
+        kwargs (dict): Keyword arguments passed to `dateutil.parser.parse`
+
+    Returns:
+        obj: DatetimeParser instance
+
+    Examples:
+        >>> get_datetime_parser() is get_datetime_parser()
+        True
+        >>> get_datetime_parser(dayfirst=True).parse('5/4/82')
+        datetime.datetime(1982, 4, 5, 0, 0)
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>>
+        >>> with ThreadPoolExecutor(1) as executor:
+        ...     future = executor.submit(get_datetime_parser)
+        ...     future.result() is get_datetime_parser()
+        False
+    """
+    if not hasattr(_local, "datetime_parsers"):
+        _local.datetime_parsers = {}
+
+    try:
+        key = frozenset(kwargs.items())
+        parser = _local.datetime_parsers.get(key)
+    except TypeError:
+        parser = DatetimeParser(**kwargs)
+    else:
+        if parser is None:
+            parser = _local.datetime_parsers[key] = DatetimeParser(**kwargs)
+
+    return parser
+
+
+def to_datetime(content, dt_format=None, warn=False, parser=None, **kwargs):
     """Parses and formats strings into datetimes.
 
     Args:
@@ -383,6 +602,10 @@ def to_datetime(content, dt_format=None, warn=False, **kwargs):
         warn (bool): raise error if content can't be safely converted
             (default: False)
 
+        parser (obj): `DatetimeParser` instance, e.g., one per column
+            (default: an instance shared by the current thread for the given
+            kwargs).
+
     Returns:
         obj: The datetime object or formatted datetime string.
 
@@ -412,21 +635,8 @@ def to_datetime(content, dt_format=None, warn=False, **kwargs):
     Returns:
         datetime
     """
-    bad_nums = map(str, range(29, 33))
-    good_nums = map(str, range(31, 27, -1))
-
-    try:
-        bad_num = next(x for x in bad_nums if x in content)
-    except StopIteration:
-        options = [content]
-    else:
-        possibilities = (content.replace(bad_num, x) for x in good_nums)
-        options = it.chain([content], possibilities)
-
-    try:
-        value = next(_gen_fixed_datetimes(*options, **kwargs))
-    except StopIteration:
-        value = NULL_DATETIME
+    parser = parser or get_datetime_parser(**kwargs)
+    value = parser.parse(content)
 
     if warn and value == NULL_DATETIME:
         raise ValueError(f"Invalid datetime value: `{content}`.")
@@ -506,7 +716,7 @@ def to_time(content, time_format=None, warn=False, **kwargs):
     Returns:
         time
     """
-    value = to_datetime(content, warn=warn).time()
+    value = to_datetime(content, warn=warn, parser=kwargs.get("parser")).time()
     return value.strftime(time_format) if time_format else value
 
 
@@ -656,7 +866,37 @@ def df2records(df):
             yield dict(zip(keys, values[1:]))
 
 
-def records2array(records, types, native=False, silent=False):
+def _merge_batches(batches, ids):
+    """Merges batches of columns into a single batch
+
+    Args:
+        batches (Iter[dict]): Batches of columns whose keys are the field
+            names and whose values are lists of the column's data. E.g.,
+            output from `meza.io.read_csv(..., columnar=True)`.
+
+        ids (Seq[str]): The field names to merge.
+
+    Returns:
+        dict: The merged columns. Missing columns are filled with `None`.
+
+    Examples:
+        >>> batches = [{'a': [1, 2], 'b': [3, 4]}, {'a': [5]}]
+        >>> _merge_batches(batches, ['a', 'b']) == {
+        ...     'a': [1, 2, 5], 'b': [3, 4, None]}
+        True
+    """
+    columns = {id_: [] for id_ in ids}
+
+    for batch in batches:
+        length = max(map(len, batch.values()), default=0)
+
+        for id_, column in columns.items():
+            column.extend(batch.get(id_) or it.repeat(None, length))
+
+    return columns
+
+
+def records2array(records, types, native=False, silent=False, columnar=False):
     """Converts records into either a numpy.recarray or a nested array.array
 
     Args:
@@ -669,6 +909,9 @@ def records2array(records, types, native=False, silent=False):
 
         silent (bool): Suppress the warning message (default: False).
 
+        columnar (bool): `records` are batches of columns, e.g., output from
+            `meza.io.read_csv(..., columnar=True)` (default: False).
+
     Returns:
         numpy.recarray
 
@@ -699,13 +942,22 @@ def records2array(records, types, native=False, silent=False):
         True
         >>> records2array(records, types, native=True) == native_resp
         True
+        >>> batches = [{'alpha': ['aa', 'bee'], 'beta': [2, 3]}]
+        >>> kwargs = {'native': True, 'columnar': True}
+        >>> records2array(batches, types, **kwargs) == native_resp
+        True
     """
     numpy = np and not native
     dialect = "numpy" if numpy else "array"
     zipped = [(ft.get_dtype(t1["type"], dialect), t1["id"]) for t1 in types]
     dtype, ids = list(zip(*zipped))
+    columns = _merge_batches(records, ids) if columnar else None
 
-    if numpy:
+    if numpy and columnar:
+        ndtype = [tuple(z) for z in zip(ids, dtype)]
+        arrays = [np.array(columns[id_], dtype=d) for id_, d in zip(ids, dtype)]
+        converted = np.rec.fromarrays(arrays, dtype=ndtype)
+    elif numpy:
         data = [tuple(r.get(id_) for id_ in ids) for r in records]
         ndtype = [tuple(z) for z in zip(ids, dtype)]
         ndarray = np.array(data, dtype=ndtype)
@@ -720,7 +972,11 @@ def records2array(records, types, native=False, silent=False):
             logger.warning(msg)
 
         header = [array("u", t2["id"]) for t2 in types]
-        data = zip_longest(*([r.get(i) for i in ids] for r in records))
+
+        if columnar:
+            data = (columns[id_] for id_ in ids)
+        else:
+            data = zip_longest(*([r.get(i) for i in ids] for r in records))
 
         # array.array can't have nulls, so convert to an appropriate equivalent
         clean = lambda t, d: (x if x else ft.ARRAY_NULL_TYPE[t] for x in d)
@@ -736,7 +992,7 @@ def records2array(records, types, native=False, silent=False):
     return converted
 
 
-def records2df(records, types, native=False, silent=False):
+def records2df(records, types, native=False, silent=False, columnar=False):
     """Converts records into either a pandas.DataFrame
 
     Args:
@@ -749,6 +1005,9 @@ def records2df(records, types, native=False, silent=False):
 
         silent (bool): Suppress the warning message (default: False).
 
+        columnar (bool): `records` are batches of columns, e.g., output from
+            `meza.io.read_csv(..., columnar=True)` (default: False).
+
     Returns:
         numpy.recarray
 
@@ -788,7 +1047,7 @@ def records2df(records, types, native=False, silent=False):
         True
     """
     if pd and not native:
-        recarray = records2array(records, types)
+        recarray = records2array(records, types, columnar=columnar)
         df = pd.DataFrame.from_records(recarray)
     else:
         if not (native or silent):
@@ -799,24 +1058,92 @@ def records2df(records, types, native=False, silent=False):
 
             logger.warning(msg)
 
-        df = records2array(records, types, native=True, silent=silent)
+        kwargs = {"native": True, "silent": silent, "columnar": columnar}
+        df = records2array(records, types, **kwargs)
 
     return df
 
 
-def records2csv(records, encoding=ENCODING, bom=False, skip_header=False):
+def _iter_string_io(content):
+    """Wraps an iterable of strings in a lazy file like object"""
+    # `meza.io` imports this module (via `meza.process`), so import it late
+    from .io import IterStringIO
+
+    return IterStringIO(content)
+
+
+def gen_csv(records, bom=False, skip_header=False, chunksize=1000):
+    """Converts records into csv text, `chunksize` rows at a time.
+
+    Args:
+        records (Iter[dict]): Rows of data whose keys are the field names.
+            E.g., output from any `meza.io` read function.
+
+        bom (bool): Add Byte order marker (default: False)
+        skip_header (bool): Don't write the header (default: False)
+        chunksize (int): Number of rows per chunk (default: 1000).
+
+    Yields:
+        str: csv text
+
+    See also:
+        `meza.convert.records2csv`
+
+    Examples:
+        >>> records = [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}, {'a': 5, 'b': 6}]
+        >>> list(gen_csv(records, chunksize=2)) == [
+        ...     'a,b\\r\\n1,2\\r\\n3,4\\r\\n', '5,6\\r\\n']
+        True
+    """
+    irecords = iter(records)
+    row = next(irecords, None)
+    f = StringIO()
+
+    if bom:
+        f.write(BOM)
+
+    if row is not None:
+        w = csv.DictWriter(f, list(row.keys()))
+        None if skip_header else w.writeheader()
+        irecords = it.chain([row], irecords)
+
+        for rows in ft.chunk(irecords, chunksize):
+            w.writerows(rows)
+            yield f.getvalue()
+            f.seek(0)
+            f.truncate()
+
+    if f.tell():
+        yield f.getvalue()
+
+
+def records2csv(records, encoding=ENCODING, bom=False, skip_header=False, **kwargs):
     """Converts records into a csv file like object.
 
     Args:
         records (Iter[dict]): Rows of data whose keys are the field names.
             E.g., output from any `meza.io` read function.
 
-        encoding (str): File encoding (default: ENCODING constant)
+        encoding (str): Encoding of the bytes read when `stream` is True
+            (default: ENCODING constant).
+
         bom (bool): Add Byte order marker (default: False)
         skip_header (bool): Don't write the header (default: False)
+        kwargs (dict): Keyword arguments
+
+    Kwargs:
+        stream (bool): Lazily convert the records as the file like object
+            is read, e.g., by `meza.io.write` (default: False).
+
+        chunksize (int): Number of rows to convert at a time when streaming
+            (default: 1000).
 
     Returns:
-        obj: io.StringIO instance
+        obj: io.StringIO instance, or a `meza.io.IterStringIO` instance (which
+            reads bytes) if `stream` is True.
+
+    See also:
+        `meza.convert.gen_csv`
 
     Examples:
         >>> records = [
@@ -833,22 +1160,135 @@ def records2csv(records, encoding=ENCODING, bom=False, skip_header=False):
         ...     'IRVE2', 'Iris-versicolor',
         ...     'wikipedia.org/wiki/Iris_versicolor'}
         True
+        >>> csv_obj = records2csv(iter(records), stream=True)
+        >>> csv_obj.read() == records2csv(records).read().encode()
+        True
+        >>> csv_obj = records2csv(records, 'utf-16', stream=True)
+        >>> csv_obj.read().decode('utf-16') == records2csv(records).read()
+        True
     """
-    f = StringIO()
-    irecords = iter(records)
+    chunksize = kwargs.get("chunksize", 1000)
+    content = gen_csv(records, bom, skip_header, chunksize)
+
+    if kwargs.get("stream"):
+        encoder = getincrementalencoder(encoding)()
+        f = _iter_string_io(map(encoder.encode, content))
+    else:
+        f = StringIO()
+        f.writelines(content)
+        f.seek(0)
 
-    if bom:
-        f.write(BOM.encode(encoding))
-
-    row = next(irecords)
-    w = csv.DictWriter(f, list(row.keys()))
-    None if skip_header else w.writeheader()
-    w.writerow(row)
-    w.writerows(irecords)
-    f.seek(0)
     return f
 
 
+def get_json_dumps(fast=False, **kwargs):
+    """Creates a function that serializes a record as a json string.
+
+    Args:
+        fast (bool): Serialize with `orjson` if it is installed and the kwargs
+            allow it. Note: `orjson` output is compact (no spaces after
+            separators) and writes `NaN` and `Infinity` as `null`
+            (default: False).
+
+    Kwargs:
+        indent (int): Number of spaces to indent (default: None).
+        sort_keys (bool): Sort rows by keys (default: False).
+        ensure_ascii (bool): Ignore non-ASCII chars (default: True).
+
+    Returns:
+        func: A function that takes a record and returns a json string.
+
+    See also:
+        `meza.convert.records2json`
+
+    Examples:
+        >>> dumps_ = get_json_dumps(sort_keys=True, ensure_ascii=False)
+        >>> from json import loads
+        >>> record = {'b': Decimal('1.5'), 'a': 'Ādam', 'c': dt(1971, 1, 1)}
+        >>> loads(dumps_(record)) == {
+        ...     'a': 'Ādam', 'b': 1.5, 'c': '1971-01-01 00:00:00'}
+        True
+        >>> get_json_dumps()({'a': float('nan'), 'b': 1})
+        '{"a": NaN, "b": 1}'
+    """
+    jd = partial(dumps, cls=ft.CustomEncoder, **kwargs)
+    sort_keys = kwargs.pop("sort_keys", False)
+    indent = kwargs.pop("indent", None)
+    compatible = indent is None and not kwargs.pop("ensure_ascii", True)
+
+    if fast and orjson and compatible and not kwargs:
+        default = ft.CustomEncoder().default
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        option |= orjson.OPT_SORT_KEYS if sort_keys else 0
+
+        def _dumps(record):
+            try:
+                return orjson.dumps(record, default=default, option=option).decode()
+            except TypeError:
+                return jd(record)
+
+    else:
+        _dumps = jd
+
+    return _dumps
+
+
+def gen_json(records, newline=False, chunksize=1000, **kwargs):
+    """Converts records into json text, `chunksize` records at a time. The
+    joined text is the same as `json.dumps(list(records), **kwargs)` (or its
+    newline delimited equivalent).
+
+    Args:
+        records (Iter[dict]): Rows of data whose keys are the field names.
+            E.g., output from any `meza.io` read function.
+
+        newline (bool): Output newline delimited json (default: False)
+        chunksize (int): Number of records per chunk (default: 1000).
+        kwargs (dict): Keyword arguments passed to `json.dumps` (or `fast`,
+            see `meza.convert.get_json_dumps`)
+
+    Yields:
+        str: json text
+
+    See also:
+        `meza.convert.records2json`
+
+    Examples:
+        >>> records = [{'a': 1}, {'a': 2}, {'a': 3}]
+        >>> list(gen_json(records, chunksize=2))
+        ['[{"a": 1}, {"a": 2}', ', {"a": 3}', ']']
+        >>> ''.join(gen_json(iter(records), indent=1)) == dumps(records, indent=1)
+        True
+        >>> list(gen_json([]))
+        ['[]']
+    """
+    fast = kwargs.pop("fast", False)
+    indent = kwargs.get("indent")
+    separators = kwargs.get("separators") or (", " if indent is None else ",", "")
+
+    if newline:
+        jd = get_json_dumps(fast, **kwargs)
+        start, sep, end = "", "\n", ""
+    elif indent is None:
+        jd = partial(dumps, cls=ft.CustomEncoder, **kwargs)
+        start, sep, end = "[", separators[0], "]"
+    else:
+        prefix = " " * indent if isinstance(indent, int) else indent
+        encode = partial(dumps, cls=ft.CustomEncoder, **kwargs)
+        jd = lambda record: encode(record).replace("\n", "\n" + prefix)
+        start, sep, end = "[\n" + prefix, separators[0] + "\n" + prefix, "\n]"
+
+    chunks = ft.chunk(records, chunksize)
+    rows = next(chunks, None)
+
+    if rows:
+        yield start + sep.join(map(jd, rows))
+        yield from (sep + sep.join(map(jd, rows)) for rows in chunks)
+        yield end
+    elif not newline:
+        yield "[]"
+
+
 def records2json(records, **kwargs):
     """Converts records into a json file like object.
 
@@ -858,15 +1298,27 @@ def records2json(records, **kwargs):
 
     Kwargs:
         indent (int): Number of spaces to indent (default: None).
-        newline (bool): Output newline delimited json (default: False)
+        newline (bool): Output newline delimited json (default: False).
+        fast (bool): Serialize newline delimited json with `orjson` (if it
+            is installed and `indent` isn't set). The output is compact and
+            `NaN` is written as `null` (default: False).
+
         sort_keys (bool): Sort rows by keys (default: True).
         ensure_ascii (bool): Ignore non-ASCII chars (default: False).
+        stream (bool): Lazily convert the records as the file like object
+            is read, e.g., by `meza.io.write` (default: False).
+
+        chunksize (int): Number of records to convert at a time when
+            streaming (default: 1000).
 
     See also:
         `meza.convert.records2geojson`
+        `meza.convert.get_json_dumps`
+        `meza.convert.gen_json`
 
     Returns:
-        obj: io.StringIO instance
+        obj: io.StringIO instance, or a `meza.io.IterStringIO` instance (which
+            reads bytes) if `stream` is True.
 
     Examples:
         >>> from json import loads
@@ -883,12 +1335,23 @@ def records2json(records, **kwargs):
         >>> json_str = records2json([record], newline=True).readline()
         >>> loads(json_str) == record
         True
+        >>> json_obj = records2json(iter([record]), stream=True)
+        >>> loads(json_obj.read())[0] == record
+        True
     """
     defaults = {"sort_keys": True, "ensure_ascii": False}
     [kwargs.setdefault(k, v) for k, v in defaults.items()]
     newline = kwargs.pop("newline", False)
-    jd = partial(dumps, cls=ft.CustomEncoder, **kwargs)
-    json = "\n".join(map(jd, records)) if newline else jd(records)
+    chunksize = kwargs.pop("chunksize", 1000)
+
+    if kwargs.pop("stream", False):
+        return _iter_string_io(gen_json(records, newline, chunksize, **kwargs))
+    elif newline:
+        json = "\n".join(map(get_json_dumps(**kwargs), records))
+    else:
+        kwargs.pop("fast", None)
+        json = dumps(records, cls=ft.CustomEncoder, **kwargs)
+
     return StringIO(str(json))
 
 
@@ -26,13 +26,18 @@ Attributes:
     SQLITE_TYPE (dict): Python to sqlite type lookup table
     ARRAY_NULL_TYPE (dict): None to array.array type lookup table
 """
+import os
 import sys
 import itertools as it
 import operator
 import time
 
-from functools import partial, reduce
-from collections import defaultdict
+from functools import partial, reduce, lru_cache
+from hashlib import blake2b
+from math import log
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait, FIRST_COMPLETED
 from json import JSONEncoder
 from os import path as p
 from itertools import zip_longest, filterfalse
@@ -246,6 +251,150 @@ class CustomEncoder(JSONEncoder):
         return encoded
 
 
+class NumericParser:
+    """Validates and converts numeric strings for a given pair of separators.
+    Use `get_numeric_parser` to get a cached instance.
+
+    Examples:
+        >>> parser = NumericParser('.', ',')
+        >>> parser.strip('€2.123,45') == '2123.45'
+        True
+        >>> parser.parse('2.123,45')
+        2123.45
+        >>> parser.parse('spam')
+    """
+
+    def __init__(self, thousand_sep=",", decimal_sep="."):
+        """NumericParser constructor
+
+        Args:
+            thousand_sep (char): thousand's separator (default: ',')
+            decimal_sep (char): decimal separator (default: '.')
+        """
+        self.thousand_sep = thousand_sep
+        self.decimal_sep = decimal_sep
+        currencies = zip(CURRENCIES, it.repeat(""))
+        separators = [(thousand_sep, ""), (decimal_sep, ".")]
+        replacements = it.chain(currencies, separators)
+
+        # chained `str.replace` calls are faster than `str.translate` with
+        # non-ascii tables, so just drop the replacements that are no-ops
+        self.replacements = tuple((x, y) for x, y in replacements if x != y)
+
+        # `float` rejects any string these separators would change
+        self.plain = decimal_sep == "." and thousand_sep in ",'"
+
+    def strip(self, value):
+        """Strips a string of all non-numeric characters.
+
+        Args:
+            value (str): The string to parse.
+
+        Returns:
+            str: The stripped value
+        """
+        try:
+            for old, new in self.replacements:
+                value = value.replace(old, new)
+        except AttributeError:
+            pass  # We don't have a string
+
+        return value
+
+    def _float(self, content):
+        """Converts content into a float, and returns it along with the
+        stripped content.
+        """
+        if self.plain:
+            # most values don't need to be stripped
+            try:
+                return content, float(content)
+            except (ValueError, TypeError):
+                pass
+
+        try:
+            stripped = self.strip(content)
+        except TypeError:
+            stripped = content
+
+        return stripped, float(stripped)
+
+    def parse(self, content, strip_zeros=False):
+        """Validates and converts content into a number.
+
+        Args:
+            content (scalar): the content to parse
+            strip_zeros (bool): Remove leading zeros (default: False)
+
+        Returns:
+            float: The parsed number, or None if content isn't numeric.
+        """
+        try:
+            stripped, floated = self._float(content)
+        except (ValueError, TypeError):
+            return None
+
+        s = stripped if isinstance(stripped, str) else str(stripped)
+        zero_point = s.startswith("0.")
+        passed = bool(floated) or zero_point
+
+        if s.startswith("0") and not (strip_zeros or zero_point):
+            try:
+                passed = int(stripped) == 0
+            except ValueError:
+                passed = False
+
+        return floated if passed else None
+
+
+class BloomFilter:
+    """A set like object with a fixed memory size which never has false
+    negatives, but may have false positives, i.e., `item in bloom` may be
+    True even if `item` was never added.
+
+    Examples:
+        >>> bloom = BloomFilter(100, 0.01)
+        >>> bloom.add('spam')
+        >>> 'spam' in bloom
+        True
+        >>> 'eggs' in bloom
+        False
+        >>> bloom.size, bloom.hashes
+        (958, 7)
+    """
+
+    def __init__(self, capacity=1000000, error_rate=0.001):
+        """BloomFilter constructor
+
+        Args:
+            capacity (int): Expected number of items (default: 1000000).
+            error_rate (float): False positive rate once `capacity` items have
+                been added (default: 0.001).
+        """
+        self.size = max(1, int(-capacity * log(error_rate) / log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _gen_positions(self, item):
+        # https://en.wikipedia.org/wiki/Double_hashing
+        content = item if isinstance(item, bytes) else str(item).encode(ENCODING)
+        digest = blake2b(content, digest_size=16).digest()
+        x, y = int.from_bytes(digest[:8], "little"), int.from_bytes(
+            digest[8:], "little"
+        )
+        return ((x + i * y) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for pos in self._gen_positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        bits = self.bits
+        return all(
+            bits[pos >> 3] & (1 << (pos & 7)) for pos in self._gen_positions(item)
+        )
+
+
 class SleepyDict(dict):
     """A dict like object that sleeps for a specified amount of time before
     returning a key or during truth value testing
@@ -423,6 +572,26 @@ def find_type(_type, content, n=0):
         return content.index(found)
 
 
+@lru_cache(maxsize=None)
+def get_numeric_parser(thousand_sep=",", decimal_sep="."):
+    """Gets a (cached) numeric parser for a given pair of separators
+
+    Args:
+        thousand_sep (char): thousand's separator (default: ',')
+        decimal_sep (char): decimal separator (default: '.')
+
+    Returns:
+        obj: NumericParser instance
+
+    Examples:
+        >>> get_numeric_parser('.', ',') is get_numeric_parser('.', ',')
+        True
+        >>> get_numeric_parser('.', ',').parse('1.000,5')
+        1000.5
+    """
+    return NumericParser(thousand_sep, decimal_sep)
+
+
 def strip(value, thousand_sep=",", decimal_sep="."):
     """Strips a string of all non-numeric characters.
 
@@ -440,15 +609,7 @@ def strip(value, thousand_sep=",", decimal_sep="."):
     Returns:
         str: The stripped value
     """
-    currencies = zip(CURRENCIES, it.repeat(""))
-    separators = [(thousand_sep, ""), (decimal_sep, ".")]
-
-    try:
-        stripped = mreplace(value, it.chain(currencies, separators))
-    except AttributeError:
-        stripped = value  # We don't have a string
-
-    return stripped
+    return get_numeric_parser(thousand_sep, decimal_sep).strip(value)
 
 
 def is_numeric(content, thousand_sep=",", decimal_sep=".", **kwargs):
@@ -473,27 +634,8 @@ def is_numeric(content, thousand_sep=",", decimal_sep=".", **kwargs):
         >>> is_numeric('0.1')
         True
     """
-    try:
-        stripped = strip(content, thousand_sep, decimal_sep)
-    except TypeError:
-        stripped = content
-
-    try:
-        floated = float(stripped)
-    except (ValueError, TypeError):
-        passed = False
-    else:
-        s = str(stripped)
-        zero_point = s.startswith("0.")
-        passed = bool(floated) or zero_point
-
-        if s.startswith("0") and not (kwargs.get("strip_zeros") or zero_point):
-            try:
-                passed = int(stripped) == 0
-            except ValueError:
-                passed = False
-
-    return passed
+    parser = get_numeric_parser(thousand_sep, decimal_sep)
+    return parser.parse(content, kwargs.get("strip_zeros")) is not None
 
 
 def is_int(content, strip_zeros=False, thousand_sep=",", decimal_sep="."):
@@ -513,14 +655,8 @@ def is_int(content, strip_zeros=False, thousand_sep=",", decimal_sep="."):
         >>> is_int('123')
         True
     """
-    passed = is_numeric(content, thousand_sep, decimal_sep)
-
-    try:
-        stripped = strip(content, thousand_sep, decimal_sep)
-    except TypeError:
-        stripped = content
-
-    return passed and float(stripped).is_integer()
+    floated = get_numeric_parser(thousand_sep, decimal_sep).parse(content)
+    return floated is not None and floated.is_integer()
 
 
 def is_bool(content, trues=None, falses=None):
@@ -689,6 +825,68 @@ def chunk(content, chunksize=None, start=0, stop=None):
     return it.takewhile(bool, generator)
 
 
+def pmap(func, iterable, workers=None, max_inflight=None, threads=False, **kwargs):
+    """Maps a function over an iterable using a pool of workers, and yields
+    the results in the original order (or as they complete). Only
+    `max_inflight` items are submitted at a time, so `iterable` may be
+    unbounded.
+
+    Args:
+        func (func): The function to apply. Must be picklable unless `threads`
+            is True.
+
+        iterable (Iter): The items to map `func` over, e.g., `chunk` output.
+        workers (int): Number of workers (default: `os.cpu_count()`).
+        max_inflight (int): Maximum number of submitted items that haven't
+            been yielded (default: 2 * workers).
+
+        threads (bool): Use a thread pool instead of a process pool
+            (default: False).
+
+    Kwargs:
+        ordered (bool): Yield the results in the original order, otherwise
+            yield them as soon as they complete (default: True).
+
+    Yields:
+        scalar: The result of `func(item)` for each item
+
+    Examples:
+        >>> list(pmap(sum, chunk(range(10), 3), 2, threads=True))
+        [3, 12, 21, 9]
+        >>> sorted(pmap(sum, chunk(range(10), 3), 2, threads=True, ordered=False))
+        [3, 9, 12, 21]
+    """
+    Executor = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    workers = workers or os.cpu_count() or 1
+    max_inflight = max_inflight or 2 * workers
+    ordered = kwargs.get("ordered", True)
+
+    def get_result(futures):
+        if ordered:
+            future = futures.popleft()
+        else:
+            future = next(iter(wait(futures, return_when=FIRST_COMPLETED).done))
+            futures.remove(future)
+
+        return future.result()
+
+    with Executor(max_workers=workers) as executor:
+        futures = deque()
+
+        try:
+            for item in iterable:
+                if len(futures) >= max_inflight:
+                    yield get_result(futures)
+
+                futures.append(executor.submit(func, item))
+
+            while futures:
+                yield get_result(futures)
+        finally:
+            for future in futures:
+                future.cancel()
+
+
 def get_values(narray):
     """Obtains the raw values from a nested list of arrays
 
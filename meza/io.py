@@ -19,6 +19,8 @@ Examples:
         True
 """
 import itertools as it
+import asyncio
+import re
 import sys
 import hashlib
 import sqlite3
@@ -27,13 +29,17 @@ import os
 
 from os import path as p
 from datetime import time
-from mmap import mmap
+from mmap import mmap, ACCESS_READ
+from array import array
 from collections import deque
 from subprocess import check_output, check_call, Popen, PIPE, CalledProcessError
 from http import client
-from csv import Error as csvError
-from functools import partial
-from codecs import iterdecode, iterencode, StreamReader
+from csv import Error as csvError, reader as csvReader, QUOTE_NONE
+from functools import partial, lru_cache
+from operator import itemgetter
+from inspect import iscoroutinefunction
+from concurrent.futures import ProcessPoolExecutor
+from codecs import getincrementaldecoder, getincrementalencoder, lookup, BOM_UTF8
 from itertools import zip_longest
 from math import inf
 
@@ -45,18 +51,67 @@ from bs4 import BeautifulSoup, FeatureNotFound
 from ijson import items
 from chardet.universaldetector import UniversalDetector
 from xlrd import (
+    XL_CELL_BLANK,
     XL_CELL_DATE,
     XL_CELL_EMPTY,
     XL_CELL_NUMBER,
     XL_CELL_BOOLEAN,
     XL_CELL_ERROR,
+    XL_CELL_TEXT,
 )
 
 from xlrd.xldate import xldate_as_datetime as xl2dt
-from io import StringIO, TextIOBase, BytesIO
+from xlrd.book import Book
+from xlrd.xlsx import (
+    U_SSML12,
+    V_TAG,
+    IS_TAG,
+    X12Book,
+    X12SST,
+    X12Styles,
+    cnv_xsd_boolean,
+    cooked_text,
+    ensure_elementtree_imported,
+    error_code_from_text,
+    get_text_from_si_or_is,
+)
+from xml.etree.ElementTree import iterparse
+from zipfile import ZipFile, is_zipfile
+from io import StringIO, RawIOBase, BytesIO, IncrementalNewlineDecoder
+from io import SEEK_SET, SEEK_CUR, UnsupportedOperation
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+from yaml.events import (
+    DocumentStartEvent,
+    SequenceStartEvent,
+    SequenceEndEvent,
+    MappingStartEvent,
+    MappingEndEvent,
+)
 
 from . import fntools as ft, process as pr, unicsv as csv, dbf, ENCODING, BOM, DATA_DIR
 
+try:
+    from yaml.cyaml import CParser
+except ImportError:
+    CParser = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 # pylint: disable=C0103
 logger = gogo.Gogo(__name__, monolog=True, verbose=True).logger
 
@@ -65,14 +120,29 @@ encode = lambda iterable: (s.encode(ENCODING) for s in iterable)
 chain = lambda iterable: it.chain.from_iterable(iterable or [])
 
 NEWLINES = {b"\n", b"\r", b"\r\n", "\n", "\r", "\r\n"}
+NEWLINE = re.compile(rb"[\r\n]")
+NON_NEWLINE = re.compile(rb"[^\r\n]")
+LINE_ENDS = re.compile(r"(?<=\n)|(?<=\r)(?!\n)")
+SAMPLE_SIZE = 2 ** 18
+OTHER_LINE_ENDS = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+if orjson:
+    fast_loads = orjson.loads
+elif simdjson:
+    fast_loads = simdjson.loads
+else:
+    fast_loads = json.loads
 
 
 def groupby_line(iterable):
     return it.groupby(iterable, lambda s: s not in NEWLINES)
 
 
-class IterStringIO(TextIOBase):
-    """A lazy StringIO that reads a generator of strings.
+class IterStringIO(RawIOBase):
+    """A lazy, buffered byte stream that reads a generator of strings.
+
+    Content is encoded and buffered a whole chunk at a time, and the last
+    `bufsize` bytes read are kept so that the stream can seek backwards.
 
     https://stackoverflow.com/a/32020108/408556
     https://stackoverflow.com/a/20260030/408556
@@ -94,25 +164,34 @@ class IterStringIO(TextIOBase):
             >>> IterStringIO(iter('Hello World')).read(5)
             b'Hello'
             >>> i = IterStringIO(iter('one\\ntwo\\n'))
-            >>> list(next(i.lines)) == [b'o', b'n', b'e']
-            True
+            >>> next(i.lines)
+            b'one'
             >>> decoded = IterStringIO(iter('Hello World'), decode=True)
             >>> decoded.read(5) == 'Hello'
             True
+            >>> decoded = IterStringIO(iter('Iñtër'), decode=True)
+            >>> decoded.read(2), decoded.read(2)
+            ('I', 'ñt')
+            >>> buf = bytearray(5)
+            >>> IterStringIO(['Hel', 'lo World']).readinto(buf), buf
+            (5, bytearray(b'Hello'))
         """
-        iterable = iterable if iterable else []
-        chained = chain(iterable)
-        self.iter = encode(chained)
+        self.iter = iter([])
         self.decode = decode
+        self.decoder = getincrementaldecoder(ENCODING)()
         self.bufsize = bufsize
-
-        # Not sure why I used bytearray here... maybe it was to be able to read
-        # by `num` of bytes??
-        self.last = deque(bytearray(), self.bufsize)
+        self.buf = bytearray()
+        self.last = bytearray()
         self.pos = 0
+        self.write(iterable or [])
 
     def __next__(self):
-        return self._read(next(self.lines))
+        line = self._next_line()
+
+        if line is None:
+            raise StopIteration
+
+        return self._decode(line)
 
     def __iter__(self):
         return self
@@ -120,69 +199,160 @@ class IterStringIO(TextIOBase):
     @property
     def lines(self):
         """Read all the lines of content"""
-        # TODO: what about a csv with embedded newlines?
-        groups = groupby_line(self.iter)
-        return (g for k, g in groups if k)
+        return iter(self._next_line, None)
+
+    def _decode(self, content):
+        """Helper method used to decode content (flushing the decoder once all
+        the content has been read)"""
+        if self.decode:
+            final = not self.buf and self._fill(1)
+            content = self.decoder.decode(content, final)
+
+        return content
+
+    def _fill(self, num=None):
+        """Buffers at least `num` bytes (or all the content if `num` is None).
+
+        Returns:
+            bool: Whether the content was exhausted
+        """
+        if num is None:
+            self.buf.extend(b"".join(self.iter))
+            return True
+
+        while len(self.buf) < num:
+            chunk = next(self.iter, None)
+
+            if chunk is None:
+                return True
+
+            self.buf += chunk
+
+        return False
+
+    def _take(self, num):
+        """Removes `num` bytes from the buffer and adds them to the history"""
+        content = bytes(self.buf[:num])
+        del self.buf[:num]
+        self.last += content
+
+        if len(self.last) > self.bufsize:
+            del self.last[: len(self.last) - self.bufsize]
+
+        return content
 
-    def _read(self, iterable, num=None, newline=True):
-        """Helper method used to read content"""
-        content = it.islice(iterable, num) if num else iterable
+    def _next_line(self, num=None):
+        """Reads (up to `num` bytes of) the next non-blank line. The line
+        ending (and any preceding blank lines) is consumed, but isn't returned.
+        """
+        scanned, exhausted = 0, False
+
+        while True:
+            match = NON_NEWLINE.search(self.buf, scanned)
+
+            if match or exhausted:
+                break
+
+            scanned = len(self.buf)
+            exhausted = self._fill(scanned + 1)
 
-        byte = ft.byte(content)
-        self.last.extend(byte)
-        self.pos += num or len(byte)
+        if not match:
+            self.pos += len(self._take(len(self.buf)))
+            return None
 
-        if newline:
-            self.last.append(os.linesep)
+        start = scanned = match.start()
+        limit = start + num if num else None
 
-        return byte.decode(ENCODING) if self.decode else bytes(byte)
+        while True:
+            match = NEWLINE.search(self.buf, scanned)
+            full = limit and len(self.buf) >= limit
+
+            if match or exhausted or full:
+                break
+
+            scanned = len(self.buf)
+            exhausted = self._fill(scanned + 1)
+
+        end = match.start() if match else len(self.buf)
+        end = min(end, limit) if limit else end
+        ending = end < len(self.buf) and self.buf[end] in b"\r\n"
+        content = self._take(end + ending)
+        self.pos += len(content)
+        return content[start:end]
 
     def write(self, iterable):
         """Write the content"""
-        chained = chain(iterable)
-        self.iter = it.chain(self.iter, encode(chained))
+        iterable = [iterable] if hasattr(iterable, "encode") else iterable
+        encoded = (c.encode(ENCODING) if hasattr(c, "encode") else c for c in iterable)
+        self.iter = it.chain(self.iter, encoded)
 
     def read(self, num=None):
         """Read the content"""
-        return self._read(self.iter, num, newline=False)
+        num = None if num is None or num < 0 else num
+        self._fill(num)
+        content = self._take(len(self.buf) if num is None else num)
+        self.pos += len(content)
+        return self._decode(content)
+
+    def readinto(self, b):
+        """Read content into a pre-allocated, writable bytes-like object"""
+        view = memoryview(b).cast("B")
+        self._fill(len(view))
+        content = self._take(len(view))
+        view[: len(content)] = content
+        self.pos += len(content)
+        return len(content)
 
     def readline(self, num=None):
         """Read a line of content"""
-        return self._read(next(self.lines), num)
+        return self._decode(self._next_line(num) or b"")
 
     def readlines(self):
         """Read all the lines of content"""
-        return map(self._read, self.lines)
+        return map(self._decode, self.lines)
+
+    def readable(self):
+        """The content can always be read"""
+        return True
 
-    def seek(self, num):
+    def seekable(self):
+        """Seeking is supported (backwards only within `bufsize` bytes)"""
+        return True
+
+    def seek(self, num, whence=SEEK_SET):
         """Go to a specific position within a file"""
-        next_pos = self.pos + 1
+        num += self.pos if whence == SEEK_CUR else 0
         beg_buf = max([0, self.pos - self.bufsize])
+        self.decoder.reset()
 
         if num <= beg_buf:
-            self.iter = it.chain(self.last, self.iter)
-            self.last = deque([], self.bufsize)
-        elif self.pos > num > beg_buf:
-            extend = [self.last.pop() for _ in range(self.pos - num)]
-            self.iter = it.chain(reversed(extend), self.iter)
-        elif num == self.pos:
-            pass
-        elif num == next_pos:
-            self.last.append(next(self.iter))
-        elif num > next_pos:
-            pos = num - self.pos
-            [self.last.append(x) for x in it.islice(self.iter, 0, pos)]
+            self.buf[:0] = self.last
+            self.last = bytearray()
+        elif self.pos > num:
+            offset = len(self.last) - (self.pos - num)
+            self.buf[:0] = self.last[offset:]
+            del self.last[offset:]
+        elif num > self.pos:
+            self._fill(num - self.pos)
+            self._take(num - self.pos)
 
         self.pos = beg_buf if num < beg_buf else num
+        return self.pos
 
     def tell(self):
         """Get the current position within a file"""
         return self.pos
 
 
-class Reencoder(StreamReader):
-    """Recodes a file like object from one encoding to another."""
+class Reencoder(RawIOBase):
+    """Recodes a file like object from one encoding to another.
+
+    The file is read in blocks that are decoded incrementally and then split
+    into lines, so multi-byte encodings (e.g., utf-16) and any line ending
+    ('\\n', '\\r\\n', or '\\r') are handled the same way.
+    """
 
+    # pylint: disable=super-init-not-called
     def __init__(self, f, fromenc=ENCODING, toenc=ENCODING, **kwargs):
         """Reencoder constructor
 
@@ -194,23 +364,25 @@ class Reencoder(StreamReader):
         Kwargs:
             remove_BOM (bool): Remove Byte Order Marker (default: True)
             decode (bool): Decode the text into a string (default: False)
+            chunksize (int): Number of bytes (or characters if `f` is opened in
+                text mode) to read at a time (default: 64 KiB).
 
         Examples:
             >>> encoding = 'utf-16-be'
             >>> eff = p.join(DATA_DIR, 'utf16_big.csv')
             >>>
-            >>> with open(eff, 'rb') as f:  # doctest: +SKIP
+            >>> with open(eff, 'rb') as f:
             ...     reenc = Reencoder(f, encoding)
             ...     first = reenc.readline(keepends=False)
             ...     first.decode('utf-8') == '\ufeffa,b,c'
             ...     reenc.readlines()[1].decode('utf-8') == '4,5,ʤ'
             True
             True
-            >>> with open(eff, 'rb') as f:  # doctest: +SKIP
+            >>> with open(eff, 'rb') as f:
             ...     reenc = Reencoder(f, encoding, decode=True)
             ...     reenc.readline(keepends=False) == '\ufeffa,b,c'
             True
-            >>> with open(eff, encoding=encoding) as f:  # doctest: +SKIP
+            >>> with open(eff, encoding=encoding) as f:
             ...     reenc = Reencoder(f, remove_BOM=True)
             ...     reenc.readline(keepends=False) == b'a,b,c'
             ...     reenc.readline() == b'1,2,3\\n'
@@ -218,65 +390,123 @@ class Reencoder(StreamReader):
             True
             True
             True
+            >>> f = BytesIO('a,b\\r1,é\\r\\n'.encode('utf-16-le'))
+            >>> list(Reencoder(f, 'utf-16-le', chunksize=3))
+            [b'a,b\\r', b'1,\\xc3\\xa9\\r\\n']
         """
-        self.fileno = f.fileno
-        first_line = next(f)
-        bytes_mode = isinstance(first_line, bytes)
-        decode = kwargs.get("decode")
-        rencode = not decode
-
-        if kwargs.get("remove_BOM"):
-            strip = BOM.encode(fromenc) if bytes_mode else BOM
-            first_line = first_line.lstrip(strip)
-
-        chained = it.chain([first_line], f)
-
-        if bytes_mode:
-            decoded = iterdecode(chained, fromenc)
-            self.binary = rencode
-            proper_newline = first_line.endswith(os.linesep.encode(fromenc))
-        else:
-            decoded = chained
-            self.binary = bytes_mode or rencode
-            proper_newline = first_line.endswith(os.linesep)
-
-        stream = iterencode(decoded, toenc) if rencode else decoded
+        if hasattr(f, "fileno"):
+            self.fileno = f.fileno
 
-        if proper_newline:
-            self.join_char = b"" if self.binary else ""
-            self.stream = stream
-        else:
-            # TODO: make sure the read methods are consistent with
-            #       proper_newline, e.g., `keepends`.
-            #
-            # since the newline isn't recognized, `stream` just contains
-            # one (very long) line. we pass in this line to iterate over the
-            # chars
-            groups = groupby_line(next(stream))
-
-            if self.binary:
-                self.join_char = os.linesep.encode(fromenc)
-            else:
-                self.join_char = os.linesep
+        self.decode = kwargs.get("decode")
+        self.binary = not self.decode
+        self.toenc = toenc
+        self.encoder = getincrementalencoder(toenc)()
+        self.buf = "" if self.decode else bytearray()
+        self.last_line = ""
 
-            self.stream = (self.join_char.join(g) for k, g in groups if k)
+        chunksize = kwargs.get("chunksize", 2 ** 16)
+        remove_BOM = kwargs.get("remove_BOM")
+        self.lines = self._gen_lines(f, fromenc, chunksize, remove_BOM)
 
     def __next__(self):
-        return next(self.stream)
+        return self.readline() if self.buf else self._convert(next(self.lines))
 
     def __iter__(self):
         return self
 
+    # pylint: disable=invalid-name
+    def _gen_lines(self, f, fromenc, chunksize, remove_BOM=False):
+        """Decodes the file and splits it into lines (including line endings)"""
+        decoder = getincrementaldecoder(fromenc)()
+        blocks = (f.read(chunksize) for _ in it.count()) if hasattr(f, "read") else f
+        pending = ""
+
+        for block in it.takewhile(bool, blocks):
+            decoded = decoder.decode(block) if hasattr(block, "decode") else block
+            text = pending + decoded
+
+            if remove_BOM and text:
+                text, remove_BOM = text.lstrip(BOM), False
+
+            # hold on to a trailing '\r' in case the next block starts with '\n'
+            cut = len(text) - text.endswith("\r")
+            pending = text[cut:]
+
+            if OTHER_LINE_ENDS.search(text):
+                lines = LINE_ENDS.split(text[:cut])
+            else:
+                lines = text[:cut].splitlines(True)
+
+            if lines and lines[-1][-1:] not in {"\r", "\n"}:
+                pending = lines.pop() + pending
+
+            yield from filter(None, lines)
+
+        pending += decoder.decode(b"", final=True)
+
+        if pending:
+            yield pending
+
+    def _convert(self, line):
+        """Encodes a line (unless we are decoding)"""
+        return line if self.decode else self.encoder.encode(line)
+
+    def _fill(self, n=None):
+        """Buffers whole lines until there are at least `n` characters or
+        bytes (or all of the content if `n` is None).
+        """
+        while n is None or len(self.buf) < n:
+            line = next(self.lines, None)
+
+            if line is None:
+                break
+
+            self.buf += self._convert(line)
+            self.last_line = line
+
+    def _take(self, n):
+        """Removes `n` characters or bytes from the buffer"""
+        content = self.buf[:n]
+
+        if self.decode:
+            self.buf = self.buf[n:]
+        else:
+            content = bytes(content)
+            del self.buf[:n]
+
+        return content
+
     def read(self, n=None):
-        stream = it.islice(self.stream, n) if n else self.stream
-        return self.join_char.join(stream)
+        n = None if n is None or n < 0 else n
+        self._fill(n)
+        return self._take(len(self.buf) if n is None else n)
+
+    def readinto(self, b):
+        view = memoryview(b).cast("B")
+        self._fill(len(view))
+        content = self._take(len(view))
+        view[: len(content)] = content
+        return len(content)
 
     def readline(self, n=None, keepends=True):
-        line = next(self.stream)
-        return line if keepends else line.rstrip()
+        if self.buf:
+            # the rest of a line that was partially consumed by `read`
+            line = self._take(len(self.buf))
+            text = self.last_line
+            size = len(text) - len(text.rstrip("\r\n"))
+            size = len(self._convert(text[-size:])) if self.binary and size else size
+            line = line if keepends else line[: max(len(line) - size, 0)]
+        else:
+            line = next(self.lines, "")
+            line = self._convert(line if keepends else line.rstrip("\r\n"))
+
+        return line
 
     def readlines(self, sizehint=None):
-        return list(self.stream)
+        return list(self)
+
+    def readable(self):
+        return True
 
     def tell(self):
         pass
@@ -285,10 +515,224 @@ class Reencoder(StreamReader):
         pass
 
 
+def _get_decoder(encoding, flag=0):
+    """Helps create an incremental decoder that translates newlines"""
+    decoder = getincrementaldecoder(encoding)()
+    decoder = IncrementalNewlineDecoder(decoder, translate=True)
+    decoder.setstate((b"", flag))
+    return decoder
+
+
+def _switch_decoder(err, block, decoder, encoding, offset=0, name=None):
+    """Helps decode a block that failed to decode using the encoding detected
+    from the offending line onwards.
+
+    Args:
+        err (obj): The `UnicodeDecodeError` raised while decoding `block`.
+        block (bytes): The block that failed to decode.
+        decoder (obj): The (newline translating) decoder that raised `err`.
+        encoding (str): The encoding of `decoder`.
+        offset (int): Number of bytes decoded so far, including `block`
+            (default: 0).
+
+        name (str): The name of the file being decoded (default: None).
+
+    Returns:
+        Tuple[str, obj, str]: The decoded text, the decoder to continue with,
+            and its encoding.
+
+    Raises:
+        UnicodeDecodeError: If decoding can't resume from the offending line.
+    """
+    data = err.object
+    cut = data.rfind(b"\n", 0, err.start) + 1
+    flag = decoder.getstate()[1] & 1
+    result = detect_encoding(BytesIO(data[cut:]), sample_size=None)
+    new_encoding = sanitize_file_encoding(result["encoding"])
+    encodings = [encoding, new_encoding]
+    compatible = new_encoding and all(map(_is_ascii_compatible, encodings))
+
+    if not (compatible and data.endswith(block)):
+        # we can't resume mid-file so let the caller start over
+        raise err
+
+    text = _get_decoder(encoding, flag).decode(data[:cut])
+    decoder = _get_decoder(new_encoding, 0 if cut else flag)
+
+    try:
+        text += decoder.decode(data[cut:])
+    except UnicodeDecodeError:
+        raise err
+
+    msg = "Switching from %s to %s at byte %i of %s"
+    logger.warning(msg, encoding, new_encoding, offset - len(data) + cut, name)
+    return text, decoder, new_encoding
+
+
+class Redecoder(object):
+    """A read only text file that switches encodings in place.
+
+    The file is read in blocks that are decoded incrementally (translating
+    newlines as in text mode). If a block can't be decoded, the encoding of the
+    offending bytes is detected and decoding resumes from the start of the
+    offending line, so readers keep their place instead of starting over.
+    """
+
+    def __init__(self, filepath, encoding=ENCODING, chunksize=2 ** 16, **kwargs):
+        """Initialization method.
+
+        Args:
+            filepath (str): The file path.
+            encoding (str): The initial file encoding (default: ENCODING
+                constant).
+
+            chunksize (int): Number of bytes to read at a time
+                (default: 64 KiB).
+
+        Kwargs:
+            remove_BOM (bool): Remove Byte Order Marker (default: False)
+
+        Examples:
+            >>> filepath = p.join(DATA_DIR, 'latin1.csv')
+            >>> with Redecoder(filepath, 'ascii') as f:
+            ...     f.readline()
+            ...     f.read(4)
+            ...     f.readline()
+            'a,b,c\\n'
+            '1,2,'
+            '3\\n'
+            >>> with Redecoder(filepath, 'ascii') as f:
+            ...     list(f) == ['a,b,c\\n', '1,2,3\\n', '4,5,©']
+            ...     f.encoding
+            True
+            'ISO-8859-1'
+        """
+        self.name = filepath
+        self.encoding = encoding
+        self.chunksize = chunksize
+        self.remove_BOM = kwargs.get("remove_BOM")
+        self.f = open(filepath, "rb")
+        self.seek(0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.readline() if self.buf else next(self.lines)
+
+    @property
+    def closed(self):
+        return self.f.closed
+
+    def close(self):
+        self.f.close()
+
+    def _decode(self, block, final=False):
+        self.offset += len(block)
+
+        try:
+            text = self.decoder.decode(block, final)
+        except UnicodeDecodeError as err:
+            args = (err, block, self.decoder, self.encoding, self.offset)
+            text, self.decoder, self.encoding = _switch_decoder(*args, self.name)
+
+        return text
+
+    def _gen_lines(self):
+        pending, remove_BOM = "", self.remove_BOM
+
+        for block in iter(partial(self.f.read, self.chunksize), b""):
+            text = pending + self._decode(block)
+
+            if remove_BOM and text:
+                text, remove_BOM = text.lstrip(BOM), False
+
+            if OTHER_LINE_ENDS.search(text):
+                # `splitlines` splits on more than just newlines
+                lines = LINE_ENDS.split(text)
+            else:
+                lines = text.splitlines(True)
+
+            last = lines[-1] if lines else "\n"
+            pending = "" if last.endswith("\n") else lines.pop()
+            yield from filter(None, lines)
+
+        text = pending + self._decode(b"", True)
+        text = text.lstrip(BOM) if remove_BOM else text
+
+        if text:
+            yield text
+
+    def read(self, n=-1):
+        """Read at most `n` characters (all if `n` is negative)"""
+        chunks, size = [self.buf], len(self.buf)
+
+        for line in self.lines if n is None or n < 0 or size < n else []:
+            chunks.append(line)
+            size += len(line)
+
+            if n is not None and 0 <= n <= size:
+                break
+
+        text = "".join(chunks)
+        end = len(text) if n is None or n < 0 else n
+        self.buf = text[end:]
+        return text[:end]
+
+    def readline(self):
+        if self.buf:
+            # the rest of a line that was partially consumed by `read`
+            head, sep, self.buf = self.buf.partition("\n")
+            line = head + sep
+        else:
+            line = next(self.lines, "")
+
+        return line
+
+    def readlines(self):
+        return list(self)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=SEEK_SET):
+        """Seek to the start of the file (the only supported position)"""
+        if offset or whence != SEEK_SET:
+            raise UnsupportedOperation("can only seek to the start of the file")
+
+        self.f.seek(0)
+        self.offset = 0
+        self.buf = ""
+        self.decoder = _get_decoder(self.encoding)
+        self.lines = self._gen_lines()
+        return 0
+
+
 class BytesError(ValueError):
     pass
 
 
+class JoinError(Exception):
+    """A file passed to `meza.io.join` couldn't be read"""
+
+    def __init__(self, filepath, err):
+        super().__init__(filepath, err)
+        self.filepath = filepath
+        self.err = err
+
+    def __str__(self):
+        return f"Unable to read {self.filepath}: {self.err!r}"
+
+
 def patch_http_response_read(func):
     """Patches httplib to read poorly encoded chunked data.
 
@@ -354,6 +798,41 @@ def is_listlike(item):
     return listlike
 
 
+def skip_bom(f):
+    """Positions a text file after its byte order marker (BOM), if any
+
+    Args:
+        f (obj): The text file like object.
+
+    Returns:
+        bool: False if the file can't be peeked (the BOM, if any, remains)
+
+    Examples:
+        >>> f = StringIO(BOM + 'a,b')
+        >>> skip_bom(f)
+        True
+        >>> f.read()
+        'a,b'
+        >>> skip_bom(iter(['a,b']))
+        False
+    """
+    try:
+        pos = f.tell()
+    except (AttributeError, OSError):
+        peekable = False
+    else:
+        try:
+            if f.read(1) != BOM:
+                f.seek(pos)
+        except (OSError, UnicodeDecodeError):
+            f.seek(pos)
+            peekable = False
+        else:
+            peekable = True
+
+    return peekable
+
+
 def remove_bom(row, bom):
     """Remove a byte order marker (BOM)"""
     if is_listlike(row):
@@ -368,16 +847,34 @@ def remove_bom(row, bom):
     return bomless
 
 
-def get_encoding(filepath):
-    """
+@lru_cache(maxsize=64)
+def _get_encoding(filepath, size, mtime, sample_size):
+    """Detects a file's encoding. The `size` and `mtime` args are only
+    used as cache keys."""
+    with open(filepath, "rb") as f:
+        encoding = detect_encoding(f, sample_size=sample_size)["encoding"]
+
+    return encoding
+
+
+def get_encoding(filepath, sample_size=SAMPLE_SIZE):
+    """Detects a file's encoding. Results are cached by path, size, and
+    modification time so repeated reads of the same file skip detection.
+
+    Args:
+        filepath (str): The file path.
+        sample_size (Optional[int]): Maximum number of bytes to examine
+            (default: 256KB).
+
+    See also:
+        `meza.io.detect_encoding`
+
     Examples:
         >>> get_encoding(p.join(DATA_DIR, 'utf16_big.csv')) == 'UTF-16'
         True
     """
-    with open(filepath, "rb") as f:
-        encoding = detect_encoding(f)["encoding"]
-
-    return encoding
+    stat = os.stat(filepath)
+    return _get_encoding(filepath, stat.st_size, stat.st_mtime_ns, sample_size)
 
 
 def get_file_encoding(f, encoding=None, bytes_error=False):
@@ -391,21 +888,30 @@ def get_file_encoding(f, encoding=None, bytes_error=False):
         logger.warning("%s was opened with the wrong encoding%s", f, extra)
         encoding = None
 
-    if not encoding:
+    filepath = getattr(f, "name", None)
+    named = isinstance(filepath, str) and p.isfile(filepath)
+
+    # A decode has already failed, so examine the entire file since a sample
+    # may not include the offending bytes.
+    if not encoding and named:
+        # Detect from the (cached) file on disk instead of the opened handle
+        f.close()
+        encoding = get_encoding(filepath, sample_size=None)
+    elif not encoding:
         try:
             f.seek(0)
-        except AttributeError:
+        except (AttributeError, UnsupportedOperation):
             pass
         else:
             try:
                 # See if we have bytes to avoid reopening the file
-                encoding = detect_encoding(f)["encoding"]
+                encoding = detect_encoding(f, sample_size=None)["encoding"]
             except UnicodeDecodeError:
                 msg = "Incorrectly encoded file, reopening with bytes to detect"
                 msg += " encoding"
                 logger.warning(msg)
                 f.close()
-                encoding = get_encoding(f.name)
+                encoding = get_encoding(f.name, sample_size=None)
         finally:
             if hasattr(f, "name"):  # otherwise we can't reopen it
                 f.close()
@@ -416,6 +922,25 @@ def get_file_encoding(f, encoding=None, bytes_error=False):
     return encoding
 
 
+def _is_ascii_compatible(encoding):
+    """Determine if an encoding can be decoded from any line boundary
+
+    Examples:
+        >>> _is_ascii_compatible('latin-1')
+        True
+        >>> _is_ascii_compatible('utf-16')
+        False
+    """
+    text = 'a,"b"\n'
+
+    try:
+        compatible = text.encode("ascii").decode(encoding) == text
+    except (LookupError, UnicodeError):
+        compatible = False
+
+    return compatible
+
+
 def sanitize_file_encoding(encoding):
     if encoding == "Windows-1252" and os.name == "posix":
         # based on my testing, when excel for mac saves a csv file as
@@ -448,7 +973,9 @@ def reopen(f, encoding):
         decoded_f = open(f.name, encoding=sanitized_encoding)
     except AttributeError:
         f.seek(0)
-        decoded_f = iterdecode(f, sanitized_encoding)
+        decoded_f = Reencoder(f, sanitized_encoding, decode=True, remove_BOM=True)
+    else:
+        skip_bom(decoded_f)
 
     return decoded_f
 
@@ -537,18 +1064,35 @@ def read_any(filepath, reader, mode="r", *args, **kwargs):
     """
     if hasattr(filepath, "read"):
         if is_binary(filepath):
+            # `_read_any` reopens binary files (without the BOM) as text
             kwargs.setdefault("encoding", ENCODING)
+            bomless = True
         else:
             kwargs.pop("encoding", None)
+            bomless = skip_bom(filepath)
 
-        for line in _read_any(filepath, reader, args, **kwargs):
-            yield remove_bom(line, BOM)
+        records = _read_any(filepath, reader, args, **kwargs)
     else:
         encoding = None if "b" in mode else kwargs.pop("encoding", ENCODING)
 
-        with open(filepath, mode, encoding=encoding) as f:
-            for line in _read_any(f, reader, args, **kwargs):
-                yield remove_bom(line, BOM)
+        if encoding and set(mode) <= set("rtU"):
+            # decode in place so a bad encoding doesn't restart the reader
+            f = Redecoder(filepath, encoding, remove_BOM=True)
+        else:
+            f = open(filepath, mode, encoding=encoding)
+
+        bomless = isinstance(f, Redecoder) or is_binary(f) or skip_bom(f)
+        records = _read_any(f, reader, args, **kwargs)
+
+    try:
+        if bomless:
+            yield from records
+        else:
+            # we couldn't skip the BOM in the file so remove it from each record
+            yield from map(partial(remove_bom, bom=BOM), records)
+    finally:
+        if not hasattr(filepath, "read"):
+            f.close()
 
 
 def _read_csv(f, header=None, has_header=True, first_col=0, **kwargs):
@@ -595,71 +1139,641 @@ def _read_csv(f, header=None, has_header=True, first_col=0, **kwargs):
             yield row
 
 
-def read_mdb(filepath, table=None, **kwargs):
-    """Reads an MS Access file
+def _limit_rows(rows, last_row=None):
+    """Helps limit an iterable of rows to a given last row.
 
     Args:
-        filepath (str): The mdb file path.
-        table (str): The table to load (default: None, the first found table).
-        kwargs (dict): Keyword arguments that are passed to the csv reader.
+        rows (Iter[scalar]): The rows to limit.
+        last_row (int): Last row, use a negative value to count from the end
+            (zero based, default: None, i.e., all).
 
-    Kwargs:
-        sanitize (bool): Underscorify and lowercase field names
-            (default: False).
+    Yields:
+        scalar: A row.
 
-        dedupe (bool): Deduplicate field names (default: False).
-        ignorecase (bool): Treat file name as case insensitive (default: true).
+    Examples:
+        >>> list(_limit_rows(range(5), 2))
+        [0, 1]
+        >>> list(_limit_rows(range(5), -2))
+        [0, 1, 2]
+    """
+    if last_row and last_row > 0:
+        yield from it.islice(rows, last_row)
+    elif last_row:
+        q = deque()
+
+        for row in rows:
+            q.append(row)
+
+            if len(q) > abs(last_row):
+                yield q.popleft()
+    else:
+        yield from rows
+
+
+def _read_csv_columns(f, header, first_col=0, batch_size=None, **kwargs):
+    """Helps read a csv file into batches of columns.
+
+    Args:
+        f (obj): The csv file like object.
+        header (Seq[str]): Sequence of column names.
+
+    Kwargs:
+        first_col (int): The first column (default: 0).
+        batch_size (int): Number of rows per batch (default: None, i.e., all).
+        last_row (int): Last row, use a negative value to count from the end
+            (zero based, default: None).
 
     Yields:
-        dict: A row of data whose keys are the field names.
+        dict: A batch of columns whose keys are the field names and whose
+            values are lists of the column's data.
 
-    Raises:
-        TypeError: If unable to read the db file.
+    See also:
+        `meza.io.read_csv`
+        `meza.io._read_csv`
 
     Examples:
-        >>> filepath = p.join(DATA_DIR, 'test.mdb')
-        >>> records = read_mdb(filepath, sanitize=True)
-        >>> expected = {
-        ...     'surname': 'Aaron',
-        ...     'forenames': 'William',
-        ...     'freedom': '07/03/60 00:00:00',
-        ...     'notes': 'Order of Court',
-        ...     'surname_master_or_father': '',
-        ...     'how_admitted': 'Redn.',
-        ...     'id_no': '1',
-        ...     'forenames_master_or_father': '',
-        ...     'remarks': '',
-        ...     'livery': '',
-        ...     'date_of_order_of_court': '06/05/60 00:00:00',
-        ...     'source_ref': 'MF 324'}
-        >>> first_row = next(records)
-        >>> (expected == first_row) if first_row else True
+        >>> f = StringIO('a,b,c\\n1,2,3\\n, ,\\n4,5,6\\n')
+        >>> next(f) == 'a,b,c\\n'
+        True
+        >>> batches = _read_csv_columns(f, ['a', 'b', 'c'], batch_size=1)
+        >>> next(batches) == {'a': ['1'], 'b': ['2'], 'c': ['3']}
+        True
+        >>> next(batches) == {'a': ['4'], 'b': ['5'], 'c': ['6']}
         True
     """
-    args = ["mdb-tables", "-1", filepath]
+    last_row = kwargs.pop("last_row", None)
+    header = (list(it.repeat("", first_col)) + header) if first_col else header
+    width = len(header)
 
-    # Check if 'mdb-tools' is installed on system
-    try:
-        check_output(args)
-    except OSError:
-        logger.error(
-            "You must install [mdbtools]"
-            "(http://sourceforge.net/projects/mdbtools/) in order to use "
-            "this function"
-        )
-        yield
-        return
-    except CalledProcessError:
-        raise TypeError(f"{filepath} is not readable by mdbtools")
+    # Like `csv.DictReader`, keep the last value of any duplicate field names
+    positions = {name: pos for pos, name in enumerate(header) if name}
+    names, idxs = list(positions), tuple(positions.values())
 
-    sanitize = kwargs.pop("sanitize", None)
-    dedupe = kwargs.pop("dedupe", False)
-    table = table or check_output(args).splitlines()[0]
-    pkwargs = {"stdout": PIPE, "bufsize": 1, "universal_newlines": True}
+    if len(idxs) > 1:
+        select = itemgetter(*idxs)
+    else:
+        select = lambda row: tuple(row[pos] for pos in idxs)
 
-    # https://stackoverflow.com/a/2813530/408556
-    # https://stackoverflow.com/a/17698359/408556
-    with Popen(["mdb-export", filepath, table], **pkwargs).stdout as pipe:
+    def gen_rows(reader):
+        for row in reader:
+            if len(row) < width:
+                row += it.repeat(None, width - len(row))
+
+            values = select(row)
+
+            # Remove empty rows
+            if any(map(str.strip, filter(None, values))):
+                yield values
+
+    rows = _limit_rows(gen_rows(csv.reader(f, **kwargs)), last_row)
+
+    for batch in ft.chunk(rows, batch_size):
+        yield dict(zip(names, map(list, zip(*batch))))
+
+
+def _get_newline(mm):
+    """Helps determine the line terminator of a memory mapped file.
+
+    Args:
+        mm (obj): The memory mapped file.
+
+    Returns:
+        bytes: The line terminator, either b'\\n' (for '\\n' and '\\r\\n') or
+            b'\\r'.
+
+    Examples:
+        >>> _get_newline(b'a,b\\r\\n1,2\\r\\n')
+        b'\\n'
+        >>> _get_newline(b'a,b\\r1,2\\r')
+        b'\\r'
+    """
+    cr, lf = mm.find(b"\r"), mm.find(b"\n")
+    return b"\r" if lf < 0 <= cr or -1 < cr < lf - 1 else b"\n"
+
+
+def _index_rows(mm, quote=b'"', offsets=None, blocksize=2 ** 20):
+    """Helps build an index of the byte offsets at which each csv row ends.
+
+    Newlines within quoted fields don't end a row, i.e., a line only ends a row
+    if the running count of quote characters is even.
+
+    Args:
+        mm (obj): The memory mapped file.
+        quote (bytes): The quote character (default: b'"').
+        offsets (obj): An array to extend (default: None, i.e., a new array).
+        blocksize (int): Number of bytes to scan at a time (default: 1MiB).
+
+    Returns:
+        obj: An array of byte offsets.
+
+    Examples:
+        >>> _index_rows(b'a,b\\n1,"x\\ny"\\n2,z')
+        array('Q', [4, 12, 15])
+    """
+    offsets = array("Q") if offsets is None else offsets
+    newline, size = _get_newline(mm), len(mm)
+    pos, quoted = 0, False
+
+    while pos < size:
+        end = mm.rfind(newline, pos, pos + blocksize) + 1
+
+        if not end:
+            end = mm.find(newline, pos + blocksize) + 1 or size
+
+        block = mm[pos:end]
+        lines = block.split(newline)
+        tail = lines.pop()
+
+        if quoted or quote in block:
+            for line in lines:
+                pos += len(line) + 1
+                quoted ^= line.count(quote) % 2 == 1
+
+                if not quoted:
+                    offsets.append(pos)
+        else:
+            # Fast path: every line ends a row
+            ends = it.accumulate(map((1).__add__, map(len, lines)), initial=pos)
+            offsets.extend(it.islice(ends, 1, None))
+
+        if tail:
+            offsets.append(size)
+
+        pos = end
+
+    return offsets
+
+
+def _load_index(idxpath, meta):
+    """Helps load a persisted csv row index if it is still valid"""
+    offsets = array("Q")
+
+    try:
+        with open(idxpath, "rb") as f:
+            if json.loads(f.readline()) == meta:
+                offsets.frombytes(f.read())
+    except (OSError, ValueError):
+        pass
+
+    if offsets and offsets[-1] != meta["size"]:
+        # the sidecar wasn't completely written
+        offsets = array("Q")
+
+    return offsets
+
+
+def index_csv(filepath, quotechar='"', sidecar=False):
+    """Builds a quote aware index of the byte offsets of each row of a csv file.
+
+    The file is memory mapped and scanned once. Newlines within quoted fields
+    are skipped, so the index counts csv rows rather than lines. Quotes within
+    a quoted field must be escaped by doubling them (the csv default), and the
+    file encoding must be ASCII compatible (e.g., utf-8 or latin-1).
+
+    Args:
+        filepath (str): The csv file path.
+        quotechar (str): Quote character (default: '"').
+        sidecar (Union[bool, str]): Persist the index to (and load it from) a
+            sidecar file. If `True`, the sidecar is the file path with '.idx'
+            appended. A sidecar is rebuilt whenever the file's size or
+            modification time changes. If the sidecar can't be written, the
+            index is only kept in memory (default: False).
+
+    Returns:
+        obj: An array of n + 1 byte offsets for a file of n rows. Row i spans
+            offsets[i] to offsets[i + 1].
+
+    See also:
+        `meza.io.read_csv`
+
+    Examples:
+        >>> filepath = p.join(DATA_DIR, 'test.csv')
+        >>> offsets = index_csv(filepath)
+        >>> len(offsets) - 1
+        6
+        >>> offsets[:3]
+        array('Q', [0, 47, 96])
+    """
+    stat = os.stat(filepath)
+    idxpath = "%s.idx" % filepath if sidecar is True else sidecar
+
+    meta = {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "quotechar": quotechar,
+        "byteorder": sys.byteorder,
+    }
+
+    offsets = _load_index(idxpath, meta) if idxpath else None
+
+    if not offsets:
+        offsets = array("Q", [0])
+
+        if stat.st_size:
+            with open(filepath, "rb") as f:
+                with mmap(f.fileno(), 0, access=ACCESS_READ) as mm:
+                    _index_rows(mm, quotechar.encode(ENCODING), offsets)
+
+        if idxpath:
+            try:
+                with open(idxpath, "wb") as f:
+                    f.write(json.dumps(meta).encode(ENCODING) + b"\n")
+                    offsets.tofile(f)
+            except OSError as err:
+                logger.warning("Unable to save the csv index to %s: %s", idxpath, err)
+
+    return offsets
+
+
+def _get_dialect(dialect="excel", **kwargs):
+    """Helps resolve the dialect a csv reader would use
+
+    Examples:
+        >>> _get_dialect(delimiter=';', sanitize=True).delimiter
+        ';'
+        >>> _get_dialect('excel-tab').delimiter == '\\t'
+        True
+    """
+    return csvReader([], dialect, **csv.use_keys_from(kwargs, csv.FMTKEYS)).dialect
+
+
+@lru_cache(maxsize=64)
+def _get_decodable_encoding(filepath, size, mtime, encoding):
+    """Helps find an encoding that decodes the entire file. The `size` and
+    `mtime` args are only used as cache keys."""
+    decoder = getincrementaldecoder(encoding)()
+
+    try:
+        with open(filepath, "rb") as f:
+            for block in iter(partial(f.read, 2 ** 20), b""):
+                decoder.decode(block)
+
+        decoder.decode(b"", True)
+    except UnicodeDecodeError as err:
+        logger.warning("%s can't be decoded as %s: %s", filepath, encoding, err)
+        detected = get_encoding(filepath, sample_size=None)
+
+        if not detected:
+            raise
+
+        encoding = sanitize_file_encoding(detected)
+        logger.debug("detected encoding: %s", encoding)
+
+    return encoding
+
+
+def get_decodable_encoding(filepath, encoding=ENCODING):
+    """Checks that an encoding decodes an entire file, and detects one that
+    does if it doesn't. Results are cached by path, size, and modification
+    time.
+
+    Args:
+        filepath (str): The file path.
+        encoding (str): The encoding to check (default: ENCODING constant).
+
+    Returns:
+        str: The encoding.
+
+    Raises:
+        UnicodeDecodeError: If unable to detect an encoding.
+
+    See also:
+        `meza.io.get_encoding`
+
+    Examples:
+        >>> filepath = p.join(DATA_DIR, 'latin1.csv')
+        >>> get_decodable_encoding(filepath)
+        'ISO-8859-1'
+        >>> get_decodable_encoding(p.join(DATA_DIR, 'test.csv'))
+        'utf-8'
+    """
+    stat = os.stat(filepath)
+    args = (filepath, stat.st_size, stat.st_mtime_ns, encoding)
+    return _get_decodable_encoding(*args)
+
+
+def _translate_newlines(text):
+    """Helps translate newlines the same way a file opened in text mode does
+
+    Examples:
+        >>> _translate_newlines('a\\r\\nb\\rc\\n') == 'a\\nb\\nc\\n'
+        True
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    return text
+
+
+class IndexedRows(object):
+    """An iterator over a range of rows of a memory mapped csv file.
+
+    Each row is decoded (and its newlines translated as in text mode) on demand
+    from its offsets, so no other row of the file is read or parsed.
+    """
+
+    def __init__(self, mm, offsets, rows, header=None, encoding=ENCODING):
+        """Initialization method.
+
+        Args:
+            mm (obj): The memory mapped file.
+            offsets (obj): The row index (see `meza.io.index_csv`).
+            rows (range): The rows to iterate over.
+            header (int): The header row, yielded before `rows`
+                (default: None).
+
+            encoding (str): File encoding (default: ENCODING constant).
+
+        Examples:
+            >>> mm = b'a,b\\n1,"x\\ny"\\n2,z\\n'
+            >>> rows = IndexedRows(mm, _index_rows(mm, offsets=[0]), range(1, 3))
+            >>> list(rows) == ['1,"x\\ny"\\n', '2,z\\n']
+            True
+        """
+        self.mm = mm
+        self.offsets = offsets
+        self.rows = rows
+        self.header = header
+        self.encoding = encoding
+        self.seek(0, header is not None)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = next(self.positions)
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return _translate_newlines(self.mm[start:end].decode(self.encoding))
+
+    def seek(self, pos, with_header=False):
+        """Repositions the iterator at the first row.
+
+        Args:
+            pos (int): Ignored, rows can only be rewound to the beginning.
+            with_header (bool): Yield the header row first (default: False).
+        """
+        head = [self.header] if with_header else []
+        self.positions = it.chain(head, iter(self.rows))
+
+
+def _get_spans(offsets, rows):
+    """Helps convert a range of rows into the byte spans that contain them
+
+    Examples:
+        >>> _get_spans([0, 4, 9, 12, 20], range(1, 4))
+        [(4, 20)]
+        >>> _get_spans([0, 4, 9, 12, 20], range(3, 0, -2))
+        [(12, 20), (4, 9)]
+    """
+    if rows.step == 1:
+        spans = [(offsets[rows.start], offsets[rows.stop])]
+    else:
+        spans = [(offsets[row], offsets[row + 1]) for row in rows]
+
+    return spans
+
+
+def _read_csv_chunk(task):
+    """Helps parse the rows of a csv file within the given byte spans.
+
+    Args:
+        task (tuple): The file path, byte spans, encoding, header, first
+            column, and csv reader kwargs.
+
+    Returns:
+        List[dict]: The csv records.
+
+    See also:
+        `meza.io._read_csv`
+        `meza.io.read_csv`
+    """
+    filepath, spans, encoding, header, first_col, kwargs = task
+
+    with open(filepath, "rb") as f:
+        chunks = []
+
+        for start, end in spans:
+            f.seek(start)
+            chunks.append(f.read(end - start))
+
+    text = _translate_newlines(b"".join(chunks).decode(encoding))
+    f = StringIO(text)
+    return list(_read_csv(f, header, False, first_col=first_col, **kwargs))
+
+
+def _read_csv_parallel(filepath, f, header, first_col=0, **kwargs):
+    """Helps read the remaining rows of an indexed csv file in parallel.
+
+    The rows are split into chunks aligned to row boundaries (including rows
+    with quoted newlines), which worker processes parse independently. The
+    records are yielded in the original order. The workers decode their rows
+    with `f.encoding`, which `meza.io._read_indexed_csv` has already checked
+    (or detected) for the entire file.
+
+    Args:
+        filepath (str): The csv file path.
+        f (obj): The `meza.io.IndexedRows` positioned after the header.
+        header (Seq[str]): Sequence of column names.
+        first_col (int): The first column (default: 0).
+        kwargs (dict): Keyword arguments that are passed to the csv reader.
+
+    Kwargs:
+        workers (int): Number of worker processes (default: `os.cpu_count()`).
+        chunksize (int): Number of rows per chunk (default: 10000).
+        max_inflight (int): Maximum number of chunks parsed ahead
+            (default: 2 * workers).
+
+    Returns:
+        Iter[dict]: The csv records.
+
+    See also:
+        `meza.io.read_csv`
+        `meza.fntools.pmap`
+    """
+    workers = kwargs.pop("workers", None)
+    chunksize = kwargs.pop("chunksize", None) or 10000
+    max_inflight = kwargs.pop("max_inflight", None)
+    rows = f.rows
+
+    def gen_tasks():
+        for pos in range(0, len(rows), chunksize):
+            chunk = rows[slice(pos, pos + chunksize)]
+            spans = _get_spans(f.offsets, chunk)
+            yield (filepath, spans, f.encoding, header, first_col, kwargs)
+
+    chunks = ft.pmap(_read_csv_chunk, gen_tasks(), workers, max_inflight)
+    return it.chain.from_iterable(chunks)
+
+
+def _check_indexable(filepath, **kwargs):
+    """Helps check that a csv file can be read via a row index.
+
+    Raises:
+        ValueError: If `filepath` isn't a file path, or the dialect quotes
+            fields in a way the row index doesn't support.
+    """
+    if not isinstance(filepath, (str, os.PathLike)):
+        msg = "`indexed` and `workers` require a file path, not a file like object."
+        raise ValueError(msg)
+
+    dialect = _get_dialect(**kwargs)
+
+    if dialect.quoting == QUOTE_NONE or dialect.escapechar:
+        msg = "`indexed` can't be used with `QUOTE_NONE` or an `escapechar`."
+        raise ValueError(msg)
+
+
+def _read_csv_records(filepath, f, header, first_col=0, **kwargs):
+    """Helps read the records of a csv file positioned after its header.
+
+    Args:
+        filepath (str): The csv file path (only used with `workers`).
+        f (obj): The csv file like object.
+        header (Seq[str]): Sequence of column names.
+        first_col (int): The first column (default: 0).
+        kwargs (dict): Keyword arguments that are passed to the csv reader.
+
+    Kwargs:
+        columnar (bool): Yield batches of columns, see
+            `meza.io._read_csv_columns` (default: False).
+
+        workers (int): Number of worker processes, see
+            `meza.io._read_csv_parallel` (default: None).
+
+    Returns:
+        Iter[dict]: The csv records (or batches of columns).
+
+    See also:
+        `meza.io.read_csv`
+    """
+    if kwargs.pop("columnar", False):
+        records = _read_csv_columns(f, header, first_col, **kwargs)
+    elif kwargs.get("workers"):
+        records = _read_csv_parallel(filepath, f, header, first_col, **kwargs)
+    else:
+        records = _read_csv(f, header, False, first_col=first_col, **kwargs)
+
+    return records
+
+
+def _read_indexed_csv(filepath, reader, rows=None, last_row=None, **kwargs):
+    """Helps read a csv file using a row index.
+
+    Args:
+        filepath (str): The csv file path.
+        reader (func): The csv reader function.
+        rows (slice): The data rows to read (default: None, i.e., all).
+        last_row (int): Last data row, use a negative value to count from the
+            end. Ignored if `rows` is given (zero based, default: None).
+
+    Kwargs:
+        encoding (str): File encoding.
+        first_row (int): The header row, or first row if the file has no
+            header (zero based, default: 0).
+
+        has_header (bool): Has header row (default: True).
+        sidecar (Union[bool, str]): Persist the index in a sidecar file
+            (default: False).
+
+    Yields:
+        dict: A csv record.
+
+    See also:
+        `meza.io.read_csv`
+        `meza.io.index_csv`
+    """
+    encoding = get_decodable_encoding(
+        filepath, kwargs.pop("encoding", None) or ENCODING
+    )
+    first_row = kwargs.pop("first_row", 0)
+    quotechar = _get_dialect(**kwargs).quotechar
+    offsets = index_csv(filepath, quotechar, kwargs.pop("sidecar", False))
+    nrows = len(offsets) - 1
+
+    if first_row >= nrows:
+        return
+
+    has_header = kwargs.get("has_header", True)
+    rows = rows or slice(None, last_row or None)
+    data = range(first_row + bool(has_header), nrows)[rows]
+    header = first_row if has_header else None
+    utf8 = lookup(encoding).name.startswith("utf-8")
+
+    with open(filepath, "rb") as f:
+        with mmap(f.fileno(), 0, access=ACCESS_READ) as mm:
+            if utf8 and mm.find(BOM_UTF8, 0, len(BOM_UTF8)) == 0:
+                # start the first row after the BOM (`offsets` is our own copy)
+                offsets[0] = len(BOM_UTF8)
+
+            f = IndexedRows(mm, offsets, data, header, encoding)
+            yield from reader(f, **kwargs)
+
+
+def read_mdb(filepath, table=None, **kwargs):
+    """Reads an MS Access file
+
+    Args:
+        filepath (str): The mdb file path.
+        table (str): The table to load (default: None, the first found table).
+        kwargs (dict): Keyword arguments that are passed to the csv reader.
+
+    Kwargs:
+        sanitize (bool): Underscorify and lowercase field names
+            (default: False).
+
+        dedupe (bool): Deduplicate field names (default: False).
+        ignorecase (bool): Treat file name as case insensitive (default: true).
+
+    Yields:
+        dict: A row of data whose keys are the field names.
+
+    Raises:
+        TypeError: If unable to read the db file.
+
+    Examples:
+        >>> filepath = p.join(DATA_DIR, 'test.mdb')
+        >>> records = read_mdb(filepath, sanitize=True)
+        >>> expected = {
+        ...     'surname': 'Aaron',
+        ...     'forenames': 'William',
+        ...     'freedom': '07/03/60 00:00:00',
+        ...     'notes': 'Order of Court',
+        ...     'surname_master_or_father': '',
+        ...     'how_admitted': 'Redn.',
+        ...     'id_no': '1',
+        ...     'forenames_master_or_father': '',
+        ...     'remarks': '',
+        ...     'livery': '',
+        ...     'date_of_order_of_court': '06/05/60 00:00:00',
+        ...     'source_ref': 'MF 324'}
+        >>> first_row = next(records)
+        >>> (expected == first_row) if first_row else True
+        True
+    """
+    args = ["mdb-tables", "-1", filepath]
+
+    # Check if 'mdb-tools' is installed on system
+    try:
+        check_output(args)
+    except OSError:
+        logger.error(
+            "You must install [mdbtools]"
+            "(http://sourceforge.net/projects/mdbtools/) in order to use "
+            "this function"
+        )
+        yield
+        return
+    except CalledProcessError:
+        raise TypeError(f"{filepath} is not readable by mdbtools")
+
+    sanitize = kwargs.pop("sanitize", None)
+    dedupe = kwargs.pop("dedupe", False)
+    table = table or check_output(args).splitlines()[0]
+    pkwargs = {"stdout": PIPE, "bufsize": 1, "universal_newlines": True}
+
+    # https://stackoverflow.com/a/2813530/408556
+    # https://stackoverflow.com/a/17698359/408556
+    with Popen(["mdb-export", filepath, table], **pkwargs).stdout as pipe:
         first_line = StringIO(str(pipe.readline()))
         names = next(csv.reader(first_line, **kwargs))
         uscored = ft.underscorify(names) if sanitize else names
@@ -781,17 +1895,55 @@ def read_csv(filepath, mode="r", **kwargs):
         sanitize (bool): Underscorify and lowercase field names
             (default: False).
 
-        dedupe (bool): Deduplicate field names (default: False).
+        dedupe (bool): Deduplicate field names (default: False).
+        columnar (bool): Yield batches of columns instead of rows
+            (default: False).
+
+        batch_size (int): Number of rows per batch of columns. Implies
+            `columnar` (default: None, i.e., all rows in a single batch).
+
+        indexed (bool): Read the file via a memory mapped row index (see
+            `meza.io.index_csv`), so that `first_row`, `last_row`, and `rows`
+            seek directly to the requested rows instead of parsing the ones
+            before them. `first_row` and `last_row` then count csv rows
+            (including empty ones) rather than lines and records. If the file
+            can't be decoded with `encoding`, its encoding is detected.
+            Requires a file path (not a file like object) and a dialect whose
+            quotes are escaped by doubling them, i.e., neither `QUOTE_NONE`
+            nor an `escapechar` (default: False).
+
+        rows (slice): The data rows to read, e.g., `slice(1000, 1010)`.
+            Requires `indexed` (default: None, i.e., all).
+
+        sidecar (Union[bool, str]): Persist the row index in a sidecar file.
+            Requires `indexed` (default: False).
+
+        workers (int): Number of worker processes to parse chunks of rows
+            with. The records are yielded in order. Implies `indexed` and
+            can't be combined with `columnar` (default: None, i.e., parse in
+            the current process).
+
+        chunksize (int): Number of rows per chunk when using `workers`
+            (default: 10000).
+
+        max_inflight (int): Maximum number of chunks parsed ahead when using
+            `workers` (default: 2 * workers).
 
     Yields:
-        dict: A row of data whose keys are the field names.
+        dict: A row of data whose keys are the field names. If `columnar`, a
+            batch of columns whose keys are the field names and whose values
+            are lists of the column's data.
 
     Raises:
         NotFound: If unable to find the resource.
+        ValueError: If `workers` is combined with `columnar`, or `indexed`
+            (or `workers`) with a file like object or a dialect the row index
+            doesn't support.
 
     See also:
         `meza.io.read_any`
         `meza.io._read_csv`
+        `meza.io._read_csv_columns`
 
     Examples:
         >>> filepath = p.join(DATA_DIR, 'test.csv')
@@ -807,6 +1959,16 @@ def read_csv(filepath, mode="r", **kwargs):
         >>> records = read_csv(filepath, sanitize=True, dialect='excel-tab')
         >>> next(records) == expected
         True
+        >>> filepath = p.join(DATA_DIR, 'test.csv')
+        >>> batches = read_csv(filepath, sanitize=True, batch_size=2)
+        >>> next(batches)['some_value'] == ['234', '100']
+        True
+        >>> records = read_csv(filepath, indexed=True, rows=slice(2, 3))
+        >>> next(records)['Some Value'] == '0.44'
+        True
+        >>> records = read_csv(filepath, sanitize=True, workers=2, chunksize=2)
+        >>> next(records) == expected
+        True
     """
 
     def reader(f, **kwargs):
@@ -845,9 +2007,30 @@ def read_csv(filepath, mode="r", **kwargs):
         if not (has_header or custom_header):
             header = ["column_%i" % (n + 1) for n in range(len(names))]
 
-        return _read_csv(f, header, False, first_col=first_col, **kwargs)
+        rkwargs = pr.merge([kwargs, okwargs])
+        return _read_csv_records(filepath, f, header, first_col, **rkwargs)
 
-    return read_any(filepath, reader, mode, **kwargs)
+    batch_size = kwargs.pop("batch_size", None)
+    columnar = kwargs.pop("columnar", False) or bool(batch_size)
+    pkeys = ["workers", "chunksize", "max_inflight"]
+    pkwargs = {key: kwargs.pop(key, None) for key in pkeys}
+
+    if pkwargs["workers"] and columnar:
+        raise ValueError("`workers` can't be combined with `columnar`.")
+
+    indexed = kwargs.pop("indexed", False) or bool(pkwargs["workers"])
+    okwargs = pkwargs if pkwargs["workers"] else {}
+
+    if indexed:
+        _check_indexable(filepath, **kwargs)
+
+    if columnar:
+        # `last_row` counts rows, not batches, so `read_any` can't apply it
+        last_row = None if indexed else kwargs.pop("last_row", None)
+        okwargs = {"columnar": True, "batch_size": batch_size, "last_row": last_row}
+
+    read = _read_indexed_csv if indexed else partial(read_any, mode=mode)
+    return read(filepath, reader, **kwargs)
 
 
 def read_tsv(filepath, mode="r", **kwargs):
@@ -870,15 +2053,50 @@ def read_tsv(filepath, mode="r", **kwargs):
             (default: False).
 
         dedupe (bool): Deduplicate field names (default: False).
+        columnar (bool): Yield batches of columns instead of rows
+            (default: False).
+
+        batch_size (int): Number of rows per batch of columns. Implies
+            `columnar` (default: None, i.e., all rows in a single batch).
+
+        indexed (bool): Read the file via a memory mapped row index (see
+            `meza.io.index_csv`), so that `first_row`, `last_row`, and `rows`
+            seek directly to the requested rows instead of parsing the ones
+            before them. `first_row` and `last_row` then count csv rows
+            (including empty ones) rather than lines and records. If the file
+            can't be decoded with `encoding`, its encoding is detected.
+            Requires a file path (not a file like object) and a dialect whose
+            quotes are escaped by doubling them, i.e., neither `QUOTE_NONE`
+            nor an `escapechar` (default: False).
+
+        rows (slice): The data rows to read, e.g., `slice(1000, 1010)`.
+            Requires `indexed` (default: None, i.e., all).
+
+        sidecar (Union[bool, str]): Persist the row index in a sidecar file.
+            Requires `indexed` (default: False).
+
+        workers (int): Number of worker processes to parse chunks of rows
+            with. The records are yielded in order. Implies `indexed` and
+            can't be combined with `columnar` (default: None, i.e., parse in
+            the current process).
+
+        chunksize (int): Number of rows per chunk when using `workers`
+            (default: 10000).
+
+        max_inflight (int): Maximum number of chunks parsed ahead when using
+            `workers` (default: 2 * workers).
 
     Yields:
-        dict: A row of data whose keys are the field names.
+        dict: A row of data whose keys are the field names. If `columnar`, a
+            batch of columns whose keys are the field names and whose values
+            are lists of the column's data.
 
     Raises:
         NotFound: If unable to find the resource.
 
     See also:
         `meza.io.read_any`
+        `meza.io.read_csv`
 
     Examples:
         >>> filepath = p.join(DATA_DIR, 'test.tsv')
@@ -960,35 +2178,33 @@ def read_fixed_fmt(filepath, widths=None, mode="r", **kwargs):
     return read_any(filepath, reader, mode, **kwargs)
 
 
-def sanitize_sheet(sheet, mode, first_col=0, **kwargs):
-    """Formats content from xls/xslx files as strings according to its cell
-    type.
+def get_cell_sanitizer(mode, **kwargs):
+    """Creates a function that formats an xls/xlsx cell as a string according
+    to its cell type.
 
     Args:
-        sheet (obj): `xlrd` sheet object.
         mode (str): `xlrd` workbook datemode property.
         kwargs (dict): Keyword arguments
-        first_col (int): The first column (default: 0).
 
     Kwargs:
         date_format (str): `strftime()` date format.
         dt_format (str): `strftime()` datetime format.
         time_format (str): `strftime()` time format.
 
-    Yields:
-        Tuple[int, str]: A tuple of (row_number, value).
+    Returns:
+        func: A function that takes a cell's type and value.
+
+    See also:
+        `meza.io.sanitize_sheet`
 
     Examples:
-        >>> filepath = p.join(DATA_DIR, 'test.xls')
-        >>> book = xlrd.open_workbook(filepath)
-        >>> sheet = book.sheet_by_index(0)
-        >>> sheet.row_values(1) == [
-        ...     30075.0, 'Iñtërnâtiônàližætiøn', 234.0, 'Ādam', ' ']
-        True
-        >>> sanitized = sanitize_sheet(sheet, book.datemode)
-        >>> [v for i, v in sanitized if i == 1] == [
-        ...     '1982-05-04', 'Iñtërnâtiônàližætiøn', '234.0', 'Ādam', ' ']
-        True
+        >>> sanitize = get_cell_sanitizer(0)
+        >>> sanitize(XL_CELL_DATE, 30075.0)
+        '1982-05-04'
+        >>> sanitize(XL_CELL_DATE, 0.5)
+        '12:00:00'
+        >>> sanitize(XL_CELL_BOOLEAN, 1)
+        'True'
     """
     date_format = kwargs.get("date_format", "%Y-%m-%d")
     dt_format = kwargs.get("dt_format", "%Y-%m-%d %H:%M:%S")
@@ -999,6 +2215,7 @@ def sanitize_sheet(sheet, mode, first_col=0, **kwargs):
         args = xlrd.xldate_as_tuple(value, mode)[3:]
         return time(*args).strftime(time_format)
 
+    identity = lambda v: v
     switch = {
         XL_CELL_DATE: lambda v: xl2dt(v, mode).strftime(date_format),
         "datetime": lambda v: xl2dt(v, mode).strftime(dt_format),
@@ -1009,20 +2226,328 @@ def sanitize_sheet(sheet, mode, first_col=0, **kwargs):
         XL_CELL_ERROR: lambda v: xlrd.error_text_from_code[v],
     }
 
+    def sanitize(_type, value):
+        if _type == XL_CELL_DATE and value < 1:
+            _type = "time"
+        elif _type == XL_CELL_DATE and not value.is_integer:
+            _type = "datetime"
+
+        return switch.get(_type, identity)(value)
+
+    return sanitize
+
+
+def get_row_sanitizer(mode, maxsize=4096, **kwargs):
+    """Creates a function that formats an entire row of xls/xlsx cells as
+    strings according to their cell types.
+
+    Text cells are passed through untouched (rows made up of only text cells
+    are simply copied), numbers are converted with `str`, and all other cell
+    types (most notably date serials, which tend to repeat down a column) are
+    memoized.
+
+    Args:
+        mode (str): `xlrd` workbook datemode property.
+        maxsize (int): Maximum number of memoized values per cell type
+            (default: 4096).
+        kwargs (dict): Keyword arguments
+
+    Kwargs:
+        date_format (str): `strftime()` date format.
+        dt_format (str): `strftime()` datetime format.
+        time_format (str): `strftime()` time format.
+
+    Returns:
+        func: A function that takes a row's cell types and values and returns
+            a list of strings.
+
+    See also:
+        `meza.io.get_cell_sanitizer`
+
+    Examples:
+        >>> sanitize_row = get_row_sanitizer(0)
+        >>> types = [XL_CELL_DATE, XL_CELL_TEXT, XL_CELL_NUMBER, XL_CELL_EMPTY]
+        >>> sanitize_row(types, [30075.0, 'Ādam', 234.0, ''])
+        ['1982-05-04', 'Ādam', '234.0', '']
+        >>> sanitize_row([XL_CELL_TEXT, XL_CELL_TEXT], ['a', 'b'])
+        ['a', 'b']
+    """
+    sanitize = get_cell_sanitizer(mode, **kwargs)
+    memoize = lru_cache(maxsize=maxsize)
+    switch = {t: memoize(partial(sanitize, t)) for t in range(XL_CELL_BLANK + 1)}
+    switch[XL_CELL_NUMBER] = str
+
+    def sanitize_row(types, values):
+        if types.count(XL_CELL_TEXT) == len(types):
+            return list(values)
+
+        return [v if t == XL_CELL_TEXT else switch[t](v) for t, v in zip(types, values)]
+
+    return sanitize_row
+
+
+def sanitize_sheet(sheet, mode, first_col=0, **kwargs):
+    """Formats content from xls/xslx files as strings according to its cell
+    type.
+
+    Args:
+        sheet (obj): `xlrd` sheet object.
+        mode (str): `xlrd` workbook datemode property.
+        kwargs (dict): Keyword arguments
+        first_col (int): The first column (default: 0).
+
+    Kwargs:
+        date_format (str): `strftime()` date format.
+        dt_format (str): `strftime()` datetime format.
+        time_format (str): `strftime()` time format.
+
+    Yields:
+        Tuple[int, str]: A tuple of (row_number, value).
+
+    See also:
+        `meza.io.get_row_sanitizer`
+
+    Examples:
+        >>> filepath = p.join(DATA_DIR, 'test.xls')
+        >>> book = xlrd.open_workbook(filepath)
+        >>> sheet = book.sheet_by_index(0)
+        >>> sheet.row_values(1) == [
+        ...     30075.0, 'Iñtërnâtiônàližætiøn', 234.0, 'Ādam', ' ']
+        True
+        >>> sanitized = sanitize_sheet(sheet, book.datemode)
+        >>> [v for i, v in sanitized if i == 1] == [
+        ...     '1982-05-04', 'Iñtërnâtiônàližætiøn', '234.0', 'Ādam', ' ']
+        True
+    """
+    sanitize_row = get_row_sanitizer(mode, **kwargs)
+
     for i in range(sheet.nrows):
         types = sheet.row_types(i)[first_col:]
         values = sheet.row_values(i)[first_col:]
 
-        for _type, value in zip(types, values):
-            if _type == XL_CELL_DATE and value < 1:
-                _type = "time"
-            elif _type == XL_CELL_DATE and not value.is_integer:
-                _type = "datetime"
+        for value in sanitize_row(types, values):
+            yield (i, value)
+
+
+@lru_cache(maxsize=None)
+def _get_xlsx_col(letters):
+    """Helps convert the letters of an xlsx cell name into a column index
+
+    Examples:
+        >>> _get_xlsx_col('A'), _get_xlsx_col('AB'), _get_xlsx_col('$XFD')
+        (0, 27, 16383)
+    """
+    col = 0
+
+    for letter in letters.replace("$", ""):
+        col = col * 26 + ord(letter) - 64
+
+    return col - 1
+
+
+def _read_xlsx_cell(cell, book):
+    """Helps read an xlsx cell the same way `xlrd` does.
+
+    Args:
+        cell (obj): The `c` element.
+        book (obj): The `xlrd` book holding the shared strings and styles.
+
+    Returns:
+        Tuple[int, scalar]: The cell type and value, or `(None, None)` for a
+            cell without a value.
+    """
+    _type, value = cell.get("t", "n"), None
+
+    for child in cell:
+        if child.tag == V_TAG and _type == "str":
+            value = cooked_text(None, child)
+        elif child.tag == V_TAG:
+            value = child.text
+        elif child.tag == IS_TAG:
+            value = get_text_from_si_or_is(None, child)
+
+    if _type == "n" and value:
+        xf_index = int(cell.get("s", "0"))
+        result = (book._xf_index_to_xl_type_map[xf_index], float(value))
+    elif _type == "s" and value:
+        result = (XL_CELL_TEXT, book._sharedstrings[int(value)])
+    elif _type in {"str", "inlineStr"} and (value or _type == "str"):
+        result = (XL_CELL_TEXT, value)
+    elif _type == "b":
+        result = (XL_CELL_BOOLEAN, cnv_xsd_boolean(value))
+    elif _type == "e":
+        result = (XL_CELL_ERROR, error_code_from_text[value or "#N/A"])
+    else:
+        result = (None, None)
+
+    return result
+
+
+def _read_xlsx_row(row, book):
+    """Helps read the cell types and values of an xlsx row.
+
+    Like `xlrd` with `ragged_rows`, the row ends at its last cell with a value
+    and any missing cells before that are empty.
+
+    Args:
+        row (obj): The `row` element.
+        book (obj): The `xlrd` book holding the shared strings and styles.
+
+    Returns:
+        Tuple[List[int], List[scalar]]: The cell types and values.
+    """
+    types, values, col = [], [], -1
+
+    for cell in row:
+        name = cell.get("r")
+        col = _get_xlsx_col(name.rstrip("0123456789")) if name else col + 1
+        _type, value = _read_xlsx_cell(cell, book)
+
+        if _type is None:
+            continue
+
+        if col >= len(types):
+            types.extend(it.repeat(XL_CELL_EMPTY, col + 1 - len(types)))
+            values.extend(it.repeat("", col + 1 - len(values)))
+
+        types[col], values[col] = _type, value
+
+    return types, values
+
+
+def _open_xlsx_book(zf):
+    """Helps read the workbook, styles, and shared strings of an xlsx file.
+
+    Args:
+        zf (obj): The xlsx `ZipFile`.
+
+    Returns:
+        Tuple[obj, List[str]]: The `xlrd` book (without any sheet data) and
+            the path of each sheet within the zip file.
+    """
+    ensure_elementtree_imported(0, None)
+    names = {name.replace("\\", "/").lower(): name for name in zf.namelist()}
+    book = Book()
+
+    # Mirror the defaults `xlrd.open_workbook` sets for xlsx files
+    book.logfile, book.verbosity, book.formatting_info = sys.stdout, 0, 0
+    book.use_mmap, book.on_demand, book.ragged_rows = False, False, True
+    x12book = X12Book(book)
+
+    with zf.open(names["xl/_rels/workbook.xml.rels"]) as f:
+        x12book.process_rels(f)
+
+    with zf.open(names["xl/workbook.xml"]) as f:
+        x12book.process_stream(f)
+
+    for name, X12Part in [
+        ("xl/styles.xml", X12Styles),
+        ("xl/sharedstrings.xml", X12SST),
+    ]:
+        if name in names:
+            with zf.open(names[name]) as f:
+                X12Part(book).process_stream(f)
+
+    return book, [names[target] for target in x12book.sheet_targets]
+
+
+def _gen_xlsx_rows(zf, path, book, pad_rows=False):
+    """Helps incrementally read the rows of an xlsx sheet.
+
+    Each row is cleared from the parsed tree once read, so memory use doesn't
+    grow with the size of the sheet.
+
+    Args:
+        zf (obj): The xlsx `ZipFile`. It is closed once all rows are read.
+        path (str): The sheet's path within the zip file.
+        book (obj): The `xlrd` book holding the shared strings and styles.
+        pad_rows (bool): Add empty cells so that all rows have the number of
+            columns in the sheet's dimension, or if missing, of the widest row
+            read so far (default: False).
+
+    Yields:
+        Tuple[int, List[int], List[scalar]]: The row number, cell types, and
+            values.
+    """
+    row_num, ncols = -1, 0
+
+    try:
+        with zf.open(path) as f:
+            for event, element in iterparse(f, ("start", "end")):
+                tag = element.tag[len(U_SSML12) :]
+
+                if event == "start" and tag == "sheetData":
+                    sheet_data = element
+                elif event == "start" and tag == "dimension":
+                    ref = element.get("ref", "A1").split(":")[-1]
+                    ncols = _get_xlsx_col(ref.rstrip("0123456789")) + 1
+                elif event == "end" and tag == "row":
+                    num = int(element.get("r", row_num + 2)) - 1
+                    types, values = _read_xlsx_row(element, book)
+                    ncols = max(ncols, len(types))
+                    width = ncols if pad_rows else 0
+
+                    # Like `xlrd`, include the rows missing from the sheet
+                    for row_num in range(row_num + 1, num):
+                        yield (row_num, [XL_CELL_EMPTY] * width, [""] * width)
+
+                    if len(types) < width:
+                        types.extend(it.repeat(XL_CELL_EMPTY, width - len(types)))
+                        values.extend(it.repeat("", width - len(values)))
+
+                    row_num = num
+                    yield (row_num, types, values)
+                    sheet_data.clear()
+    finally:
+        zf.close()
+
+
+def _open_sheet(filepath, sheet=0, **kwargs):
+    """Helps open an xls/xlsx sheet.
+
+    xlsx files are streamed row by row, while xls files are loaded with
+    `xlrd`.
+
+    Args:
+        filepath (str): The xls/xlsx file path, file, or SpooledTemporaryFile.
+        sheet (int): Zero indexed sheet to open (default: 0)
+        kwargs (dict): Keyword arguments
+
+    Kwargs:
+        on_demand (bool): `xlrd.open_workbook` `on_demand` option.
+        pad_rows (bool): Add empty cells so that all rows have the same number
+            of columns (default: False).
+
+        encoding (str): File encoding.
+
+    Returns:
+        Tuple[int, Iter[Tuple[int, List[int], List[scalar]]]]: The workbook
+            datemode and the sheet's rows of (row number, cell types, values).
+    """
+    if is_zipfile(filepath):
+        zf = ZipFile(filepath)
+        book, paths = _open_xlsx_book(zf)
+        rows = _gen_xlsx_rows(zf, paths[sheet], book, kwargs.get("pad_rows"))
+    else:
+        xlrd_kwargs = {
+            "on_demand": kwargs.get("on_demand"),
+            "ragged_rows": not kwargs.get("pad_rows"),
+            "encoding_override": kwargs.get("encoding", True),
+        }
+
+        try:
+            contents = mmap(filepath.fileno(), 0)
+            book = xlrd.open_workbook(file_contents=contents, **xlrd_kwargs)
+        except AttributeError:
+            book = xlrd.open_workbook(filepath, **xlrd_kwargs)
 
-            yield (i, switch.get(_type, lambda v: v)(value))
+        xl_sheet = book.sheet_by_index(sheet)
+        nums = range(xl_sheet.nrows)
+        rows = ((i, xl_sheet.row_types(i), xl_sheet.row_values(i)) for i in nums)
+
+    return book.datemode, rows
 
 
-# pylint: disable=unused-argument
 def get_header(names, dedupe=False, sanitize=False, **kwargs):
     """Generates a header row"""
     stripped = (name for name in names if name.strip())
@@ -1033,6 +2558,9 @@ def get_header(names, dedupe=False, sanitize=False, **kwargs):
 def read_xls(filepath, **kwargs):
     """Reads an xls/xlsx file.
 
+    xlsx sheets are parsed incrementally from the zip archive, so apart from
+    the shared strings, only one row at a time is held in memory.
+
     Args:
         filepath (str): The xls/xlsx file path, file, or SpooledTemporaryFile.
         kwargs (dict): Keyword arguments that are passed to the xls reader.
@@ -1061,7 +2589,8 @@ def read_xls(filepath, **kwargs):
             False).
 
         pad_rows (bool): Add empty cells so that all rows have the number of
-            columns `Sheet.ncols` (default: False).
+            columns `Sheet.ncols`. For xlsx files, this is the number of
+            columns in the sheet's dimension (default: False).
 
     Yields:
         dict: A row of data whose keys are the field names.
@@ -1081,44 +2610,125 @@ def read_xls(filepath, **kwargs):
     """
     has_header = kwargs.get("has_header", True)
     first_row = kwargs.get("first_row", 0)
+    first_col = kwargs.get("first_col", 0)
+    mode, rows = _open_sheet(filepath, kwargs.pop("sheet", 0), **kwargs)
+    sanitize_row = get_row_sanitizer(mode, **kwargs)
+
+    for num, types, values in rows:
+        if num < first_row:
+            continue
+        elif num == first_row:
+            # Get header row and remove empty columns
+            names = values[first_col:]
+
+            if has_header:
+                header = get_header(names, kwargs.pop("dedupe", False), **kwargs)
+                continue
+            else:
+                header = ["column_%i" % (n + 1) for n in range(len(names))]
+
+        # Convert to strings
+        values = sanitize_row(types[first_col:], values[first_col:])
+
+        # Remove empty rows
+        if any(v and v.strip() for v in values):
+            yield dict(zip(header, values))
 
-    xlrd_kwargs = {
-        "on_demand": kwargs.get("on_demand"),
-        "ragged_rows": not kwargs.get("pad_rows"),
-        "encoding_override": kwargs.get("encoding", True),
-    }
 
+def _loads_json(line):
+    """Parses a line of json with the fastest available backend, falling back
+    to the builtin parser for anything it rejects, e.g., `NaN` or big ints.
+
+    Examples:
+        >>> _loads_json(b'{"a": 1}')
+        {'a': 1}
+        >>> _loads_json('[NaN]')
+        [nan]
+    """
     try:
-        contents = mmap(filepath.fileno(), 0)
-        book = xlrd.open_workbook(file_contents=contents, **xlrd_kwargs)
-    except AttributeError:
-        book = xlrd.open_workbook(filepath, **xlrd_kwargs)
+        return fast_loads(line)
+    except ValueError:
+        return json.loads(line)
 
-    sheet = book.sheet_by_index(kwargs.pop("sheet", 0))
 
-    # Get header row and remove empty columns
-    names = sheet.row_values(first_row)[kwargs.get("first_col", 0) :]
+def _gen_ndjson(f, chunksize=2 ** 20):
+    """Parses a newline-delimited json file in binary blocks.
 
-    if has_header:
-        header = get_header(names, kwargs.pop("dedupe", False), **kwargs)
-    else:
-        header = ["column_%i" % (n + 1) for n in range(len(names))]
+    Lines are split off each block (at '\\n', '\\r\\n', or '\\r') and handed to
+    the json parser as bytes. A leading byte order marker (BOM) is stripped
+    from the first record only and blank lines are skipped.
+
+    Args:
+        f (obj): The binary file like object.
+        chunksize (int): Number of bytes to read at a time (default: 1 MiB).
 
-    # Convert to strings
-    sanitized = sanitize_sheet(sheet, book.datemode, **kwargs)
+    Yields:
+        scalar: The parsed records
 
-    for key, group in it.groupby(sanitized, lambda v: v[0]):
-        if has_header and key == first_row:
-            continue
+    Examples:
+        >>> f = BytesIO(BOM.encode(ENCODING) + b'{"a": 1}\\n\\n[2]\\r\\n"b"\\r3')
+        >>> list(_gen_ndjson(f, chunksize=3))
+        [{'a': 1}, [2], 'b', 3]
+    """
+    bom = BOM.encode(ENCODING)
+    start = f.read(len(bom))
+    pending = [] if start == bom else [start]
+
+    for block in iter(partial(f.read, chunksize), b""):
+        # json strings can't contain raw line breaks, so '\r\n' is just a line
+        # followed by a (skipped) blank one
+        block = block.replace(b"\r", b"\n") if b"\r" in block else block
+        *lines, last = block.split(b"\n")
+
+        if lines:
+            lines[0] = b"".join(pending + [lines[0]])
+            pending = [last]
+            yield from map(_loads_json, filter(bytes.strip, lines))
+        else:
+            pending.append(last)
 
-        values = [g[1] for g in group]
+    line = b"".join(pending)
 
-        # Remove empty rows
-        if any(v and v.strip() for v in values):
-            yield dict(zip(header, values))
+    if line.strip():
+        yield _loads_json(line)
+
+
+def _read_ndjson_text(f, **kwargs):
+    """Helps read a newline-delimited json text file"""
+    return map(_loads_json, filter(str.strip, f))
+
+
+def _read_ndjson(filepath, chunksize=2 ** 20, mode="r"):
+    """Helps read a newline-delimited json file or binary file like object.
+
+    Files that aren't utf-8 are read (from the first record that couldn't be
+    decoded) via `meza.io.read_any`, which detects their encoding.
+    """
+    count = 0
+
+    try:
+        if hasattr(filepath, "read"):
+            for count, record in enumerate(_gen_ndjson(filepath, chunksize), 1):
+                yield record
+        else:
+            with open(filepath, "rb") as f:
+                for count, record in enumerate(_gen_ndjson(f, chunksize), 1):
+                    yield record
+    except UnicodeDecodeError as err:
+        logger.warning(err)
+
+        kwargs = {}
 
+        if hasattr(filepath, "read"):
+            filepath.seek(0)
+            result = detect_encoding(filepath, sample_size=None)
+            kwargs["encoding"] = sanitize_file_encoding(result["encoding"])
 
-def read_json(filepath, mode="r", path="item", newline=False):
+        records = read_any(filepath, _read_ndjson_text, mode, **kwargs)
+        yield from it.islice(records, count, None)
+
+
+def read_json(filepath, mode="r", path="item", newline=False, chunksize=2 ** 20):
     """Reads a json file (both regular and newline-delimited)
 
     Args:
@@ -1129,7 +2739,12 @@ def read_json(filepath, mode="r", path="item", newline=False):
             a list.
 
         newline (Optional[bool]): Interpret file as newline-delimited
-            (default: False).
+            (default: False). If True, file paths and binary file like
+            objects are read in blocks of `chunksize` bytes and parsed with
+            `orjson` or `simdjson` if either is installed.
+
+        chunksize (Optional[int]): Number of bytes to read at a time when
+            `newline` is True (default: 1 MiB).
 
     Kwargs:
         encoding (str): File encoding.
@@ -1139,6 +2754,7 @@ def read_json(filepath, mode="r", path="item", newline=False):
 
     See also:
         `meza.io.read_any`
+        `meza.convert.records2json`
 
     Examples:
         >>> filepath = p.join(DATA_DIR, 'test.json')
@@ -1152,9 +2768,20 @@ def read_json(filepath, mode="r", path="item", newline=False):
         ...     'date': '1971-01-01',
         ...     'integer': 40}
         True
+        >>> filepath = p.join(DATA_DIR, 'newline.json')
+        >>> next(read_json(filepath, newline=True)) == {'a': 2, 'b': 3}
+        True
     """
-    reader = lambda f, **kw: map(json.loads, f) if newline else items(f, path)
-    return read_any(filepath, reader, mode)
+    text_f = hasattr(filepath, "read") and not is_binary(filepath)
+
+    if newline and not text_f:
+        records = _read_ndjson(filepath, chunksize, mode)
+    elif newline:
+        records = read_any(filepath, _read_ndjson_text, mode)
+    else:
+        records = read_any(filepath, lambda f, **kw: items(f, path), mode)
+
+    return records
 
 
 def get_point(coords, lat_first):
@@ -1248,17 +2875,123 @@ def read_geojson(filepath, key="id", mode="r", **kwargs):
 
                 yield from gen_records(_type, *args, **kwargs)
 
-    return read_any(filepath, reader, mode, **kwargs)
+    return read_any(filepath, reader, mode, **kwargs)
+
+
+if CParser:
+
+    class YAMLLoader(CParser, Composer, SafeConstructor, Resolver):
+        """A safe YAML loader that parses events with libyaml, but composes and
+        constructs nodes in python so that they can be loaded one at a time.
+        """
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+else:
+    YAMLLoader = yaml.SafeLoader
+
+
+def _gen_yaml_records(loader, keys):
+    """Helps find the records of a YAML document at a given path.
+
+    Only the nodes along the path are composed one at a time, so a large
+    sequence is never held in memory at once.
+
+    Args:
+        loader (obj): The YAML loader positioned at the start of a node.
+        keys (Seq[str]): The path components, where 'item' refers to each
+            element of a sequence (or, as with `yaml.safe_load`, each element
+            of any other iterable).
+
+    Yields:
+        obj: A parsed record.
+    """
+    if not keys:
+        yield loader.construct_document(loader.compose_node(None, None))
+    elif keys[0] == "item" and loader.check_event(SequenceStartEvent):
+        loader.get_event()
+
+        while not loader.check_event(SequenceEndEvent):
+            yield from _gen_yaml_records(loader, keys[1:])
+
+        loader.get_event()
+    elif keys[0] == "item":
+        # e.g., a mapping yields its keys
+        value = loader.construct_document(loader.compose_node(None, None))
+
+        if value is not None:
+            yield from value
+    elif loader.check_event(MappingStartEvent):
+        loader.get_event()
+
+        while not loader.check_event(MappingEndEvent):
+            key = loader.construct_document(loader.compose_node(None, None))
+
+            if str(key) == keys[0]:
+                yield from _gen_yaml_records(loader, keys[1:])
+            else:
+                loader.compose_node(None, None)
+
+        loader.get_event()
+    else:
+        loader.compose_node(None, None)
+
+
+def _read_yaml(f, path="item", **kwargs):
+    """Helps stream the records of a YAML file.
+
+    Args:
+        f (obj): The YAML file like object.
+        path (str): Path to the content you wish to read, or `None` for the
+            whole document (default: 'item').
+
+    Yields:
+        scalar: A parsed record.
+
+    Examples:
+        >>> f = StringIO('a: [1, {b: 2}]\\n---\\na: [3]\\n')
+        >>> list(_read_yaml(f, 'a.item'))
+        [1, {'b': 2}, 3]
+        >>> f = StringIO('- &x {b: 1}\\n- *x\\n---\\n- &x {b: 2}\\n')
+        >>> list(_read_yaml(f))
+        [{'b': 1}, {'b': 1}, {'b': 2}]
+        >>> list(_read_yaml(StringIO('a: 1\\nb: 2\\n')))
+        ['a', 'b']
+    """
+    loader = YAMLLoader(f)
+    keys = path.split(".") if path else []
+
+    try:
+        loader.get_event()
+
+        while loader.check_event(DocumentStartEvent):
+            loader.get_event()
+
+            yield from _gen_yaml_records(loader, keys)
+            loader.get_event()
+            # anchors are only valid within their document
+            loader.anchors = {}
+    finally:
+        loader.dispose()
 
 
-def read_yaml(filepath, mode="r", **kwargs):
+def read_yaml(filepath, mode="r", path="item", **kwargs):
     """Reads a YAML file
 
-    TODO: convert to a streaming parser
+    The file is parsed as a stream of events and each record is constructed
+    as soon as it is complete, so memory use doesn't grow with the file size.
+    Multiple documents are read one after the other.
 
     Args:
         filepath (str): The yaml file path or file like object.
         mode (Optional[str]): The file open mode (default: 'r').
+        path (Optional[str]): Path to the content you wish to read, with keys
+            separated by '.' (default: 'item', i.e., the root list). Note:
+            like `meza.io.read_json`, `path` must refer to a list.
 
     Kwargs:
         encoding (str): File encoding.
@@ -1268,6 +3001,7 @@ def read_yaml(filepath, mode="r", **kwargs):
 
     See also:
         `meza.io.read_any`
+        `meza.io.read_json`
 
     Examples:
         >>> from datetime import date, datetime as dt
@@ -1283,8 +3017,11 @@ def read_yaml(filepath, mode="r", **kwargs):
         ...     'date': date(1971, 1, 1),
         ...     'integer': 40}
         True
+        >>> f = StringIO('data:\\n  records:\\n    - a: 1\\n    - a: 2\\n')
+        >>> list(read_yaml(f, path='data.records.item'))
+        [{'a': 1}, {'a': 2}]
     """
-    return read_any(filepath, yaml.safe_load, mode, **kwargs)
+    return read_any(filepath, _read_yaml, mode, path=path, **kwargs)
 
 
 def get_text(element):
@@ -1315,26 +3052,162 @@ def _find_table(soup, pos=0):
     return table
 
 
-def _gen_from_rows(rows, header, vertical=False):
-    if vertical:
-        # nested_tds = [('one', 'two'), ('uno', 'dos'), ('un', 'deux')]
-        nested_tds = (tr.find_all("td") for tr in rows)
+def _gen_soup_rows(f, table=0):
+    """Helps parse the rows of an html table with BeautifulSoup.
+
+    Args:
+        f (obj): The html file like object.
+        table (int): Zero indexed table to parse (default: 0)
+
+    Yields:
+        Tuple[List[str], List[str]]: The text of a row's `th` and `td` cells.
+    """
+    try:
+        soup = BeautifulSoup(f, "lxml-xml")
+    except FeatureNotFound:
+        soup = BeautifulSoup(f, "html.parser")
+
+    tbl = _find_table(soup, table)
+
+    for tr in tbl.find_all("tr") if tbl else []:  # pylint: disable=C0103
+        yield (
+            list(map(get_text, tr.find_all("th"))),
+            list(map(get_text, tr.find_all("td"))),
+        )
+
+
+def _get_element_text(element):
+    return "".join(element.itertext()).strip()
+
+
+def _gen_html_rows(f, table=0, chunksize=2 ** 16):
+    """Helps incrementally parse the rows of an html table with lxml.
+
+    Each `tr` element is cleared as soon as its cells are read, so memory use
+    doesn't grow with the size of the table.
+
+    Args:
+        f (obj): The html file like object.
+        table (int): Zero indexed table to parse (default: 0)
+        chunksize (int): Number of characters to feed the parser at a time
+            (default: 64KiB).
+
+    Yields:
+        Tuple[List[str], List[str]]: The text of a row's `th` and `td` cells.
+    """
+    events = ("start", "end")
+    parser = etree.HTMLPullParser(events=events, tag=("table", "tr"))
+    pos, depth = -1, 0
+
+    def gen_events():
+        for chunk in iter(partial(f.read, chunksize), ""):
+            parser.feed(chunk)
+            yield from parser.read_events()
+
+        # closes any elements left open by truncated markup
+        parser.close()
+        yield from parser.read_events()
+
+    for event, element in gen_events():
+        if element.tag == "table" and event == "start":
+            pos += 1
+            depth += 1 if depth or pos == table else 0
+        elif element.tag == "table" and depth:
+            depth -= 1
+
+            if not depth:
+                return
+        elif event == "end" and depth:
+            ths = list(map(_get_element_text, element.iter("th")))
+            tds = list(map(_get_element_text, element.iter("td")))
+            yield (ths, tds)
+
+        if event == "end" and depth < 2:
+            # nested tables are cleared along with their parent row
+            element.clear(keep_tail=True)
+
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def _read_html_rows(rows, sanitize=False, dedupe=False, **kwargs):
+    """Helps convert the rows of an html table into records.
+
+    Only the rows up to (and including) the first one with a `th` cell are
+    read up front in order to determine the header.
+
+    Args:
+        rows (Iter[Tuple[List[str], List[str]]]): The text of each row's `th`
+            and `td` cells.
+
+        sanitize (bool): Underscorify and lowercase field names
+            (default: False).
+
+        dedupe (bool): Deduplicate field names (default: False).
+
+    Kwargs:
+        vertical (bool): The table has headers in the left column (default:
+            False).
+
+        first_row_as_header (bool): Use the first row's `td` cells as the
+            header if the table has no `th` cells (default: False).
+
+    Returns:
+        Iter[dict]: The records.
+
+    Examples:
+        >>> rows = [(['a', 'b'], []), ([], ['1', '2'])]
+        >>> list(_read_html_rows(rows))
+        [{'a': '1', 'b': '2'}]
+        >>> rows = [(['a'], ['1', '2']), (['b'], ['3', '4'])]
+        >>> list(_read_html_rows(rows)) == [
+        ...     {'a': '1', 'b': '3'}, {'a': '2', 'b': '4'}]
+        True
+    """
+    rows, buffered = iter(rows), []
+
+    for row in rows:
+        buffered.append(row)
+
+        if row[0]:
+            break
+
+    if not buffered:
+        return iter([])
+
+    ths = buffered[-1][0]
+
+    if kwargs.get("first_row_as_header") and not ths:
+        ths = buffered[0][1]
+
+    rows = it.chain(buffered, rows)
+
+    if kwargs.get("vertical") or len(ths) == 1:
+        # the headers are vertical instead of horizontal
+        rows = list(rows)
+        names = (row[0][0] if row[0] else "" for row in rows)
 
         # tds = ('one', 'uno', 'un')
-        for tds in zip(*nested_tds):
-            row = map(get_text, tds)
-            yield dict(zip(header, row))
+        values = zip(*(row[1] for row in rows))
+    elif ths:
+        next(rows)
+        names, values = ths, (row[1] for row in rows)
     else:
-        for tr in rows:  # pylint: disable=C0103
-            row = map(get_text, tr.find_all("td"))
-            yield dict(zip(header, row))
+        col_nums = range(len(buffered[-1][1]))
+        names = [f"column_{i}" for i in col_nums]
+        values = (row[1] for row in rows)
+
+    uscored = ft.underscorify(names) if sanitize else names
+    header = list(ft.dedupe(uscored) if dedupe else uscored)
+    return (dict(zip(header, row)) for row in values)
 
 
 def read_html(filepath, table=0, mode="r", **kwargs):
     """Reads tables from an html file
 
-    TODO: convert to lxml.etree.iterparse
-    http://lxml.de/parsing.html#iterparse-and-iterwalk
+    If `lxml` is installed, the file is parsed incrementally and each table
+    row is discarded once read. Otherwise, or if `lxml` can't parse the
+    markup, the whole file is parsed with BeautifulSoup.
 
     Args:
         filepath (str): The html file path or file like object.
@@ -1357,11 +3230,15 @@ def read_html(filepath, table=0, mode="r", **kwargs):
         vertical (bool): The table has headers in the left column (default:
             False).
 
+        first_row_as_header (bool): Use the first row as the header if the
+            table has no `th` cells (default: False).
+
     Returns:
         Iterable: The parsed records
 
     See also:
         `meza.io.read_any`
+        `meza.io._read_html_rows`
 
     Examples:
         >>> filepath = p.join(DATA_DIR, 'test.html')
@@ -1384,47 +3261,28 @@ def read_html(filepath, table=0, mode="r", **kwargs):
         True
     """
 
-    def reader(f, **kwargs):
-        """File reader"""
-        try:
-            soup = BeautifulSoup(f, "lxml-xml")
-        except FeatureNotFound:
-            soup = BeautifulSoup(f, "html.parser")
-
-        sanitize = kwargs.get("sanitize")
-        dedupe = kwargs.get("dedupe")
-        vertical = kwargs.get("vertical")
-        first_row_as_header = kwargs.get("first_row_as_header")
-        tbl = _find_table(soup, table)
-
-        if tbl:
-            rows = tbl.find_all("tr")
+    def gen_records(f, **kwargs):
+        """Reads the records with lxml, switching to BeautifulSoup (and
+        skipping the records already read) if the markup is malformed"""
+        count = 0
 
-            for num, a_row in enumerate(rows):
-                if a_row.find("th"):
-                    break
-
-            ths = a_row.find_all("th")
-
-            if first_row_as_header and not ths:
-                ths = rows[0].find_all("td")
+        try:
+            records = _read_html_rows(_gen_html_rows(f, table), **kwargs)
 
-            if vertical or len(ths) == 1:
-                # the headers are vertical instead of horizontal
-                vertical = True
-                names = (get_text(row.th) for row in rows)
-            elif ths:
-                rows = rows[1:]
-                names = map(get_text, ths)
-            else:
-                col_nums = range(len(a_row))
-                names = [f"column_{i}" for i in col_nums]
+            for count, record in enumerate(records, 1):
+                yield record
+        except etree.LxmlError as err:
+            logger.warning(err)
+            f.seek(0)
+            records = _read_html_rows(_gen_soup_rows(f, table), **kwargs)
+            yield from it.islice(records, count, None)
 
-            uscored = ft.underscorify(names) if sanitize else names
-            header = list(ft.dedupe(uscored) if dedupe else uscored)
-            records = _gen_from_rows(rows, header, vertical)
+    def reader(f, **kwargs):
+        """File reader"""
+        if etree:
+            records = gen_records(f, **kwargs)
         else:
-            records = iter([])
+            records = _read_html_rows(_gen_soup_rows(f, table), **kwargs)
 
         return records
 
@@ -1576,13 +3434,59 @@ def reencode(f, fromenc=ENCODING, toenc=ENCODING, **kwargs):
     return Reencoder(f, fromenc, toenc, **kwargs)
 
 
-def detect_encoding(f, verbose=False):
+def _gen_samples(f, sample_size=SAMPLE_SIZE):
+    """Yields blocks from the head, middle, and tail of a file.
+
+    Args:
+        f (obj): The file like object to sample.
+        sample_size (int): Maximum number of bytes to yield (default: 256KB).
+            Use `None` to read the entire file.
+
+    Yields:
+        bytes: A block of the file.
+    """
+    chunksize = 2 ** 14
+
+    if sample_size is None or not is_binary(f):
+        size = sample_size or inf
+    else:
+        start = f.tell()
+        size = f.seek(0, 2) - start
+        f.seek(start)
+
+    if size <= (sample_size or inf):
+        offsets, budget = [None], sample_size
+    else:
+        budget = sample_size // 3
+        offsets = [None, start + (size - budget) // 2, start + size - budget]
+
+    for offset in offsets:
+        if offset is not None:
+            f.seek(offset)
+            # skip the (probably) partial line so we start on a character
+            f.readline()
+
+        remaining = budget or inf
+
+        while remaining:
+            block = f.read(min(remaining, chunksize))
+
+            if not block:
+                break
+
+            remaining -= len(block)
+            yield block
+
+
+def detect_encoding(f, verbose=False, sample_size=SAMPLE_SIZE):
     """Detects a file's encoding.
 
     Args:
         f (obj): The file like object to detect.
         verbose (Optional[bool]): The file open mode (default: False).
-        mode (Optional[str]): The file open mode (default: 'r').
+        sample_size (Optional[int]): Maximum number of bytes to examine. Large
+            binary files are sampled from the head, middle, and tail. Use
+            `None` to examine the entire file (default: 256KB).
 
     Returns:
         dict: The encoding result
@@ -1595,12 +3499,18 @@ def detect_encoding(f, verbose=False):
         ...     result == {
         ...         'confidence': 0.99, 'language': '', 'encoding': 'utf-8'}
         True
+        >>>
+        >>> f = BytesIO(b'a,b\\n' * 100000 + 'ñ,ü\\n'.encode('latin-1'))
+        >>> detect_encoding(f, sample_size=2 ** 12)['encoding']
+        'ISO-8859-1'
+        >>> f.tell()
+        0
     """
     pos = f.tell()
     detector = UniversalDetector()
 
-    for line in f:
-        detector.feed(line)
+    for block in _gen_samples(f, sample_size):
+        detector.feed(block)
 
         if detector.done:
             break
@@ -1692,6 +3602,41 @@ def read(filepath, ext=None, **kwargs):
     return get_reader(ext)(filepath, **kwargs)
 
 
+def _gen_file_records(filepath, **kwargs):
+    """Helps stream the records of a file for `meza.io.join`.
+
+    Args:
+        filepath (str): The file path or file like object.
+        kwargs (dict): Keyword arguments passed to `meza.io.read`.
+
+    Yields:
+        dict: A parsed record
+
+    Raises:
+        JoinError: If unable to read the file.
+    """
+    try:
+        yield from read(filepath, **kwargs)
+    except Exception as err:
+        raise JoinError(getattr(filepath, "name", filepath), err) from err
+
+
+def _read_file(task):
+    """Helps read all the records of a file for `meza.io.join`.
+
+    Args:
+        task (tuple): The file path (or file like object), and reader kwargs.
+
+    Returns:
+        List[dict]: The parsed records.
+
+    Raises:
+        JoinError: If unable to read the file.
+    """
+    filepath, kwargs = task
+    return list(_gen_file_records(filepath, **kwargs))
+
+
 def join(*filepaths, **kwargs):
     """Reads multiple filepaths and yields all the resulting records.
 
@@ -1702,12 +3647,28 @@ def join(*filepaths, **kwargs):
 
     Kwargs:
         ext (str): The file extension.
+        workers (int): Number of files to read concurrently (default: None,
+            i.e., read the files one after another in the current process).
+
+        ordered (bool): Yield the records in the order of `filepaths`,
+            otherwise yield each file's records as soon as it has been read.
+            Only used with `workers` (default: True).
+
+        max_inflight (int): Maximum number of files read ahead when using
+            `workers` (default: 2 * workers).
+
+        threads (bool): Use a thread pool instead of a process pool when
+            using `workers`. Required for file like objects (default: False).
 
     Yields:
         dict: A parsed record
 
+    Raises:
+        JoinError: If unable to read one of the files.
+
     See also:
         `meza.io.read`
+        `meza.fntools.pmap`
 
     Examples:
         >>> fs = [p.join(DATA_DIR, 'test.xls'), p.join(DATA_DIR, 'test.csv')]
@@ -1717,6 +3678,346 @@ def join(*filepaths, **kwargs):
         ...     'sparse_data': 'Iñtërnâtiônàližætiøn',
         ...     'unicode_test': 'Ādam'}
         True
+        >>> records = join(*fs, workers=2, threads=True)
+        >>> list(records) == list(join(*fs))
+        True
+    """
+    pkeys = ["workers", "max_inflight", "threads"]
+    workers, max_inflight, threads = [kwargs.pop(key, None) for key in pkeys]
+    ordered = kwargs.pop("ordered", True)
+
+    if workers:
+        tasks = ((filepath, kwargs) for filepath in filepaths)
+        pkwargs = {"threads": threads, "ordered": ordered}
+        records = ft.pmap(_read_file, tasks, workers, max_inflight, **pkwargs)
+    else:
+        records = map(partial(_gen_file_records, **kwargs), filepaths)
+
+    return it.chain.from_iterable(records)
+
+
+class AsyncStreamIO(object):
+    """A (blocking) text file like view of an asyncio stream.
+
+    The event loop prefetches the stream into a buffer (see `prefetch`), which
+    a sync reader running in an executor then parses. The reader only blocks
+    (waiting on the event loop) if it needs more than what's been buffered.
+    Since the stream can't be reopened, encodings are switched in place (like
+    `meza.io.Redecoder`) if a chunk can't be decoded.
+    """
+
+    def __init__(self, stream, loop, encoding=ENCODING, chunksize=2 ** 16):
+        """Initialization method.
+
+        Args:
+            stream (obj): An object with an async `read` method, e.g., an
+                `asyncio.StreamReader`.
+
+            loop (obj): The event loop running `stream`.
+            encoding (str): The stream encoding (default: ENCODING constant).
+            chunksize (int): Number of bytes to read from the stream at a time
+                (default: 64 KiB).
+        """
+        self.stream = stream
+        self.loop = loop
+        self.encoding = encoding
+        self.chunksize = chunksize
+        self.name = getattr(stream, "name", None)
+        self.decoder = _get_decoder(encoding)
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0
+        self.nbytes = 0
+        self.eof = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+
+        if not line:
+            raise StopIteration
+
+        return line
+
+    @property
+    def available(self):
+        """Number of buffered characters that haven't been read"""
+        return len(self.buf) - self.pos
+
+    def _feed(self, data):
+        self.nbytes += len(data)
+
+        try:
+            text = self.decoder.decode(data, not data)
+        except UnicodeDecodeError as err:
+            args = (err, data, self.decoder, self.encoding, self.nbytes)
+            text, self.decoder, self.encoding = _switch_decoder(*args, self.name)
+
+        self.buf = self.buf[slice(self.pos, None)] + text
+        self.offset += self.pos
+        self.pos = 0
+        self.eof = not data
+
+    async def prefetch(self, bufsize=2 ** 18):
+        """Buffer at least `bufsize` characters (unless the stream ends)"""
+        while self.available < bufsize and not self.eof:
+            self._feed(await self.stream.read(self.chunksize))
+
+    def _fill(self):
+        """Blocks until the next chunk of the stream is buffered. Must not be
+        called from the event loop's thread."""
+        read = self.stream.read(self.chunksize)
+        self._feed(asyncio.run_coroutine_threadsafe(read, self.loop).result())
+
+    def read(self, n=-1):
+        size = inf if n is None or n < 0 else n
+
+        while self.available < size and not self.eof:
+            self._fill()
+
+        end = min(self.pos + size, len(self.buf))
+        text, self.pos = self.buf[slice(self.pos, end)], end
+        return text
+
+    def readline(self):
+        end = self.buf.find("\n", self.pos)
+
+        while end < 0 and not self.eof:
+            searched = self.available
+            self._fill()
+            end = self.buf.find("\n", searched)
+
+        end = len(self.buf) if end < 0 else end + 1
+        line, self.pos = self.buf[slice(self.pos, end)], end
+        return line
+
+    def readlines(self):
+        return list(self)
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self.offset + self.pos
+
+    def seek(self, offset, whence=SEEK_SET):
+        """Seek to a position that is still buffered (e.g., the start of the
+        stream before it has been read past the prefetch size)"""
+        pos = offset - self.offset
+
+        if whence != SEEK_SET or not 0 <= pos <= len(self.buf):
+            raise UnsupportedOperation("can only seek within the buffered text")
+
+        self.pos = pos
+        return offset
+
+    def close(self):
+        pass
+
+
+def _get_batch(records, f=None, size=1000):
+    """Helps get the next batch of records in an executor.
+
+    Args:
+        records (Iter[dict]): The records.
+        f (obj): The `meza.io.AsyncStreamIO` being parsed (default: None).
+        size (int): Maximum number of records in the batch (default: 1000).
+
+    Returns:
+        List[dict]: The records (empty if there are no more).
+    """
+    batch = []
+
+    for record in records:
+        batch.append(record)
+
+        if len(batch) >= size:
+            break
+        elif f and not f.eof and f.available < f.chunksize:
+            # stop so the event loop can refill the buffer without blocking us
+            break
+
+    return batch
+
+
+def aread(filepath, ext=None, **kwargs):
+    """Asynchronously reads any supported file format.
+
+    The sync reader runs in an executor which parses the records in batches,
+    so the event loop is never blocked.
+
+    Args:
+        filepath (str): The file path, file like object, or async stream
+            (an object with an async `read` method, e.g.,
+            `asyncio.StreamReader`).
+
+        ext (str): The file extension (required for async streams without a
+            `name`).
+
+        kwargs (dict): Keyword arguments that are passed to the reader.
+
+    Kwargs:
+        encoding (str): File encoding.
+        batch_records (int): Number of records to parse per executor call
+            (default: 1000).
+
+        executor (obj): The `concurrent.futures` executor that parses the
+            records. Since each call resumes the same reader, it must be a
+            thread (not process) pool (default: None, i.e., the event loop's
+            default executor).
+
+    Returns:
+        AsyncIterator[dict]: The parsed records
+
+    Raises:
+        ValueError: If `executor` is a process pool.
+
+    See also:
+        `meza.io.read`
+        `meza.io.aread_csv`
+        `meza.io.aread_json`
+
+    Examples:
+        >>> import asyncio
+        >>>
+        >>> async def main(filepath, **kwargs):
+        ...     return [r async for r in aread(filepath, **kwargs)]
+        >>>
+        >>> records = asyncio.run(main(p.join(DATA_DIR, 'test.csv')))
+        >>> records[0] == {
+        ...     'Some Date': '05/04/82',
+        ...     'Sparse Data': 'Iñtërnâtiônàližætiøn',
+        ...     'Some Value': '234',
+        ...     'Unicode Test': 'Ādam'}
+        True
+        >>> async def from_stream(content, **kwargs):
+        ...     stream = asyncio.StreamReader()
+        ...     stream.feed_data(content)
+        ...     stream.feed_eof()
+        ...     return await main(stream, **kwargs)
+        >>>
+        >>> asyncio.run(from_stream(b'a,b\\n1,2\\n', ext='csv'))
+        [{'a': '1', 'b': '2'}]
+    """
+    name = getattr(filepath, "name", "") if hasattr(filepath, "read") else filepath
+    ext = ext or p.splitext(name)[1]
+    return _aread_any(filepath, get_reader(ext), **kwargs)
+
+
+def _aread_any(filepath, reader, batch_records=1000, executor=None, **kwargs):
+    """Helps asynchronously read a file, file like object, or async stream
+
+    Raises:
+        ValueError: If `executor` is a process pool.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        # the records are parsed by a (unpicklable) generator shared by calls
+        msg = "`executor` must run in this process, e.g., a `ThreadPoolExecutor`."
+        raise ValueError(msg)
+
+    return _agen_records(filepath, reader, batch_records, executor, **kwargs)
+
+
+async def _agen_records(filepath, reader, batch_records, executor, **kwargs):
+    """Helps asynchronously parse the records of a file in batches"""
+    loop = asyncio.get_running_loop()
+
+    if iscoroutinefunction(getattr(filepath, "read", None)):
+        encoding = kwargs.pop("encoding", None) or ENCODING
+        f = AsyncStreamIO(filepath, loop, encoding)
+        await f.prefetch()
+    else:
+        f = None
+
+    # some readers do blocking work before returning their records
+    func = partial(reader, f or filepath, **kwargs)
+    records = iter(await loop.run_in_executor(executor, func))
+
+    while True:
+        if f:
+            await f.prefetch()
+
+        func = partial(_get_batch, records, f, batch_records)
+        batch = await loop.run_in_executor(executor, func)
+
+        if not batch:
+            break
+
+        for record in batch:
+            yield record
+
+
+def aread_csv(filepath, mode="r", **kwargs):
+    """Asynchronously reads a csv file.
+
+    Args:
+        filepath (str): The csv file path, file like object, or async stream.
+        mode (Optional[str]): The file open mode (default: 'r').
+        kwargs (dict): Keyword arguments that are passed to `meza.io.read_csv`
+            (and `batch_records` and `executor`, see `meza.io.aread`).
+
+    Returns:
+        AsyncIterator[dict]: The csv records, whose keys are the field names.
+
+    See also:
+        `meza.io.read_csv`
+        `meza.io.aread`
+
+    Examples:
+        >>> import asyncio
+        >>>
+        >>> async def main(filepath, **kwargs):
+        ...     return [r async for r in aread_csv(filepath, **kwargs)]
+        >>>
+        >>> filepath = p.join(DATA_DIR, 'test.csv')
+        >>> records = asyncio.run(main(filepath, sanitize=True, batch_records=2))
+        >>> records == list(read_csv(filepath, sanitize=True))
+        True
+    """
+    reader = partial(read_csv, mode=mode)
+    return _aread_any(filepath, reader, **kwargs)
+
+
+def aread_json(filepath, mode="r", path="item", newline=False, **kwargs):
+    """Asynchronously reads a json file.
+
+    Args:
+        filepath (str): The json file path, file like object, or async stream.
+        mode (Optional[str]): The file open mode (default: 'r').
+        path (Optional[str]): Path to the content you wish to read
+            (default: 'item', i.e., the root list). Note: `path` must refer to
+            a list.
+
+        newline (Optional[bool]): Interpret file as newline delimited
+            (default: False).
+
+        kwargs (dict): Keyword arguments (`batch_records` and `executor`, see
+            `meza.io.aread`).
+
+    Returns:
+        AsyncIterator[dict]: The json records.
+
+    See also:
+        `meza.io.read_json`
+        `meza.io.aread`
+
+    Examples:
+        >>> import asyncio
+        >>>
+        >>> async def main(stream, **kwargs):
+        ...     return [r async for r in aread_json(stream, **kwargs)]
+        >>>
+        >>> async def from_stream(content, **kwargs):
+        ...     stream = asyncio.StreamReader()
+        ...     stream.feed_data(content)
+        ...     stream.feed_eof()
+        ...     return await main(stream, **kwargs)
+        >>>
+        >>> content = b'{"a": 1}\\n{"a": 2}\\n'
+        >>> asyncio.run(from_stream(content, newline=True))
+        [{'a': 1}, {'a': 2}]
     """
-    reader = partial(read, **kwargs)
-    return it.chain.from_iterable(map(reader, filepaths))
+    reader = partial(read_json, mode=mode, path=path, newline=newline)
+    return _aread_any(filepath, reader, **kwargs)
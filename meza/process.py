@@ -20,23 +20,242 @@ Examples:
 Attributes:
     CURRENCIES [tuple(unicode)]: Currency symbols to remove from decimal
         strings.
+
+    CASTERS (dict): Field type to cast function lookup table
+    LEADING_ZERO (obj): Regex matching lines of a column that start with a
+        zero, e.g., '0123' (but not '0' or '0.5').
+
+    MAX_EXACT_INT (int): The largest int that can be parsed via `float`
+        without losing precision.
+
+    REDUCERS (dict): Reducer name to (start, op, finish, empty) lookup table. A
+        group is reduced by calling `start` on its first value, `op` on the
+        accumulated result and each following value, and `finish` on the
+        final result. A group without any (non-null) values reduces to `empty`.
 """
 import itertools as it
 import hashlib
+import pickle
+import re
+import sys
 
-from functools import partial, reduce
-from collections import defaultdict
-from operator import itemgetter, iadd
+from functools import partial, reduce, lru_cache
+from operator import itemgetter, add, truediv
 from math import log1p
 from json import dumps, loads
 from collections import deque
+from heapq import merge as hmerge
+from tempfile import TemporaryFile
+
+from . import convert as cv, fntools as ft, typetools as tt, ENCODING, CURRENCIES
+
+CASTERS = {
+    "int": cv.to_int,
+    "float": cv.to_float,
+    "decimal": cv.to_decimal,
+    "date": cv.to_date,
+    "time": cv.to_time,
+    "datetime": cv.to_datetime,
+    "text": lambda v, **kw: str(v) if v and v.strip() else "",
+    "null": lambda x, **kw: None,
+    "bool": cv.to_bool,
+    "iden": lambda x, **kw: x,
+}
+
+LEADING_ZERO = re.compile(r"^0(?![.\n]|$)", re.M)
+MAX_EXACT_INT = 2 ** 53
+FAST_CAST_ERRORS = (ValueError, TypeError, KeyError)
+
+identity = lambda x: x
+
+# marks a missing field (as opposed to an explicit `None`)
+_MISSING = object()
+
+REDUCERS = {
+    "sum": (identity, add, identity, None),
+    "count": (lambda x: 1, lambda x, y: x + 1, identity, 0),
+    "min": (identity, min, identity, None),
+    "max": (identity, max, identity, None),
+    "mean": (
+        partial(ft.sum_and_count, None),
+        ft.sum_and_count,
+        ft.fpartial(truediv),
+        None,
+    ),
+}
+
+
+def _to_ints(values, excluded=None, warn=False):
+    """Casts a column of plain integer strings into ints in bulk.
+
+    Raises:
+        ValueError: If any value can't be cast the same way `cv.to_int` would.
+        TypeError: If any value isn't a string.
+    """
+    joined = "\n".join(values)
+
+    if any(char in joined for char in excluded or []):
+        raise ValueError("Column contains non-numeric characters.")
+
+    ints = list(map(int, values))
+
+    if ints and max(map(abs, ints)) >= MAX_EXACT_INT:
+        raise ValueError("Column contains ints that are too large.")
+
+    if warn and LEADING_ZERO.search(joined):
+        raise ValueError("Column contains ints with leading zeros.")
+
+    if warn and 0 in ints and any(v != "0" for v, i in zip(values, ints) if not i):
+        raise ValueError("Column contains invalid zeros.")
+
+    return ints
+
+
+def _to_floats(values, excluded=None, warn=False):
+    """Casts a column of plain numeric strings into floats in bulk.
 
-from . import convert as cv, fntools as ft, typetools as tt, ENCODING
+    Raises:
+        ValueError: If any value can't be cast the same way `cv.to_float`
+            would.
+
+        TypeError: If any value isn't a string.
+    """
+    joined = "\n".join(values)
+
+    if any(char in joined for char in excluded or []):
+        raise ValueError("Column contains non-numeric characters.")
+    elif LEADING_ZERO.search(joined):
+        raise ValueError("Column contains floats with leading zeros.")
+
+    floats = list(map(float, values))
+
+    if 0 in floats:
+        zeros = (v for v, x in zip(values, floats) if not x)
+
+        if warn and not all(v == "0" or v.startswith("0.") for v in zeros):
+            raise ValueError("Column contains invalid zeros.")
+
+        floats = [x or 0.0 for x in floats]
+
+    return floats
+
+
+def _to_bools(values, table=None):
+    """Casts a column of bool strings into bools in bulk.
+
+    Raises:
+        KeyError: If any value isn't found in `table`.
+        TypeError: If any value isn't a string.
+    """
+    return list(map(table.__getitem__, map(str.lower, values)))
 
-sort = lambda records, key: iter(sorted(records, key=itemgetter(key)))
 
+def _bulk_cast(values, fast, func, **kwargs):
+    """Casts a column using a bulk cast function, and falls back to casting
+    each value individually if the bulk cast fails."""
+    try:
+        cast = fast(values)
+    except FAST_CAST_ERRORS:
+        cast = []
 
-def type_cast(records, types=None, warn=False, **kwargs):
+        for value in values:
+            try:
+                cast.append(fast([value])[0])
+            except FAST_CAST_ERRORS:
+                cast.append(func(value, **kwargs))
+
+    return cast
+
+
+def _cast_distinct(values, func, **kwargs):
+    """Casts a column by only casting each of its distinct values once."""
+    try:
+        "".join(values)
+    except TypeError:
+        # dict keys would conflate e.g. `1`, `1.0`, and `True`
+        cast = [func(v, **kwargs) for v in values]
+    else:
+        distinct = {v: func(v, **kwargs) for v in dict.fromkeys(values)}
+        cast = list(map(distinct.__getitem__, values))
+
+    return cast
+
+
+def cast_column(values, _type, warn=False, **kwargs):
+    """Casts a column of values based on its field type.
+
+    Numeric and bool columns are cast in bulk, and only the values that can't
+    be cast in bulk are cast individually. Columns of other types only cast
+    each distinct value once.
+
+    Args:
+        values (Seq[scalar]): The column's data.
+        _type (str): The field type, e.g., 'int' or 'date'.
+        warn (bool): Raise error if value can't be cast (default: False).
+        kwargs (dict): Keyword arguments passed to the cast function.
+
+    Kwargs:
+        thousand_sep (char): thousand's separator (default: ',')
+        decimal_sep (char): decimal separator (default: '.')
+        trues (Seq[str]): Values to consider True.
+
+    Returns:
+        List[scalar]: The type casted column.
+
+    See also:
+        `meza.process.type_cast`
+
+    Examples:
+        >>> cast_column(['1', '2', '$3'], 'int')
+        [1, 2, 3]
+        >>> cast_column(['1.5', 'spam'], 'float')
+        [1.5, 0.0]
+        >>> cast_column(['true', 'no', 'spam'], 'bool')
+        [True, False, False]
+        >>> cast_column(['5/4/82', '5/4/82'], 'date')
+        [datetime.date(1982, 5, 4), datetime.date(1982, 5, 4)]
+        >>> cast_column(['1', 'spam'], 'int', warn=True)
+        Traceback (most recent call last):
+        ValueError: Invalid int value: `spam`.
+    """
+    values = list(values)
+    func = CASTERS[_type]
+    fkwargs = dict(kwargs, warn=warn)
+
+    if _type in {"int", "float"}:
+        decimal_sep = kwargs.get("decimal_sep", ".")
+        excluded = set(CURRENCIES).union([kwargs.get("thousand_sep", ","), ","])
+        excluded.update([] if decimal_sep == "." else [decimal_sep])
+        bulk = _to_ints if _type == "int" else _to_floats
+        fast = partial(bulk, excluded=excluded, warn=warn)
+        cast = _bulk_cast(values, fast, func, **fkwargs)
+    elif _type == "bool":
+        trues = kwargs.get("trues")
+        trues = set(map(str.lower, trues) if trues else ft.DEF_TRUES)
+        table = {v: v in trues for v in ft.DEF_TRUES + ft.DEF_FALSES}
+        fast = partial(_to_bools, table=table)
+        cast = _bulk_cast(values, fast, func, **fkwargs)
+    elif _type == "decimal":
+        cast = _cast_distinct(values, func, **fkwargs)
+    elif _type in {"date", "time", "datetime"}:
+        parser = cv.DatetimeParser(**kwargs)
+        cast = _cast_distinct(values, func, parser=parser, **fkwargs)
+    elif _type == "null":
+        cast = [None] * len(values)
+    elif _type == "iden":
+        cast = values
+    else:
+        cast = [func(v, **fkwargs) for v in values]
+
+    return cast
+
+
+def _cast_chunk(records, **kwargs):
+    """Type casts a chunk of records (in a worker process)."""
+    return list(type_cast(records, **kwargs))
+
+
+def type_cast(records, types=None, warn=False, columnar=False, **kwargs):
     """Casts record entries based on field types.
 
     Args:
@@ -48,10 +267,27 @@ def type_cast(records, types=None, warn=False, **kwargs):
 
         warn (bool): Raise error if value can't be cast (default: False).
 
+        columnar (bool): `records` are batches of columns, e.g., output from
+            `meza.io.read_csv(..., columnar=True)`. Each column is cast in
+            bulk (default: False).
+
+    Kwargs:
+        workers (int): Number of worker processes to cast chunks of records
+            with. Records are still yielded in their original order
+            (default: 0, i.e., cast in the current process).
+
+        chunksize (int): Number of records (or batches if `columnar`) per
+            chunk when using `workers` (default: 1000, or 1 if `columnar`).
+
+        max_inflight (int): Maximum number of chunks being cast at once when
+            using `workers` (default: 2 * workers).
+
     Yields:
         dict: Type casted record. A row of data whose keys are the field names.
+            If `columnar`, a type casted batch of columns.
 
     See also:
+        `meza.process.cast_column`
         `meza.process.detect_types`
         `meza.process.json_recode`
         `meza.typetools.guess_type_by_field`
@@ -93,26 +329,36 @@ def type_cast(records, types=None, warn=False, **kwargs):
         datetime.date(1982, 4, 5)
         >>> cast['datetime']
         datetime.datetime(1982, 4, 5, 14, 0)
+        >>> batch = {k: [v, v] for k, v in record.items()}
+        >>> cast = next(type_cast([batch], types, columnar=True))
+        >>> cast['int'] == [10, 10]
+        True
+        >>> cast = type_cast([record] * 3, types, workers=2, chunksize=2)
+        >>> [r['int'] for r in cast]
+        [10, 10, 10]
     """
-    switch = {
-        "int": cv.to_int,
-        "float": cv.to_float,
-        "decimal": cv.to_decimal,
-        "date": cv.to_date,
-        "time": cv.to_time,
-        "datetime": cv.to_datetime,
-        "text": lambda v, **kw: str(v) if v and v.strip() else "",
-        "null": lambda x, **kw: None,
-        "bool": cv.to_bool,
-        "iden": lambda x, **kw: x,
-    }
-
-    types = types or []
+    types = list(types or [])
     field_types = {t["id"]: t["type"] for t in types}
-
-    for row in records:
-        tups = ((k, field_types.get(k, "iden"), v) for k, v in row.items())
-        yield {k: switch.get(t)(v, warn=warn, **kwargs) for k, t, v in tups}
+    workers = kwargs.pop("workers", 0)
+    chunksize = kwargs.pop("chunksize", None) or (1 if columnar else 1000)
+    max_inflight = kwargs.pop("max_inflight", None)
+
+    if workers:
+        kwargs.update(types=types, warn=warn, columnar=columnar)
+        func = partial(_cast_chunk, **kwargs)
+        chunks = ft.chunk(records, chunksize)
+        cast = ft.pmap(func, chunks, workers, max_inflight)
+        yield from it.chain.from_iterable(cast)
+    elif columnar:
+        kwargs["warn"] = warn
+
+        for batch in records:
+            tups = ((k, field_types.get(k, "iden"), v) for k, v in batch.items())
+            yield {k: cast_column(v, t, **kwargs) for k, t, v in tups}
+    else:
+        for row in records:
+            tups = ((k, field_types.get(k, "iden"), v) for k, v in row.items())
+            yield {k: CASTERS.get(t)(v, warn=warn, **kwargs) for k, t, v in tups}
 
 
 def json_recode(records):
@@ -200,6 +446,14 @@ def gen_confidences(tally, types, a=1):
     return (calc(log1p(tally[t["id"]][t["type"]])) for t in types)
 
 
+@lru_cache(maxsize=None)
+def _get_confidence(count, a=1):
+    """Calculates the (rounded) confidence of a field type given its count.
+    See `gen_confidences`."""
+    x = log1p(count)
+    return cv.to_decimal(a * x / (1 + a * x))
+
+
 def gen_types(tally):
     """Selects the field type with the highest count. Also intelligently
     merges compatible types, e.g., 4 ints and 1 floats --> float.
@@ -260,7 +514,38 @@ def gen_types(tally):
         yield {"id": field, "type": _type}
 
 
-def detect_types(records, min_conf=0.95, hweight=6, max_iter=100):
+def _gen_guesses(record, guessed):
+    """Guesses the type of each of a record's values. String values are
+    memoized in `guessed`."""
+    for key, value in record.items():
+        cacheable = isinstance(value, str)
+
+        if cacheable and value in guessed:
+            _type = guessed[value]
+        else:
+            _type = next(tt.guess_type_by_value({key: value}))["type"]
+
+        if cacheable:
+            guessed[value] = _type
+
+        yield (key, _type)
+
+
+def _guess_chunk(records):
+    """Guesses the value types of a chunk of records (in a worker process)."""
+    guessed = {}
+    return [list(_gen_guesses(record, guessed)) for record in records]
+
+
+def detect_types(
+    records,
+    min_conf=0.95,
+    hweight=6,
+    max_iter=100,
+    workers=None,
+    chunksize=100,
+    max_inflight=None,
+):
     """Detects record types by selecting the first type which reaches the
     minimum confidence level (based on number of hits).
 
@@ -283,9 +568,22 @@ def detect_types(records, min_conf=0.95, hweight=6, max_iter=100):
 
         max_iter (int): maximum number of iterations to perform (default: 100)
 
+        workers (int): Number of worker processes to guess chunks of records
+            with. The result is the same as without workers
+            (default: None, i.e., guess in the current process).
+
+        chunksize (int): Number of records per chunk when using `workers`
+            (default: 100).
+
+        max_inflight (int): Maximum number of chunks being guessed at once
+            when using `workers` (default: 2 * workers).
+
     Returns:
         tuple(Iter[dict], dict): Tuple of records and the result
 
+    Raises:
+        ValueError: If `hweight` is less than 1 or `min_conf` is at least 1.
+
     See also:
         `meza.process.type_cast`
         `meza.process.gen_types`
@@ -314,7 +612,7 @@ def detect_types(records, min_conf=0.95, hweight=6, max_iter=100):
         True
     """
     records = iter(records)
-    tally = {}
+    tally, ctypes, guessed = {}, {}, {}
     consumed = []
 
     if hweight < 1:
@@ -323,35 +621,45 @@ def detect_types(records, min_conf=0.95, hweight=6, max_iter=100):
     if min_conf >= 1:
         raise ValueError("`min_conf must` be less than 1!")
 
+    if workers:
+        chunks, _chunks = it.tee(ft.chunk(records, chunksize))
+        guesses = ft.pmap(_guess_chunk, _chunks, workers, max_inflight)
+        records = it.chain.from_iterable(chunks)
+        all_guesses = it.chain.from_iterable(guesses)
+
     for record in records:
-        if not tally:
-            # take a first guess using the header
-            ftypes = tt.guess_type_by_field(record.keys())
-            tally = {t["id"]: defaultdict(int) for t in ftypes}
-            [iadd(tally[t["id"]][t["type"]], hweight) for t in ftypes]
-
-        # now guess using the values
-        for t in tt.guess_type_by_value(record):
-            try:
-                tally[t["id"]][t["type"]] += 1
-            except KeyError:
-                tally[t["id"]] = defaultdict(int)
-                tally[t["id"]][t["type"]] = 1
+        if workers:
+            pairs = next(all_guesses)
+        else:
+            pairs = _gen_guesses(record, guessed)
+
+        for key, _type in pairs:
+            tcount = tally.setdefault(key, {})
 
-        types = list(gen_types(tally))
-        confidence = min(gen_confidences(tally, types, hweight))
+            if _type in tcount:
+                tcount[_type] += 1
+            else:
+                # a column's type only changes when it sees a new type
+                tcount[_type] = 1
+                ctypes[key] = next(gen_types({key: tcount}))["type"]
+
+        count = min(tcount.get(ctypes[k], 0) for k, tcount in tally.items())
+        confidence = _get_confidence(count, hweight)
         consumed.append(record)
-        count = len(consumed)
 
-        if (confidence >= min_conf) or count >= max_iter:
+        if (confidence >= min_conf) or len(consumed) >= max_iter:
             break
 
+    if workers:
+        # stop guessing, the remaining records are still in `chunks`
+        guesses.close()
+
     records = it.chain(consumed, records)
 
     result = {
         "confidence": confidence,
-        "types": types,
-        "count": count,
+        "types": [{"id": k, "type": ctypes[k]} for k in tally],
+        "count": len(consumed),
         "accurate": confidence >= min_conf,
     }
 
@@ -553,6 +861,130 @@ def aggregate(records, key, op, default=0):
     return dict(it.chain(first.items(), [(key, value)]))
 
 
+def _getsize(record):
+    """Estimates the memory used by a record (in bytes)"""
+    return sys.getsizeof(record) + sum(map(sys.getsizeof, record.values()))
+
+
+def _spill(run):
+    """Writes a sorted run of records to a temporary file"""
+    f = TemporaryFile()
+    pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+    [pickler.dump(record) for record in run]
+    return f
+
+
+def _gen_spilled(f):
+    """Lazily reads back the records of a spilled run"""
+    with f:
+        f.seek(0)
+        unpickler = pickle.Unpickler(f)
+
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                break
+
+
+def _merge_spilled(runs, keyfunc, reverse=False):
+    """Merges spilled runs into a single spilled run"""
+    merged = hmerge(*map(_gen_spilled, runs), key=keyfunc, reverse=reverse)
+    return _spill(merged)
+
+
+def sort(records, key, max_memory=None, reverse=False, fan_in=64):
+    """Sorts records by a key. If `max_memory` is set, records are sorted in
+    runs that fit in memory. Each run is spilled to a temporary file, and the
+    runs are lazily merged. Whenever `fan_in` runs of the same size have been
+    spilled, they are merged into a single larger run, so the number of open
+    temporary files stays small.
+
+    Args:
+        records (Iter[dict]): Rows of data whose keys are the field names.
+            E.g., output from any `meza.io` read function.
+
+        key (str or func): Either a fieldname or function which receives a
+            record and selects which value to sort by.
+
+        max_memory (int): Approximate maximum number of bytes of records to
+            hold in memory at once (default: None, i.e., sort in memory).
+
+        reverse (bool): Sort in descending order (default: False).
+        fan_in (int): Maximum number of runs to merge at once (default: 64).
+
+    Returns:
+        Iter[dict]: The sorted records. Like `sorted`, the sort is stable.
+
+    See also:
+        `meza.process.group`
+
+    Examples:
+        >>> records = [{'a': 3}, {'a': 1}, {'a': 2}, {'a': 0}]
+        >>> [r['a'] for r in sort(records, 'a')]
+        [0, 1, 2, 3]
+        >>> [r['a'] for r in sort(records, 'a', max_memory=1)]
+        [0, 1, 2, 3]
+        >>> [r['a'] for r in sort(records, 'a', max_memory=1, fan_in=2)]
+        [0, 1, 2, 3]
+    """
+    keyfunc = key if callable(key) else itemgetter(key)
+    records = iter(records)
+
+    if not max_memory:
+        return iter(sorted(records, key=keyfunc, reverse=reverse))
+
+    fan_in = max(fan_in, 2)
+    merge = partial(_merge_spilled, keyfunc=keyfunc, reverse=reverse)
+
+    # (level, spilled run) tuples, oldest first. Levels never increase, so
+    # merging the last `fan_in` runs of a level keeps the sort stable.
+    runs, run, size = [], [], 0
+
+    for record in records:
+        run.append(record)
+        size += _getsize(record)
+
+        if size >= max_memory:
+            runs.append((0, _spill(sorted(run, key=keyfunc, reverse=reverse))))
+            run, size = [], 0
+
+            while len(runs) >= fan_in and runs[-fan_in][0] == runs[-1][0]:
+                level = runs[-1][0] + 1
+                merged = merge([spilled for _, spilled in runs[-fan_in:]])
+                runs[-fan_in:] = [(level, merged)]
+
+    runs = [spilled for _, spilled in runs]
+
+    while len(runs) >= fan_in:
+        # leave room for the last (in memory) run
+        runs[:fan_in] = [merge(runs[:fan_in])]
+
+    spilled = map(_gen_spilled, runs)
+    run = sorted(run, key=keyfunc, reverse=reverse)
+    return hmerge(*spilled, run, key=keyfunc, reverse=reverse)
+
+
+def _hash_group(records, keyfunc, reducer, field=None):
+    """Reduces records into a dict of groups keyed by keyfunc"""
+    default = (identity, reducer, identity, None)
+    start, op, finish, empty = REDUCERS.get(reducer, default)
+    groups = {}
+
+    for record in records:
+        key = keyfunc(record)
+        value = record if field is None else record.get(field)
+
+        if value is None:
+            groups.setdefault(key, _MISSING)
+        elif groups.get(key, _MISSING) is _MISSING:
+            groups[key] = start(value)
+        else:
+            groups[key] = op(groups[key], value)
+
+    return ((k, empty if v is _MISSING else finish(v)) for k, v in groups.items())
+
+
 def group(records, keyfunc, tupled=True, aggregator=list, **kwargs):
     """Groups records by keyfunc
 
@@ -570,6 +1002,24 @@ def group(records, keyfunc, tupled=True, aggregator=list, **kwargs):
 
         kwargs (dict): Keyword args passed to the aggregator.
 
+    Kwargs:
+        presorted (bool): Records are already sorted (or at least grouped) by
+            keyfunc, so don't sort them (default: False).
+
+        max_memory (int): Approximate maximum number of bytes of records to
+            hold in memory while sorting. See `meza.process.sort`
+            (default: None, i.e., sort in memory).
+
+        reducer (str or func): Reduce each group as it streams by instead of
+            sorting the records. Either a `REDUCERS` key ('sum', 'count',
+            'min', 'max', or 'mean') or a binary function, e.g.,
+            `operator.add`. Only one accumulated value per group is kept in
+            memory. Groups are returned in the order they are first seen, and
+            `aggregator` is ignored (default: None).
+
+        field (str): The field whose (non-null) values `reducer` reduces
+            (default: None, i.e., the records themselves).
+
     Returns:
         Iter(tuple[key, group]): Generator of tuples
 
@@ -587,15 +1037,31 @@ def group(records, keyfunc, tupled=True, aggregator=list, **kwargs):
         >>> next(group(records, 'amount', False))[0] == {
         ...     'item': 'a', 'amount': 200}
         True
+        >>> next(group(records, 'amount', presorted=True))[0]
+        200
+        >>> list(group(records, 'amount', reducer='count'))
+        [(200, 2), (400, 1)]
+        >>> grouped = group(records, 'amount', reducer='mean', field='amount')
+        >>> list(grouped)
+        [(200, 200.0), (400, 400.0)]
     """
     keyfunc = keyfunc if callable(keyfunc) else itemgetter(keyfunc)
-    sorted_records = sorted(records, key=keyfunc)
-    grouped = it.groupby(sorted_records, keyfunc)
-
-    if tupled:
-        result = ((key, aggregator(group, **kwargs)) for key, group in grouped)
+    reducer = kwargs.pop("reducer", None)
+    field = kwargs.pop("field", None)
+    presorted = kwargs.pop("presorted", False)
+    max_memory = kwargs.pop("max_memory", None)
+
+    if reducer:
+        grouped = _hash_group(records, keyfunc, reducer, field)
+        result = grouped if tupled else (value for key, value in grouped)
     else:
-        result = (aggregator(group, **kwargs) for key, group in grouped)
+        sorted_records = records if presorted else sort(records, keyfunc, max_memory)
+        grouped = it.groupby(sorted_records, keyfunc)
+
+        if tupled:
+            result = ((key, aggregator(group, **kwargs)) for key, group in grouped)
+        else:
+            result = (aggregator(group, **kwargs) for key, group in grouped)
 
     return result
 
@@ -691,6 +1157,10 @@ def pivot(records, data, column, op=sum, **kwargs):
         dropna (bool): Do not include columns with missing values
             (default: True)
 
+        max_memory (int): Approximate maximum number of bytes of records to
+            hold in memory while sorting. See `meza.process.sort`
+            (default: None, i.e., sort in memory).
+
     Yields:
         dict: Record. A row of data whose keys are the field names.
 
@@ -720,9 +1190,10 @@ def pivot(records, data, column, op=sum, **kwargs):
     rows = kwargs.get("rows", keys.difference([data, column]))
     fill_value = kwargs.get("fill_value")
     dropna = kwargs.get("dropna", True)
+    max_memory = kwargs.get("max_memory")
     filterer = lambda x: x[0] in rows
     keyfunc = lambda r: tuple(map(r.get, it.chain(rows, [column])))
-    grouped = group(chained, keyfunc)
+    grouped = group(chained, keyfunc, max_memory=max_memory)
 
     def gen_raw(grouped):
         for key, _group in grouped:
@@ -737,7 +1208,9 @@ def pivot(records, data, column, op=sum, **kwargs):
         differences = (set(r).difference(rows) for r in raw)
         columns = set(it.chain.from_iterable(differences))
 
-    for key, _group in group(raw, lambda r: tuple(map(r.get, rows))):
+    rkeyfunc = lambda r: tuple(map(r.get, rows))
+
+    for key, _group in group(raw, rkeyfunc, max_memory=max_memory):
         if not dropna:
             empty = [dict(zip(columns, it.repeat(fill_value)))]
             _group = it.chain(empty, _group)
@@ -782,7 +1255,61 @@ def normalize(records, data="", column="", rows=None, invert=False):
             yield dict(it.chain([(column, row), (data, r.get(row))], filtered))
 
 
-def join(left, right):
+def _get_keyfunc(on):
+    """Creates a join keyfunc from a field name, a list of field names, or a
+    function"""
+    if callable(on):
+        keyfunc = on
+    elif isinstance(on, str):
+        keyfunc = lambda r: r.get(on)
+    else:
+        fields = list(on)
+        keyfunc = lambda r: tuple(map(r.get, fields))
+
+    return keyfunc
+
+
+def _is_null_key(key):
+    """Determines if a join key is (or contains) null, and so can't match"""
+    return key is None or (isinstance(key, tuple) and any(k is None for k in key))
+
+
+def _gen_joined(left, right, lkey, rkey, keep_left, keep_right, **kwargs):
+    """Hash joins the `left` records against a table of the `right` records.
+    Yields the merged (left, right) matches (in left order) and the unmatched
+    records to keep. If `build_left`, the table is built from the (smaller)
+    `left` keys instead, and only the matching `right` records are kept.
+    """
+    table, unmatched, matched = {}, {}, set()
+
+    if kwargs.pop("build_left", False):
+        keys = set(map(lkey, left))
+
+        for record in right:
+            key = rkey(record)
+            found = key in keys and not _is_null_key(key)
+            (table if found else unmatched).setdefault(key, []).append(record)
+    else:
+        for record in right:
+            table.setdefault(rkey(record), []).append(record)
+
+    for record in left:
+        key = lkey(record)
+        matches = None if _is_null_key(key) else table.get(key)
+
+        if matches:
+            matched.add(key)
+            yield from (merge([record, match], **kwargs) for match in matches)
+        elif keep_left:
+            yield merge([record])
+
+    if keep_right:
+        rest = (v for k, v in table.items() if k not in matched)
+        rest = it.chain(rest, unmatched.values())
+        yield from map(merge, zip(it.chain.from_iterable(rest)))
+
+
+def join(left, right, on=None, how="inner", **kwargs):
     """Performs a SQL like merge.
 
     Args:
@@ -792,9 +1319,31 @@ def join(left, right):
         right (Iter[dict]): Rows of data whose keys are the field names.
             E.g., output from any `meza.io` read function.
 
+        on (str or Seq[str] or func): Field name(s) to join on, or a function
+            which receives a record and returns its join key. If not set (and
+            neither are `left_on` or `right_on`), all combinations of left and
+            right records are merged (default: None).
+
+        how (str): Type of keyed join. One of 'inner', 'left', 'right', or
+            'outer'. The records are returned in left order (each with its
+            right matches in right order), followed by any kept unmatched
+            right records grouped by key. Unmatched records are returned
+            unmerged. Like SQL, records whose join key is null (or, for
+            multiple fields, contains a null) never match (default: 'inner').
+
+        kwargs (dict): Keyword arguments passed to `merge`, e.g., `pred` and
+            `op` to combine overlapping fields.
+
+    Kwargs:
+        left_on (str or Seq[str] or func): Like `on`, but for `left` only.
+        right_on (str or Seq[str] or func): Like `on`, but for `right` only.
+
     Returns:
         Iterator of records.
 
+    Raises:
+        ValueError: If `how` is invalid or only one side has a join key.
+
     See also:
         `meza.process.merge`
 
@@ -806,8 +1355,39 @@ def join(left, right):
         >>> next(join(left, right)) == {
         ...     'length': 5, 'species': 'setosa', 'color': u'red'}
         True
+        >>> right = [
+        ...     {'species': 'versi', 'color': 'blue'},
+        ...     {'name': 'virginica', 'color': 'red'}]
+        >>> list(join(left, right, 'species')) == [
+        ...     {'length': 6, 'species': 'versi', 'color': 'blue'}]
+        True
+        >>> len(list(join(left, right, 'species', 'outer')))
+        3
+        >>> list(join(left + [{}], right + [{'color': 'green'}], 'species'))
+        [{'length': 6, 'species': 'versi', 'color': 'blue'}]
+        >>> kwargs = {'left_on': 'species', 'right_on': 'name', 'how': 'right'}
+        >>> list(join(left, right, **kwargs)) == [
+        ...     {'species': 'versi', 'color': 'blue'},
+        ...     {'name': 'virginica', 'color': 'red'}]
+        True
     """
-    return map(merge, it.product(left, right))
+    left_on = kwargs.pop("left_on", None) or on
+    right_on = kwargs.pop("right_on", None) or on
+
+    if how not in {"inner", "left", "right", "outer"}:
+        raise ValueError(f"Invalid join type: `{how}`.")
+    elif bool(left_on) != bool(right_on):
+        raise ValueError("Both `left_on` and `right_on` must be set.")
+    elif not left_on:
+        return map(partial(merge, **kwargs), it.product(left, right))
+
+    # build the hash table on the smaller side (if known) and stream the other
+    sized = hasattr(left, "__len__") and hasattr(right, "__len__")
+    build_left = sized and len(left) < len(right)
+    keep_left = how in {"left", "outer"}
+    keep_right = how in {"right", "outer"}
+    args = (left, right, _get_keyfunc(left_on), _get_keyfunc(right_on))
+    return _gen_joined(*args, keep_left, keep_right, build_left=build_left, **kwargs)
 
 
 def tfilter(records, field, pred=None):
@@ -848,7 +1428,29 @@ def tfilter(records, field, pred=None):
     return filter(predicate, records)
 
 
-def unique(records, fields=None, pred=None, bufsize=4096):
+def _get_unique_keyfunc(fields=None, pred=None, digest=None):
+    """Creates a function which receives a record and returns the entry used
+    to test its uniqueness"""
+    if pred:
+        keyfunc = pred
+    elif fields:
+        fields = list(fields)
+        keyfunc = lambda r: tuple(r.get(field, _MISSING) for field in fields)
+    else:
+        keyfunc = lambda r: tuple(sorted(r.items()))
+
+    if digest is True:
+        hasher = partial(hashlib.blake2b, digest_size=16)
+    elif digest:
+        hasher = getattr(hashlib, digest)
+
+    if digest:
+        return lambda r: hasher(str(keyfunc(r)).encode(ENCODING)).digest()
+    else:
+        return keyfunc
+
+
+def unique(records, fields=None, pred=None, bufsize=4096, **kwargs):
     """ Yields unique records
 
     Args:
@@ -861,7 +1463,29 @@ def unique(records, fields=None, pred=None, bufsize=4096):
         pred (func): Predicate. Receives a record and should return a value for
             testing uniqueness. Overrides `fields`.
 
-        bufsize (Int): Max size in bytes of the lookup table.
+        bufsize (Int): Max number of entries in the lookup table when `mode`
+            is 'window'.
+
+        kwargs (dict): Keyword arguments
+
+    Kwargs:
+        mode (str): How to track the records already seen. One of 'window'
+            (only compare against the last `bufsize` unique records), 'exact'
+            (compare against all unique records), or 'bloom' (compare against
+            all unique records using a fixed size `meza.fntools.BloomFilter`.
+            Some unique records may be dropped as duplicates)
+            (default: 'window').
+
+        digest (bool or str): Store hash digests of the entries instead of the
+            entries themselves. Either True (for a 16 byte blake2b digest) or a
+            hashlib algorithm name (default: False).
+
+        capacity (int): Expected number of unique records when `mode` is
+            'bloom' (default: 1000000).
+
+        error_rate (float): Rate of unique records wrongly dropped once
+            `capacity` unique records are seen when `mode` is 'bloom'
+            (default: 0.001).
 
     Yields:
         dict: Record. A row of data whose keys are the field names.
@@ -883,18 +1507,40 @@ def unique(records, fields=None, pred=None, bufsize=4096):
         >>> next(it.islice(unique(records, ['name']), 3, 4))['name'] == \
 'Iñtërnâtiônàližætiøn'
         True
+        >>> len(list(unique(records, ['name'], bufsize=1)))
+        8
+        >>> len(list(unique(records, ['name'], mode='exact', digest=True)))
+        5
+        >>> len(list(unique(records, ['name'], mode='bloom', capacity=100)))
+        5
+        >>> len(list(unique([{'name': None}, {}, {}], ['name'])))
+        2
     """
-    seen = deque([], bufsize)
+    mode = kwargs.get("mode", "window")
+    keyfunc = _get_unique_keyfunc(fields, pred, kwargs.get("digest"))
+
+    if mode == "bloom":
+        error_rate = kwargs.get("error_rate", 0.001)
+        seen = ft.BloomFilter(kwargs.get("capacity", 1000000), error_rate)
+    elif mode in {"window", "exact"}:
+        seen = set()
+    else:
+        raise ValueError(f"Invalid mode: `{mode}`.")
+
+    window = deque()
 
     for r in records:
-        if not pred:
-            unique = set(fields or r.keys())
-            items = sorted((k, v) for k, v in r.items() if k in unique)
+        entry = keyfunc(r)
 
-        entry = pred(r) if pred else tuple(items)
+        if entry not in seen:
+            seen.add(entry)
+
+            if mode == "window":
+                window.append(entry)
+
+            if len(window) > bufsize:
+                seen.discard(window.popleft())
 
-        if entry not in set(seen):
-            seen.append(entry)
             yield r
 
 
@@ -954,15 +1600,21 @@ def get_suffix(cpos, pos, k=None, count=None, chunksize=None):
     return suffix
 
 
-def split(records, key=None, count=None, chunksize=None):
+def split(records, key=None, count=None, chunksize=None, max_memory=None):
     """Split records into bite sized pieces. Like unix `split`, but for
-    tabular data.
+    tabular data. If `max_memory` is set (and `chunksize` or `count` isn't),
+    records are grouped by `key` using an external sort.
     """
     chunksize = chunksize or count
 
-    for cpos, records_chunk in enumerate(ft.chunk(records, chunksize)):
+    if chunksize or not (key and max_memory):
+        chunks = ft.chunk(records, chunksize)
+    else:
+        chunks = [records]
+
+    for cpos, records_chunk in enumerate(chunks):
         if key:
-            groups = group(records_chunk, itemgetter(key))
+            groups = group(records_chunk, itemgetter(key), max_memory=max_memory)
         else:
             groups = [(None, records_chunk)]
 
@@ -70,7 +70,8 @@ class UnicodeWriter:
         data = self.queue.getvalue()
         decoded = data.lstrip("\x00")
         self.f.write(decoded)
-        self.queue.truncate(0)
+        self.queue.seek(0)
+        self.queue.truncate()
 
     def writerows(self, rows):
         """Writes dictionary rows
@@ -54,6 +54,16 @@ class TestIterStringIO:
     def test_is_int(self):
         assert not ft.is_int("5/4/82")
 
+    def test_numeric_parser(self):
+        parser = ft.get_numeric_parser(".", ",")
+        assert parser is ft.get_numeric_parser(".", ",")
+        assert "2123.45" == parser.strip("€2.123,45")
+        assert 2123.45 == parser.parse("2.123,45")
+        assert 10.5 == ft.get_numeric_parser("ab", "cd").parse("$1ab0cd5")
+        assert ft.get_numeric_parser().parse("02139") is None
+        assert 2139.0 == ft.get_numeric_parser().parse("02139", strip_zeros=True)
+        assert ft.get_numeric_parser().parse("spam") is None
+
     def test_is_bool(self):
         assert ft.is_bool("y")
         assert ft.is_bool(1)
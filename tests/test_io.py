@@ -6,21 +6,27 @@ tests.test_io
 Provides main unit tests.
 """
 import itertools as it
+import asyncio
+import csv
 
 from os import path as p
-from json import loads
+from json import loads, dumps
 from tempfile import TemporaryFile
-from io import StringIO, BytesIO
+from io import StringIO, BytesIO, BufferedReader, SEEK_CUR
 from decimal import Decimal
+from datetime import date
 from urllib.request import urlopen
 from contextlib import closing
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 import requests
+import xlrd
 import responses
 import pygogo as gogo
 import pytest
 
-from meza import io, convert as cv, DATA_DIR
+from meza import io, convert as cv, DATA_DIR, BOM, ENCODING
 
 __INITIALIZED__ = False
 
@@ -64,7 +70,13 @@ class TestIterStringIO:
         self.text.seek(0)
         assert bytearray(b"line one") == next(self.text)
         assert bytearray(b"line two") == next(self.text)
-        assert 16 == self.text.tell()
+        assert 18 == self.text.tell()
+
+        self.text.seek(9)
+        assert bytearray(b"line two") == self.text.readline()
+        assert bytearray(b"line three") == self.text.readline()
+        self.text.seek(-11, SEEK_CUR)
+        assert bytearray(b"line three") == self.text.readline()
 
         self.text.seek(0)
         lines = list(self.text.readlines())
@@ -99,6 +111,27 @@ class TestIterStringIO:
         self.ints.seek(0)
         assert bytearray(b"2") == self.ints.read(1)
 
+    def test_decode(self):  # pylint: disable=R0201
+        """Test for decoding the content"""
+        text = io.IterStringIO([b"I\xc3", b"\xb1t\n", b"\xc3"], decode=True)
+        assert "Iñt" == text.readline()
+
+        with pytest.raises(UnicodeDecodeError):
+            text.read()
+
+    def test_readinto(self):
+        """Test for reading into a buffer"""
+        buf = bytearray(4)
+        assert 4 == self.text.readinto(buf)
+        assert bytearray(b"line") == buf
+        assert 4 == self.text.tell()
+
+        chunks = iter(["Iñtër", b"n\xc3\xa2", "tiônàližætiøn\n", "line two"])
+        f = BufferedReader(io.IterStringIO(chunks), 4)
+        assert "Iñtërnâtiônàližætiøn\n".encode() == f.readline()
+        assert b"line two" == f.read()
+        assert b"" == f.read()
+
 
 class TestUnicodeReader:
     """Unit tests for unicode support"""
@@ -186,6 +219,53 @@ class TestUnicodeReader:
         assert self.row1 == next(records)
         assert self.row4 == next(records)
 
+    def test_encoding_cache(self, tmp_path):
+        """Test that encoding detection is sampled and cached per file"""
+        filepath = tmp_path / "latin1.csv"
+        text = "a,b\n" + "1,2\n" * 100000 + "ñ,ü\n"
+        filepath.write_bytes(text.encode("latin-1"))
+        filepath = str(filepath)
+
+        hits = io._get_encoding.cache_info().hits
+        encoding = io.get_encoding(filepath, sample_size=2 ** 12)
+        assert encoding == io.get_encoding(filepath, sample_size=2 ** 12)
+        assert hits + 1 == io._get_encoding.cache_info().hits
+        assert "ñ" == "ñ".encode("latin-1").decode(encoding)
+
+        records = io.read_csv(filepath, encoding="ascii")
+        assert {"a": "ñ", "b": "ü"} == list(records)[-1]
+
+    def test_retry_encoding_unsampled(self, tmp_path):  # pylint: disable=R0201
+        """Test that detection after a failed decode examines the whole file"""
+        filepath = tmp_path / "latin1.csv"
+        rows = ["%i,%i" % (i, i) for i in range(100000)]
+        rows[40000] = "ñ,ü"
+        text = "a,b\n" + "\n".join(rows) + "\n"
+        filepath.write_bytes(text.encode("latin-1"))
+
+        with open(filepath, encoding="utf-8") as f:
+            records = list(io.read_csv(f))
+
+        assert 100000 == len(records)
+        assert {"a": "ñ", "b": "ü"} == records[40000]
+
+    def test_resume_encoding(self, tmp_path):
+        """Test for switching encodings in place when a bad byte is found"""
+        filepath = tmp_path / "mixed.csv"
+        content = "a,b\r\n" + "1,2\r\n" * 5000 + "ñ,ü\r\n"
+        filepath.write_bytes(content.encode("latin-1"))
+        filepath = str(filepath)
+
+        with io.Redecoder(filepath, "utf-8", chunksize=2 ** 10) as f:
+            assert "a,b\n" == next(f)
+            assert "utf-8" == f.encoding
+            assert "ñ,ü\n" == f.readlines()[-1]
+            assert "utf-8" != f.encoding
+
+        records = list(io.read_csv(filepath, encoding="utf-8"))
+        assert 5001 == len(records)
+        assert {"a": "ñ", "b": "ü"} == records[-1]
+
     def test_kwargs(self):
         """Test for passing kwargs while reading csv files"""
         filepath = p.join(io.DATA_DIR, "utf8.csv")
@@ -242,6 +322,31 @@ class TestInput:
         records = io.read_json(filepath, newline=True)
         assert {"a": 2, "b": 3} == next(records)
 
+        content = f'{BOM}{{"a": "{BOM}b"}}\n\n{{"c": 1}}\r\n'.encode(ENCODING)
+        records = io.read_json(BytesIO(content), newline=True, chunksize=4)
+        assert [{"a": f"{BOM}b"}, {"c": 1}] == list(records)
+
+    def test_newline_json_latin1(self, tmp_path):  # pylint: disable=R0201
+        """Test for reading non utf-8 newline delimited JSON files"""
+        expected = [{"a": "x"}] * 3 + [{"a": "ñ"}, {"a": "é"}]
+        content = '{"a": "x"}\r' * 3 + '{"a": "ñ"}\n{"a": "é"}\r\n'
+        filepath = tmp_path / "latin1.json"
+        filepath.write_bytes(content.encode("latin-1"))
+        assert expected == list(io.read_json(str(filepath), newline=True))
+
+        f = BytesIO(content.encode("latin-1"))
+        assert expected == list(io.read_json(f, newline=True))
+
+    def test_newline_json_output(self):  # pylint: disable=R0201
+        """Test for writing newline delimited JSON"""
+        records = [{"b": Decimal("1.5"), "a": date(1971, 1, 1)}, {2: None}]
+        json = cv.records2json(records, newline=True)
+        assert [{"a": "1971-01-01", "b": 1.5}, {"2": None}] == list(map(loads, json))
+
+        # the output doesn't depend on whether `orjson` is installed
+        json = cv.records2json([{"b": float("nan"), "a": 1}], newline=True)
+        assert '{"a": 1, "b": NaN}' == json.read()
+
     def test_xls(self):
         """Test for reading excel files"""
         filepath = p.join(io.DATA_DIR, "test.xlsx")
@@ -258,7 +363,43 @@ class TestInput:
         records = io.read_xls(filepath, sanitize=True, sheet=3, **kwargs)
         assert self.sheet1 == next(records)
 
-    def test_csv(self):
+    def test_xlsx_streaming(self):  # pylint: disable=R0201
+        """Test for incrementally reading xlsx sheets"""
+        filepath = p.join(io.DATA_DIR, "test.xlsx")
+        book = xlrd.open_workbook(filepath, ragged_rows=True)
+
+        for num in range(book.nsheets):
+            sheet = book.sheet_by_index(num)
+            nums = range(sheet.nrows)
+            expected = [(list(sheet.row_types(i)), sheet.row_values(i)) for i in nums]
+            mode, rows = io._open_sheet(filepath, num)
+            assert book.datemode == mode
+            assert expected == [(list(types), values) for _, types, values in rows]
+
+        kwargs = {"first_row": 1, "first_col": 1, "pad_rows": True}
+        records = list(io.read_xls(filepath, sheet=3, has_header=False, **kwargs))
+        assert 6 == len(records)
+        assert "text" == records[0]["column_1"]
+        assert {"column_1": "Unicode! Σ"} == {k: v for k, v in records[-1].items() if v}
+        assert "" == records[-1]["column_9"]
+
+    def test_xls_row_sanitizer(self):  # pylint: disable=R0201
+        """Test for converting whole rows of xls cells"""
+        filepath = p.join(io.DATA_DIR, "test.xlsx")
+        mode, rows = io._open_sheet(filepath, 0)
+        sanitize = io.get_cell_sanitizer(mode)
+        sanitize_row = io.get_row_sanitizer(mode, maxsize=2)
+
+        for _, types, values in rows:
+            expected = list(map(sanitize, types, values))
+            assert expected == sanitize_row(types, values)
+
+        types = [xlrd.XL_CELL_DATE] * 4 + [xlrd.XL_CELL_BOOLEAN, xlrd.XL_CELL_ERROR]
+        values = [30075.0, 0.5, 30075.0, 30076.0, 0, 0x07]
+        expected = ["1982-05-04", "12:00:00", "1982-05-04", "1982-05-05", "False"]
+        assert expected + ["#DIV/0!"] == sanitize_row(types, values)
+
+    def test_csv(self):  # pylint: disable=R0201
         """Test for reading csv files"""
         filepath = p.join(io.DATA_DIR, "no_header_row.csv")
         records = io.read_csv(filepath, has_header=False)
@@ -307,6 +448,179 @@ class TestInput:
         assert expected == records[0]
         assert 100 == len(records)
 
+    def test_csv_columnar(self):
+        """Test for reading csv files as batches of columns"""
+        filepath = p.join(io.DATA_DIR, "iris.csv")
+        records = list(io.read_csv(filepath, last_row=-50))
+        batches = list(io.read_csv(filepath, last_row=-50, batch_size=40))
+        assert [40, 40, 20] == [len(b["species"]) for b in batches]
+
+        rows = (zip(*b.values()) for b in batches)
+        keys = list(batches[0])
+        assert records == [dict(zip(keys, r)) for r in it.chain(*rows)]
+
+        filepath = p.join(io.DATA_DIR, "test_bad.csv")
+        kwargs = {"sanitize": True, "first_row": 1, "first_col": 1}
+        records = list(io.read_csv(filepath, **kwargs))
+        batch = next(io.read_csv(filepath, columnar=True, **kwargs))
+        assert {k: [r.get(k) for r in records] for k in batch} == batch
+
+        types = [
+            {"id": "sepal_length", "type": "text"},
+            {"id": "species", "type": "text"},
+        ]
+
+        filepath = p.join(io.DATA_DIR, "iris.csv")
+        records = io.read_csv(filepath)
+        batches = io.read_csv(filepath, batch_size=25)
+        expected = cv.records2array(records, types, native=True)
+        result = cv.records2array(batches, types, native=True, columnar=True)
+        assert expected == result
+
+    def test_csv_indexed(self, tmp_path):
+        """Test for reading csv files via a row index"""
+        filepath = p.join(io.DATA_DIR, "iris.csv")
+        records = list(io.read_csv(filepath))
+
+        for last_row in [None, 10, -50]:
+            expected = list(io.read_csv(filepath, last_row=last_row))
+            result = io.read_csv(filepath, indexed=True, last_row=last_row)
+            assert expected == list(result)
+
+        result = io.read_csv(filepath, indexed=True, rows=slice(-3, -1))
+        assert records[-3:-1] == list(result)
+
+        filepath = p.join(io.DATA_DIR, "mac_newlines.csv")
+        expected = list(io.read_csv(filepath))
+        assert expected == list(io.read_csv(filepath, indexed=True))
+
+        filepath = str(tmp_path / "quoted.csv")
+
+        with open(filepath, "w", newline="") as f:
+            f.write('a,b\r\n1,"x\r\ny ""z"""\r\n2,"\n"\r\n3,c\r\n')
+
+        offsets = io.index_csv(filepath, sidecar=True)
+        assert [0, 5, 21, 28, 33] == offsets.tolist()
+        assert p.exists(filepath + ".idx")
+
+        expected = [{"a": "2", "b": "\n"}]
+        result = io.read_csv(filepath, indexed=True, sidecar=True, rows=slice(1, 2))
+        assert expected == list(result)
+
+        # a truncated sidecar is rebuilt, and one that can't be written is
+        # only kept in memory
+        with open(filepath + ".idx", "r+b") as f:
+            f.truncate(p.getsize(filepath + ".idx") - 8)
+
+        assert [0, 5, 21, 28, 33] == io.index_csv(filepath, sidecar=True).tolist()
+        sidecar = str(tmp_path / "missing" / "quoted.idx")
+        assert [0, 5, 21, 28, 33] == io.index_csv(filepath, sidecar=sidecar).tolist()
+
+        for kwargs in [{"quoting": csv.QUOTE_NONE}, {"escapechar": "\\"}]:
+            with pytest.raises(ValueError):
+                io.read_csv(filepath, indexed=True, **kwargs)
+
+        with open(filepath, "rb") as f, pytest.raises(ValueError):
+            io.read_csv(f, indexed=True)
+
+        filepath = str(tmp_path / "latin1.csv")
+        rows = ["%i,%i" % (i, i) for i in range(10000)]
+        rows[4000] = "ñ,ü"
+
+        with open(filepath, "w", encoding="latin-1") as f:
+            f.write("a,b\n" + "\n".join(rows) + "\n")
+
+        expected = list(io.read_csv(filepath))
+        assert {"a": "ñ", "b": "ü"} == expected[4000]
+        assert expected == list(io.read_csv(filepath, indexed=True))
+        result = io.read_csv(filepath, indexed=True, rows=slice(4000, 4001))
+        assert expected[4000:4001] == list(result)
+
+    def test_csv_bom(self, tmp_path):  # pylint: disable=R0201
+        """Test for skipping a BOM at the start of the file"""
+        filepath = str(tmp_path / "bom.csv")
+        expected = [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+
+        with open(filepath, "w", encoding=ENCODING) as f:
+            f.write(BOM + "a,b\n1,2\n3,4\n")
+
+        assert expected == list(io.read_csv(filepath))
+        assert expected == list(io.read_csv(filepath, indexed=True))
+        assert expected == list(io.read_csv(filepath, mode="rb"))
+
+        with open(filepath, encoding=ENCODING) as f:
+            assert expected == list(io.read_csv(f))
+
+        with open(filepath, "rb") as f:
+            assert expected == list(io.read_csv(BytesIO(f.read())))
+
+        # file like objects that can't be peeked fall back to cleaning records
+        class Unpeekable(StringIO):
+            def tell(self):
+                raise OSError
+
+        reader = lambda f, **kw: (line.strip() for line in f)
+        f = Unpeekable(BOM + "a,b\n1,2\n")
+        assert ["a,b", "1,2"] == list(io.read_any(f, reader))
+
+    def test_csv_workers(self):
+        """Test for reading csv files in parallel"""
+        filepath = p.join(io.DATA_DIR, "iris.csv")
+        kwargs = {"workers": 2, "chunksize": 40}
+        expected = list(io.read_csv(filepath, last_row=-5))
+        assert expected == list(io.read_csv(filepath, last_row=-5, **kwargs))
+
+        filepath = p.join(io.DATA_DIR, "no_header_row.csv")
+        kwargs.update({"has_header": False, "custom_header": ["a", "b", "c"]})
+        expected = [{"a": "1", "b": "2", "c": "3"}, {"a": "4", "b": "5", "c": "6"}]
+        assert expected == list(io.read_csv(filepath, **kwargs))
+
+        with pytest.raises(ValueError):
+            io.read_csv(filepath, workers=2, columnar=True)
+
+        filepath = p.join(io.DATA_DIR, "windows1252.csv")
+        expected = list(io.read_csv(filepath))
+        assert expected == list(io.read_csv(filepath, workers=2, chunksize=1))
+
+    def test_join_workers(self):  # pylint: disable=R0201
+        """Test for reading multiple files concurrently"""
+        names = ["test.csv", "test.xls", "test.json", "iris.csv"]
+        filepaths = [p.join(io.DATA_DIR, name) for name in names]
+        expected = list(io.join(*filepaths))
+        assert expected == list(io.join(*filepaths, workers=2))
+
+        kwargs = {"workers": 2, "threads": True, "ordered": False}
+        result = list(io.join(*filepaths, max_inflight=1, **kwargs))
+        assert sorted(map(repr, expected)) == sorted(map(repr, result))
+
+        missing = p.join(io.DATA_DIR, "missing.csv")
+
+        for workers in [2, None]:
+            with pytest.raises(io.JoinError) as excinfo:
+                list(io.join(filepaths[0], missing, workers=workers))
+
+            assert missing == excinfo.value.filepath
+            assert missing in str(excinfo.value)
+
+    def test_yaml(self):  # pylint: disable=R0201
+        """Test for streaming yaml files"""
+        filepath = p.join(io.DATA_DIR, "test.yml")
+        records = list(io.read_yaml(filepath))
+        assert 5 == len(records)
+        assert "Chicago Tribune" == records[2]["text"]
+
+        content = "- &a {x: 1}\n- *a\n---\nitems:\n  - y: 2\n"
+        expected = [{"x": 1}, {"x": 1}, {"y": 2}]
+        records = list(io.read_yaml(StringIO(content)))
+        assert expected[:2] + ["items"] == records
+
+        records = io.read_yaml(StringIO(content), path="items.item")
+        assert expected[2:] == list(records)
+
+        content = "- &a {x: 1}\n- *a\n---\n- &a {x: 2}\n- *a\n"
+        expected = [{"x": 1}, {"x": 1}, {"x": 2}, {"x": 2}]
+        assert expected == list(io.read_yaml(StringIO(content)))
+
     def test_dbf(self):  # pylint: disable=R0201
         """Test for reading dbf files"""
         filepath = p.join(io.DATA_DIR, "test.dbf")
@@ -340,6 +654,36 @@ class TestInput:
         with pytest.raises(StopIteration):
             next(records)
 
+    @pytest.mark.skipif(not io.etree, reason="requires lxml")
+    def test_html_lxml(self):  # pylint: disable=R0201
+        """Test for incrementally reading html tables with lxml"""
+        content = "<table><tr><td>x</td></tr></table><table><tr><th>a</th>"
+        content += "<th>b</th></tr><tr><td> 1 </td><td><a>2</a></td></tr>"
+        content += "<tr><td>3</td><td>4</td></tr></table><table>"
+        rows = io._gen_html_rows(StringIO(content), table=1)
+        expected = [(["a", "b"], []), ([], ["1", "2"]), ([], ["3", "4"])]
+        assert expected == list(rows)
+
+        records = io.read_html(StringIO(content), table=1)
+        assert {"a": "3", "b": "4"} == list(records)[1]
+
+    @pytest.mark.skipif(not io.etree, reason="requires lxml")
+    def test_html_truncated(self, monkeypatch):  # pylint: disable=R0201
+        """Test for reading html tables from truncated or malformed markup"""
+        content = "<table><tr><th>a</th><th>b</th></tr><tr><td>1</td><td>2</td>"
+        content += "</tr><tr><td>3</td><td>4"
+        expected = [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+        assert expected == list(io.read_html(StringIO(content)))
+
+        def gen_html_rows(f, table=0):
+            yield (["a", "b"], [])
+            yield ([], ["1", "2"])
+            raise io.etree.LxmlError("malformed")
+
+        # errors raised while iterating fall back to BeautifulSoup
+        monkeypatch.setattr(io, "_gen_html_rows", gen_html_rows)
+        assert expected == list(io.read_html(StringIO(content)))
+
     def test_excel_html_export(self):  # pylint: disable=R0201
         """Test for reading an html table exported from excel"""
         filepath = p.join(io.DATA_DIR, "test.htm")
@@ -410,6 +754,16 @@ class TestInput:
             assert b"1,2,3" == next(utf8_f).strip()
             assert "4,5,ʤ" == next(utf8_f).decode("utf-8")
 
+    def test_reencode_blocks(self):  # pylint: disable=R0201
+        text = "a,b\r\n1,ñ\r\n2,ʤ\r\n"
+        f = BytesIO(text.encode("utf-16-le"))
+        records = io.read_csv(f, encoding="utf-16-le")
+        assert [{"a": "1", "b": "ñ"}, {"a": "2", "b": "ʤ"}] == list(records)
+
+        f = BytesIO(text.encode("utf-16-le"))
+        reencoded = io.Reencoder(f, "utf-16-le", chunksize=4)
+        assert text.encode(ENCODING) == BufferedReader(reencoded, 3).read()
+
 
 class TestUrlopen:
     """Unit tests for reading files with urlopen"""
@@ -556,6 +910,80 @@ class TestGeoJSON:
         assert "EPSG:4269" == geojson["crs"]["properties"]["name"]
 
 
+class TestAsync:
+    """Unit tests for reading files asynchronously"""
+
+    @staticmethod
+    async def collect(records):
+        return [record async for record in records]
+
+    async def stream(self, content, reader, chunksize=5, **kwargs):
+        stream = asyncio.StreamReader()
+
+        async def feed():
+            for pos in range(0, len(content), chunksize):
+                stream.feed_data(content[slice(pos, pos + chunksize)])
+                await asyncio.sleep(0)
+
+            stream.feed_eof()
+
+        task = asyncio.create_task(feed())
+        records = await self.collect(reader(stream, **kwargs))
+        await task
+        return records
+
+    def test_aread_csv(self):
+        """Test for asynchronously reading csv files and streams"""
+        filepath = p.join(io.DATA_DIR, "test.csv")
+        expected = list(io.read_csv(filepath, sanitize=True))
+        records = io.aread_csv(filepath, sanitize=True, batch_records=2)
+        assert expected == asyncio.run(self.collect(records))
+
+        with open(filepath, "rb") as f:
+            content = f.read()
+
+        kwargs = {"sanitize": True, "batch_records": 2}
+        assert expected == asyncio.run(self.stream(content, io.aread_csv, **kwargs))
+
+        content = (BOM + 'a,b\r\n1,"x\r\ny"\r\n2,ñ\r\n').encode(ENCODING)
+        expected = [{"a": "1", "b": "x\ny"}, {"a": "2", "b": "ñ"}]
+        assert expected == asyncio.run(self.stream(content, io.aread_csv))
+
+        filepath = p.join(io.DATA_DIR, "latin1.csv")
+
+        with open(filepath, "rb") as f:
+            content = f.read()
+
+        expected = list(io.read_csv(filepath))
+        assert 2 == len(expected)
+        assert expected == asyncio.run(self.stream(content, io.aread_csv))
+
+    def test_aread_executor(self):
+        """Test for asynchronously reading files with a given executor"""
+        filepath = p.join(io.DATA_DIR, "test.csv")
+        expected = list(io.read_csv(filepath))
+
+        with ThreadPoolExecutor(2) as executor:
+            records = io.aread_csv(filepath, executor=executor, batch_records=2)
+            assert expected == asyncio.run(self.collect(records))
+
+        with ProcessPoolExecutor(1) as executor:
+            with pytest.raises(ValueError):
+                io.aread_csv(filepath, executor=executor)
+
+    def test_aread_json(self):
+        """Test for asynchronously reading json streams"""
+        records = [{"a": i, "b": "ñ" * i} for i in range(10)]
+        content = "\n".join(map(dumps, records)).encode(ENCODING)
+        reader = partial(io.aread_json, newline=True)
+        assert records == asyncio.run(self.stream(content, reader))
+
+        content = dumps(records).encode(ENCODING)
+        assert records == asyncio.run(self.stream(content, io.aread_json))
+        reader = partial(io.aread, ext="json")
+        assert records == asyncio.run(self.stream(content, reader))
+
+
 class TestOutput:
     """Unit tests for writing files"""
 
@@ -579,3 +1007,16 @@ class TestOutput:
         r = requests.get(url, stream=True)  # pylint: disable=C0103
         with TemporaryFile() as tf:
             assert 55 == io.write(tf, r.iter_content)
+
+    def test_write_stream(self, tmp_path):  # pylint: disable=R0201
+        """Test for lazily converting records while writing them"""
+        records = [{"a": str(i), "b": "Iñtërnâtiônàližætiøn"} for i in range(25)]
+        filepath = str(tmp_path / "out.json")
+        content = cv.records2json(iter(records), stream=True, chunksize=4)
+        assert io.write(filepath, content, chunksize=16)
+        assert records == list(io.read_json(filepath))
+
+        filepath = str(tmp_path / "out.csv")
+        content = cv.records2csv(iter(records), bom=True, stream=True, chunksize=4)
+        assert io.write(filepath, content, chunksize=16)
+        assert records == list(io.read_csv(filepath))
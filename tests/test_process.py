@@ -7,10 +7,12 @@ Provides main unit tests.
 """
 import itertools as it
 
+from datetime import date
 from decimal import Decimal
 from functools import partial
 from operator import itemgetter, truediv, eq, is_not, contains
 from collections import defaultdict
+from tempfile import TemporaryFile
 
 import pytest
 
@@ -35,6 +37,35 @@ class Test:
         with pytest.raises(ValueError):
             next(pr.type_cast(records, types, warn=True))
 
+    def test_typecast_columnar(self):
+        records = [
+            {"int": "1", "float": "1.5", "bool": "yes", "date": "5/4/82"},
+            {"int": "$2", "float": "0123", "bool": "spam", "date": "5/4/82"},
+            {"int": "", "float": "-0", "bool": "false", "date": ""},
+        ]
+
+        types = [{"id": k, "type": k} for k in records[0]]
+        batch = {k: [r[k] for r in records] for k in records[0]}
+        expected = list(pr.type_cast(records, types))
+        result = next(pr.type_cast([batch], types, columnar=True))
+        assert expected == [dict(zip(result, r)) for r in zip(*result.values())]
+
+        with pytest.raises(ValueError):
+            next(pr.type_cast([batch], types, warn=True, columnar=True))
+
+    def test_typecast_dates(self):
+        values = ["2000-01-02", "2000-01-03", "2/32/82", "spam", "2000-01-02"] * 5
+        records = [{"date": v} for v in values]
+        types = [{"id": "date", "type": "date"}]
+
+        for kwargs in [{}, {"dayfirst": True}]:
+            expected = [r["date"] for r in pr.type_cast(records, types, **kwargs)]
+            batch = {"date": values}
+            result = next(pr.type_cast([batch], types, columnar=True, **kwargs))
+            assert expected == result["date"]
+
+        assert date(2000, 2, 1) == expected[0]
+
     def test_detect_types(self):
         record = {
             "null": "None",
@@ -77,6 +108,25 @@ class Test:
         assert Decimal("0.87") == result["confidence"]
         assert not result["accurate"]
 
+    def test_detect_types_workers(self):
+        records = [{"a": str(i % 7), "b": "x" if i % 5 else "1.5"} for i in range(300)]
+        expected = pr.detect_types(records, 0.99, max_iter=200)
+        result = pr.detect_types(records, 0.99, max_iter=200, workers=2, chunksize=7)
+        assert expected[1] == result[1]
+        assert records == list(result[0])
+
+        with pytest.raises(TypeError):
+            pr.detect_types(records, worker=2)
+
+        types = expected[1]["types"]
+        expected = list(pr.type_cast(records, types))
+        result = pr.type_cast(records, types, workers=2, chunksize=7)
+        assert expected == list(result)
+
+        result = pr.type_cast(records, (t for t in types), workers=2, chunksize=7)
+        assert expected == list(result)
+        assert expected == list(pr.type_cast(records, (t for t in types)))
+
     def test_detect_types_datetimes_midnight(self):
         records = it.repeat({"foo": "2000-01-01 00:00:00"})
         records, result = pr.detect_types(records)
@@ -203,6 +253,147 @@ class Test:
         result = next(it.islice(pr.unique(records, pred=pred), 3, 4))["name"]
         assert "rob" == result
 
+        records = [{"a": i % 50, "b": "x"} for i in range(1000)]
+        assert 50 == len(list(pr.unique(records, ["a"], mode="exact")))
+        assert 50 == len(list(pr.unique(records, mode="exact", digest="md5")))
+        assert 1000 == len(list(pr.unique(records, ["a"], bufsize=49)))
+
+        kwargs = {"mode": "bloom", "capacity": 50, "error_rate": 0.0001}
+        assert 50 == len(list(pr.unique(records, ["a"], **kwargs)))
+
+        # a missing field differs from an explicit null
+        records = [{"a": None}, {}, {"a": None}, {"b": 1}]
+        assert records[:2] == list(pr.unique(records, ["a"]))
+        assert records[:2] == list(pr.unique(records, ["a"], digest=True))
+
+        with pytest.raises(ValueError):
+            next(pr.unique(records, mode="spam"))
+
+    def test_group(self):
+        records = [
+            {"item": "a", "amount": 200},
+            {"item": "b", "amount": None},
+            {"item": "a", "amount": 100},
+            {"item": "c", "amount": 400},
+            {"item": "b", "amount": 300},
+        ]
+
+        keyfunc = itemgetter("item")
+        grouped = pr.group(records, "item", reducer="sum", field="amount")
+        assert [("a", 300), ("b", 300), ("c", 400)] == list(grouped)
+
+        grouped = pr.group(records, keyfunc, False, reducer="count")
+        assert [2, 2, 1] == list(grouped)
+
+        kwargs = {"reducer": "mean", "field": "amount"}
+        assert {"a": 150.0, "b": 300.0, "c": 400.0} == dict(
+            pr.group(records, "item", **kwargs)
+        )
+
+        grouped = pr.group(records, "item", reducer=max, field="amount")
+        assert [200, 300, 400] == [v for k, v in sorted(grouped)]
+
+        records.append({"item": "d", "amount": None})
+        grouped = dict(pr.group(records, "item", reducer="count", field="amount"))
+        assert {"a": 2, "b": 1, "c": 1, "d": 0} == grouped
+        assert dict(pr.group(records, "item", **kwargs))["d"] is None
+
+        # a running value of None isn't mistaken for an empty group
+        reducer = lambda x, y: None if x == 1 else [x, y]
+        values = [{"item": "a", "amount": n} for n in [1, 2, 3]]
+        grouped = pr.group(values, "item", reducer=reducer, field="amount")
+        assert [("a", [None, 3])] == list(grouped)
+
+        presorted = sorted(records, key=keyfunc)
+        expected = list(pr.group(records, "item"))
+        assert expected == list(pr.group(presorted, "item", presorted=True))
+
+    def test_sort(self):
+        records = [{"a": i % 7, "b": i} for i in range(100)]
+        expected = sorted(records, key=itemgetter("a"))
+        assert expected == list(pr.sort(iter(records), "a", max_memory=2000))
+
+        expected = sorted(records, key=itemgetter("a"), reverse=True)
+        result = pr.sort(records, "a", max_memory=2000, reverse=True)
+        assert expected == list(result)
+
+        expected = list(pr.group(records, "a"))
+        assert expected == list(pr.group(records, "a", max_memory=2000))
+
+        split = pr.split(iter(records), "a", max_memory=2000)
+        assert [15, 15, 14, 14, 14, 14, 14] == [len(s) for s, _ in split]
+
+    def test_sort_fan_in(self, monkeypatch):
+        spilled = []
+
+        def temporary_file():
+            spilled.append(TemporaryFile())
+            opened.append(sum(not f.closed for f in spilled))
+            return spilled[-1]
+
+        monkeypatch.setattr(pr, "TemporaryFile", temporary_file)
+        records = [{"a": i % 7, "b": i} for i in range(200)]
+        expected = sorted(records, key=itemgetter("a"))
+
+        for fan_in in [2, 5]:
+            spilled, opened = [], []
+            result = pr.sort(records, "a", max_memory=1, fan_in=fan_in)
+            assert expected == list(result)
+            assert max(opened) < 20
+            assert all(f.closed for f in spilled)
+
+    def test_join(self):
+        left = [
+            {"id": 1, "name": "bill", "amount": 10},
+            {"id": 2, "name": "bob", "amount": 20},
+            {"id": 3, "name": "jane", "amount": 30},
+        ]
+
+        right = [
+            {"user_id": 2, "amount": 5},
+            {"user_id": 3, "amount": 6},
+            {"user_id": 3, "amount": 7},
+            {"user_id": 4, "amount": 8},
+        ]
+
+        kwargs = {"left_on": "id", "right_on": "user_id"}
+        result = list(pr.join(left, right, **kwargs))
+        assert [5, 6, 7] == [r["amount"] for r in result]
+        assert ["bob", "jane", "jane"] == [r["name"] for r in result]
+
+        result = list(pr.join(iter(left), iter(right), pred="amount", op=sum, **kwargs))
+        assert [25, 36, 37] == [r["amount"] for r in result]
+
+        result = list(pr.join(left, right, how="outer", **kwargs))
+        assert 5 == len(result)
+        assert {"id": 1, "name": "bill", "amount": 10} in result
+        assert {"user_id": 4, "amount": 8} in result
+
+        assert 12 == len(list(pr.join(left, right)))
+
+        # the output is in left order whichever side the table is built on
+        result = list(pr.join(left, right, how="outer", **kwargs))
+        assert [10, 5, 6, 7, 8] == [r["amount"] for r in result]
+        assert result == list(pr.join(iter(left), iter(right), how="outer", **kwargs))
+
+        result = list(pr.join(left, right[:2], how="outer", **kwargs))
+        assert [10, 5, 6] == [r["amount"] for r in result]
+
+        # null keys never match, but are kept by outer joins
+        nulls = [{"id": None, "name": "ann"}, {"name": "al"}]
+        result = list(pr.join(left + nulls, right + [{"user_id": None}], **kwargs))
+        assert [5, 6, 7] == [r["amount"] for r in result]
+
+        result = pr.join(nulls, [{"user_id": None}], how="outer", **kwargs)
+        assert nulls + [{"user_id": None}] == list(result)
+
+        on = ["id", "name"]
+        result = pr.join(nulls, [{"id": None, "name": "ann"}], on=on)
+        assert [] == list(result)
+
+        with pytest.raises(ValueError):
+            pr.join(left, right, how="cross", **kwargs)
+
     def test_cut(self):
         records = [
             {"field_1": 1, "field_2": "bill", "field_3": "male"},